@@ -2,21 +2,122 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import math
 import random
+import threading
 import time
+from collections import OrderedDict
 from collections.abc import Callable
 from pathlib import Path
-from typing import TypeVar
+from typing import Any, TypeVar
 
 from gspread import service_account_from_dict
 from gspread.exceptions import APIError, WorksheetNotFound
+from gspread.urls import (
+    SPREADSHEET_BATCH_UPDATE_URL,
+    SPREADSHEET_VALUES_BATCH_UPDATE_URL,
+)
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from eftoolkit.gsheets.core.worksheet import Worksheet
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
 T = TypeVar('T')
 
 
+def _json_default(obj: Any) -> Any:
+    """Convert a value neither JSON encoder handles natively.
+
+    Dates and times (including pandas Timestamps) become ISO strings, and
+    numpy scalars become the matching Python value.
+    """
+    if hasattr(obj, 'isoformat'):
+        return obj.isoformat()
+    if getattr(getattr(obj, 'dtype', None), 'kind', None) == 'M':
+        return obj.astype('datetime64[us]').item().isoformat()
+    if hasattr(obj, 'item'):
+        return obj.item()
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+def _json_compatible(obj: Any) -> Any:
+    """Rewrite a request body into what orjson would serialize.
+
+    Used when orjson is not installed so both paths send the same JSON:
+    non-finite floats become null and other values go through _json_default.
+    """
+    if isinstance(obj, dict):
+        return {key: _json_compatible(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_json_compatible(value) for value in obj]
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if obj is None or isinstance(obj, (str, int)):
+        return obj
+    value = _json_default(obj)
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+# Number of authorized gspread clients kept for reuse, least recently used
+# evicted first
+MAX_CACHED_CLIENTS = 4
+
+# Authorized gspread clients shared by Spreadsheet instances, keyed on a digest
+# of the credentials plus the retry settings, so private keys are not held as
+# cache keys. Reusing a client skips the service account token exchange and
+# keeps its pooled HTTPS connections warm across Spreadsheet sessions (e.g.
+# the phases of a DashboardRunner run).
+_client_cache: OrderedDict[tuple[str, int, float], Any] = OrderedDict()
+_client_cache_lock = threading.Lock()
+
+
+def _authorized_client(credentials: dict, max_retries: int, base_delay: float) -> Any:
+    """Return a cached gspread client for these credentials, creating it once."""
+    digest = hashlib.sha256(
+        json.dumps(credentials, sort_keys=True).encode()
+    ).hexdigest()
+    key = (digest, max_retries, base_delay)
+    with _client_cache_lock:
+        gc = _client_cache.get(key)
+        if gc is not None:
+            _client_cache.move_to_end(key)
+        else:
+            gc = service_account_from_dict(credentials)
+            # Retry connection failures at the transport layer, and keep a
+            # larger keep-alive pool for parallel worksheet operations. HTTP
+            # status retries stay in _execute_with_retry, because the adapter
+            # will not safely retry non-idempotent POSTs
+            adapter = HTTPAdapter(
+                max_retries=Retry(total=max_retries, read=0, backoff_factor=base_delay),
+                pool_connections=10,
+                pool_maxsize=20,
+            )
+            gc.http_client.session.mount('https://', adapter)
+            _client_cache[key] = gc
+            if len(_client_cache) > MAX_CACHED_CLIENTS:
+                _client_cache.popitem(last=False)
+        return gc
+
+
+def _retry_after_seconds(response: Any) -> float | None:
+    """Return the Retry-After delay in seconds from an error response, if any."""
+    headers = getattr(response, 'headers', None) or {}
+    try:
+        return float(headers.get('Retry-After'))
+    except (TypeError, ValueError):
+        return None
+
+
 class Spreadsheet:
     """Google Spreadsheet client for managing worksheets.
 
@@ -35,6 +136,19 @@ class Spreadsheet:
         # In local_preview mode, browser tabs open automatically
     """
 
+    __slots__ = (
+        '_local_preview',
+        '_preview_dir',
+        '_spreadsheet_name',
+        '_max_retries',
+        '_base_delay',
+        '_delay_schedule',
+        '_rng',
+        '_gspread_spreadsheet',
+        '_worksheets',
+        '_ws_cache',
+    )
+
     def __init__(
         self,
         credentials: dict | None = None,
@@ -60,19 +174,39 @@ class Spreadsheet:
         self._spreadsheet_name = spreadsheet_name
         self._max_retries = max_retries
         self._base_delay = base_delay
+        # Backoff delay before retry N is base_delay * 2**N, plus jitter drawn
+        # from a per-instance RNG (avoids contending on the global random lock)
+        self._delay_schedule = tuple(
+            base_delay * (1 << attempt) for attempt in range(max_retries)
+        )
+        self._rng = random.Random()
         self._gspread_spreadsheet = None
         self._worksheets: dict[str, Worksheet] = {}  # Track all accessed worksheets
+        self._ws_cache: dict[str, Any] | None = None  # title -> gspread worksheet
 
         if not local_preview:
             if not credentials:
                 raise ValueError('credentials required unless local_preview=True')
 
-            gc = service_account_from_dict(credentials)
+            gc = _authorized_client(credentials, max_retries, base_delay)
             self._gspread_spreadsheet = gc.open(spreadsheet_name)
 
+    @staticmethod
+    def clear_client_cache() -> None:
+        """Drop all cached gspread clients.
+
+        The next Spreadsheet re-authorizes its service account. Useful after
+        rotating credentials, or to release the cached clients.
+        """
+        with _client_cache_lock:
+            _client_cache.clear()
+
     def _execute_with_retry(self, func: Callable[[], T], description: str = '') -> T:
         """Execute function with exponential backoff retry on transient errors.
 
+        If the error response carries a Retry-After header, the wait is at
+        least that long.
+
         Args:
             func: Callable to execute.
             description: Description for logging.
@@ -94,7 +228,10 @@ class Spreadsheet:
                     raise
                 if attempt == self._max_retries:
                     raise
-                delay = self._base_delay * (2**attempt) + random.uniform(0, 1)
+                delay = self._delay_schedule[attempt] + self._rng.random()
+                retry_after = _retry_after_seconds(e.response)
+                if retry_after is not None:
+                    delay = max(delay, retry_after)
                 logging.warning(
                     f'API error {status_code} on {description} '
                     f'(attempt {attempt + 1}/{self._max_retries}). '
@@ -105,6 +242,38 @@ class Spreadsheet:
         # This should never be reached, but satisfies type checker
         raise RuntimeError('Unexpected state in retry loop')  # pragma: no cover
 
+    def _batch_update(self, body: dict) -> Any:
+        """Send a spreadsheets.batchUpdate request body."""
+        return self._post_body(SPREADSHEET_BATCH_UPDATE_URL, body, 'batch_update')
+
+    def _values_batch_update(self, body: dict) -> Any:
+        """Send a spreadsheets.values.batchUpdate request body."""
+        return self._post_body(
+            SPREADSHEET_VALUES_BATCH_UPDATE_URL, body, 'values_batch_update'
+        )
+
+    def _post_body(self, url_template: str, body: dict, gspread_method: str) -> Any:
+        """POST a batch request body, serialized with orjson when installed.
+
+        Without orjson, the body is normalized by _json_compatible and handed
+        to the named gspread Spreadsheet method, which serializes it with the
+        stdlib json module. Either way the same JSON is sent.
+        """
+        if orjson is None:
+            return getattr(self._gspread_spreadsheet, gspread_method)(
+                _json_compatible(body)
+            )
+
+        response = self._gspread_spreadsheet.client.request(
+            'post',
+            url_template % self._gspread_spreadsheet.id,
+            data=orjson.dumps(
+                body, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY
+            ),
+            headers={'Content-Type': 'application/json'},
+        )
+        return response.json()
+
     def __enter__(self) -> Spreadsheet:
         """Context manager entry."""
         return self
@@ -169,7 +338,9 @@ class Spreadsheet:
                 worksheet_name=name,
             )
         else:
-            gspread_ws = self._gspread_spreadsheet.worksheet(name)
+            gspread_ws = self._ws_map().get(name)
+            if gspread_ws is None:
+                raise WorksheetNotFound(name)
             ws = Worksheet(gspread_ws, self)
 
         self._worksheets[name] = ws
@@ -184,7 +355,19 @@ class Spreadsheet:
         if self._local_preview:
             return []
 
-        return [ws.title for ws in self._gspread_spreadsheet.worksheets()]
+        return list(self._ws_map())
+
+    def _ws_map(self) -> dict[str, Any]:
+        """Map worksheet titles to gspread worksheets, fetched once.
+
+        The spreadsheet's tabs are listed with a single metadata request and
+        cached until a worksheet is created, deleted, or reordered.
+        """
+        if self._ws_cache is None:
+            self._ws_cache = {
+                ws.title: ws for ws in self._gspread_spreadsheet.worksheets()
+            }
+        return self._ws_cache
 
     def create_worksheet(
         self, name: str, rows: int = 1000, cols: int = 26, *, replace: bool = False
@@ -219,6 +402,7 @@ class Spreadsheet:
         gspread_ws = self._gspread_spreadsheet.add_worksheet(
             title=name, rows=rows, cols=cols
         )
+        self._ws_cache = None
         ws = Worksheet(gspread_ws, self)
         self._worksheets[name] = ws
         return ws
@@ -233,12 +417,14 @@ class Spreadsheet:
         if self._local_preview:
             return
 
-        try:
-            ws = self._gspread_spreadsheet.worksheet(name)
-            self._gspread_spreadsheet.del_worksheet(ws)
-        except WorksheetNotFound:
+        ws = self._ws_map().get(name)
+        if ws is None:
             if not ignore_missing:
-                raise
+                raise WorksheetNotFound(name)
+            return
+
+        self._gspread_spreadsheet.del_worksheet(ws)
+        self._ws_cache = None
 
     def reorder_worksheets(self, order: list[str]) -> None:
         """Reorder worksheets (tabs) to the specified order.
@@ -276,3 +462,4 @@ class Spreadsheet:
             lambda: self._gspread_spreadsheet.reorder_worksheets(ordered),
             'reorder_worksheets',
         )
+        self._ws_cache = None
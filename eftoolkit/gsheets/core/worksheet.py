@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-import webbrowser
+import html
+import json
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-import pandas as pd
-
 from eftoolkit.gsheets.utils import (
     BATCH_HANDLERS,
     batch_handler,
@@ -16,9 +15,248 @@ from eftoolkit.gsheets.utils import (
 )
 
 if TYPE_CHECKING:
+    import pandas as pd
+
     from eftoolkit.gsheets.core.spreadsheet import Spreadsheet
 
 
+def _value_update_origin(update: dict) -> tuple[str, int, int] | None:
+    """Return (sheet_prefix, start_row, start_col) for a queued value update.
+
+    Returns None if the update cannot safely be merged with a neighbour: a
+    column-only start cell, no values, or any formula cell (formulas may
+    reference absolute positions, so they are left exactly as queued).
+    """
+    values = update['values']
+    if not values or any(
+        isinstance(v, str) and v.startswith('=') for row in values for v in row
+    ):
+        return None
+    sheet, _, cells = update['range'].rpartition('!')
+    start_row, start_col = parse_cell_reference(cells)
+    if start_row is None:
+        return None
+    return sheet, start_row, start_col
+
+
+def _coalesce_value_updates(updates: list[dict]) -> list[dict]:
+    """Merge consecutive value updates that form one contiguous block.
+
+    An update starting directly below the previous one (same sheet and start
+    column) is appended as extra rows; one starting directly to its right
+    (same sheet, start row, and row count, with no ragged rows) is appended
+    as extra columns. Merged entries use a start-cell range. Only
+    neighbours in queue order are merged, so overlapping writes keep their
+    last-write-wins order. Queued dicts and value lists are not mutated.
+    """
+    merged: list[dict] = []
+    prev_origin = None
+    for update in updates:
+        origin = _value_update_origin(update)
+        if merged and prev_origin is not None and origin is not None:
+            sheet, row, col = prev_origin
+            prev_values, values = merged[-1]['values'], update['values']
+            prev_widths = {len(r) for r in prev_values}
+
+            if origin == (sheet, row + len(prev_values), col):
+                combined = prev_values + values
+            elif (
+                len(prev_widths) == 1
+                and len(values) == len(prev_values)
+                and origin == (sheet, row, col + prev_widths.pop())
+            ):
+                combined = [a + b for a, b in zip(prev_values, values, strict=True)]
+            else:
+                combined = None
+
+            if combined is not None:
+                prefix = f'{sheet}!' if sheet else ''
+                merged[-1] = {
+                    'range': f'{prefix}{column_index_to_letter(col)}{row + 1}',
+                    'values': combined,
+                }
+                continue
+
+        merged.append(update)
+        prev_origin = origin
+    return merged
+
+
+# Batch request types that shift or reorder cells (or are opaque), so queued
+# requests on either side of them must never be deduplicated across them
+_DEDUP_BARRIER_TYPES = frozenset(
+    {'insert_rows', 'delete_rows', 'insert_columns', 'delete_columns', 'sort', 'raw'}
+)
+
+# Batch request types where a later request fully supersedes an earlier one
+# with the same values for these fields, regardless of its other fields
+_SUPERSEDING_KEY_FIELDS = {
+    'freeze_rows': (),
+    'freeze_columns': (),
+    'column_width': ('column',),
+}
+
+# Batch request types where re-applying an identical request is a no-op
+_IDEMPOTENT_TYPES = frozenset(
+    {
+        'format',
+        'border',
+        'merge',
+        'unmerge',
+        'data_validation',
+        'clear_data_validation',
+        'notes',
+    }
+)
+
+
+def _batch_request_dedup_key(req: dict) -> tuple | None:
+    """Return the key under which a queued batch request may be deduplicated."""
+    req_type = req['type']
+    if req_type in _SUPERSEDING_KEY_FIELDS:
+        return (req_type, *(req[f] for f in _SUPERSEDING_KEY_FIELDS[req_type]))
+    if req_type in _IDEMPOTENT_TYPES:
+        return (req_type, json.dumps(req, sort_keys=True, default=repr))
+    return None
+
+
+def _deduplicate_batch_requests(requests: list[dict]) -> list[dict]:
+    """Drop queued batch requests that a later request makes redundant.
+
+    Exact repeats of idempotent requests, and earlier freeze or column-width
+    requests superseded by a later one for the same target, are removed; the
+    surviving request keeps its later position so last-write-wins order is
+    preserved. Structural requests (row/column inserts and deletes, sorts,
+    raw requests) act as barriers that nothing is deduplicated across.
+    """
+    kept: list[dict] = []
+    seen: set[tuple] = set()
+    for req in reversed(requests):
+        if req['type'] in _DEDUP_BARRIER_TYPES:
+            seen.clear()
+        else:
+            key = _batch_request_dedup_key(req)
+            if key is not None:
+                if key in seen:
+                    continue
+                seen.add(key)
+        kept.append(req)
+    kept.reverse()
+    return kept
+
+
+# Maximum number of cells sent in a single values_batch_update call
+CHUNK_CELL_LIMIT = 1_000_000
+
+
+def _split_value_update(update: dict, limit: int) -> list[dict]:
+    """Split one value update into row ranges of at most ``limit`` cells.
+
+    Each piece gets a start-cell range for its first row. Updates that fit,
+    or whose start cell has no row number (e.g. 'A:A'), are returned as-is.
+    """
+    values = update['values']
+    width = max((len(row) for row in values), default=0)
+    if width * len(values) <= limit:
+        return [update]
+    sheet, sep, cells = update['range'].rpartition('!')
+    start_row, start_col = parse_cell_reference(cells.split(':', 1)[0])
+    if start_row is None:
+        return [update]
+
+    column = column_index_to_letter(start_col)
+    rows_per_piece = max(limit // width, 1)
+    return [
+        {
+            'range': f'{sheet}{sep}{column}{start_row + offset + 1}',
+            'values': values[offset : offset + rows_per_piece],
+        }
+        for offset in range(0, len(values), rows_per_piece)
+    ]
+
+
+def _chunk_value_updates(updates: list[dict], limit: int) -> list[list[dict]]:
+    """Group value updates into request payloads of at most ``limit`` cells.
+
+    Updates keep their queue order, so overlapping writes still resolve
+    last-write-wins across chunks. A single update larger than ``limit`` is
+    split into row ranges first. ``updates`` must not be empty.
+    """
+    chunks: list[list[dict]] = []
+    current: list[dict] = []
+    current_cells = 0
+    for update in updates:
+        for piece in _split_value_update(update, limit):
+            cells = sum(len(row) for row in piece['values'])
+            if current and current_cells + cells > limit:
+                chunks.append(current)
+                current, current_cells = [], 0
+            current.append(piece)
+            current_cells += cells
+    chunks.append(current)
+    return chunks
+
+
+# Static preview HTML emitted before and after the grid table
+_PREVIEW_HEAD = '\n'.join(
+    [
+        '<!DOCTYPE html><html><head>',
+        '<meta charset="utf-8">',
+        '<title>{title}</title>',
+        '<style>',
+        'body {{ font-family: Arial, sans-serif; margin: 0; padding: 20px; '
+        'background-color: #f8f9fa; }}',
+        'h1 {{ color: #202124; font-size: 18px; font-weight: 400; '
+        'margin-bottom: 16px; }}',
+        '.sheet-container {{ background: white; border-radius: 8px; '
+        'box-shadow: 0 1px 3px rgba(0,0,0,0.12); overflow: auto; }}',
+        'table {{ border-collapse: collapse; border-spacing: 0; }}',
+        'td, th {{ border: 1px solid #e0e0e0; padding: 4px 8px; '
+        'font-size: 13px; vertical-align: middle; '
+        'white-space: nowrap; overflow: hidden; text-overflow: ellipsis; }}',
+        'th {{ background-color: #f8f9fa; color: #5f6368; '
+        'font-weight: 500; text-align: center; position: sticky; top: 0; }}',
+        '.row-header {{ background-color: #f8f9fa; color: #5f6368; '
+        'font-weight: 500; text-align: center; min-width: 46px; '
+        'position: sticky; left: 0; }}',
+        '.corner {{ background-color: #f8f9fa; position: sticky; '
+        'top: 0; left: 0; z-index: 2; }}',
+        'td {{ background-color: white; text-align: left; min-width: 80px; }}',
+        '.has-note {{ background-color: #fff8e1; cursor: help; }}',
+        '.has-note::after {{ content: ""; position: absolute; '
+        'top: 0; right: 0; border-width: 0 6px 6px 0; '
+        'border-style: solid; border-color: #ffc107 #ffc107 '
+        'transparent transparent; }}',
+        'td {{ position: relative; }}',
+        '</style>',
+        '</head><body>',
+        '<h1>📊 {title}</h1>',
+        '<div class="sheet-container">',
+        '<table>',
+        '',
+    ]
+)
+_PREVIEW_TAIL = '</table>\n</div>\n</body></html>'
+
+
+def _series_to_values(series: pd.Series) -> list[Any]:
+    """Convert a Series to a JSON-ready list of Python scalars.
+
+    Datetime values are formatted as 'YYYY-MM-DD HH:MM:SS' strings and
+    missing values (NaN, NaT, None, pd.NA) become None.
+    """
+    import pandas as pd
+
+    missing = series.isna().to_numpy()
+    if pd.api.types.is_datetime64_any_dtype(series):
+        series = series.dt.strftime('%Y-%m-%d %H:%M:%S')
+    values = series.tolist()
+    if missing.any():
+        for i in missing.nonzero()[0]:
+            values[i] = None
+    return values
+
+
 class Worksheet:
     """A single worksheet (tab) within a Google Spreadsheet.
 
@@ -26,6 +264,21 @@ class Worksheet:
     Operations are queued and flushed via flush() or context manager exit.
     """
 
+    __slots__ = (
+        '_ws',
+        '_spreadsheet',
+        '_local_preview',
+        '_worksheet_name',
+        '_preview_output',
+        '_value_updates',
+        '_batch_requests',
+        '_preview_history',
+        '_preview_column_widths',
+        '_preview_notes',
+        '_cached_sheet_id',
+        '_range_cache',
+    )
+
     def __init__(
         self,
         gspread_worksheet: Any,
@@ -54,6 +307,8 @@ class Worksheet:
         self._preview_history: list[dict] = []  # Accumulates all writes for preview
         self._preview_column_widths: dict[int, int] = {}  # col_index -> width in pixels
         self._preview_notes: dict[tuple[int, int], str] = {}  # (row, col) -> note text
+        self._cached_sheet_id: int | None = None
+        self._range_cache: dict[str, dict] = {}  # A1 range -> GridRange dict
 
     def __enter__(self) -> Worksheet:
         """Context manager entry."""
@@ -77,14 +332,40 @@ class Worksheet:
         return self._local_preview
 
     def read(self) -> pd.DataFrame:
-        """Read worksheet to DataFrame (first row = headers)."""
+        """Read worksheet to DataFrame (first row = headers).
+
+        Cells are read unformatted and column-major, so numbers and booleans
+        arrive typed and each column becomes a DataFrame column directly.
+        Dates are returned as their formatted strings. Columns shorter than
+        the sheet's used range are padded with empty strings.
+        """
         if self._local_preview:
             raise NotImplementedError('read not available in local preview mode')
 
-        all_values = self._ws.get_all_values()
-        if not all_values:
+        import pandas as pd
+        from gspread.utils import absolute_range_name
+
+        response = self._ws.spreadsheet.values_get(
+            absolute_range_name(self.title),
+            params={
+                'valueRenderOption': 'UNFORMATTED_VALUE',
+                'dateTimeRenderOption': 'FORMATTED_STRING',
+                'majorDimension': 'COLUMNS',
+            },
+        )
+        columns = response.get('values', [])
+        if not columns:
             return pd.DataFrame()
-        return pd.DataFrame(data=all_values[1:], columns=all_values[0])
+
+        num_rows = max(len(col) for col in columns) - 1
+        headers = [str(col[0]) if col else '' for col in columns]
+        data = {
+            i: col[1:] + [''] * (num_rows - max(len(col) - 1, 0))
+            for i, col in enumerate(columns)
+        }
+        df = pd.DataFrame(data)
+        df.columns = headers
+        return df
 
     def read_cell(self, cell: str) -> Any:
         """Read value of a single cell.
@@ -122,6 +403,27 @@ class Worksheet:
 
         return self._ws.get(range_name)
 
+    def read_ranges(self, ranges: list[str]) -> list[list[list[Any]]]:
+        """Read values from several cell ranges in one API call.
+
+        Prefer this over looping read_cell/read_range, which costs one
+        request per call.
+
+        Args:
+            ranges: A1 notation ranges (e.g., ['V5:V100', 'A1']).
+
+        Returns:
+            One 2D list of values per range, in the same order as ranges.
+            Trailing empty rows and cells are omitted by the API.
+
+        Example:
+            cells, header = ws.read_ranges(['V5:V100', 'A1:C1'])
+        """
+        if self._local_preview:
+            raise NotImplementedError('read_ranges not available in local preview mode')
+
+        return [list(values) for values in self._ws.batch_get(ranges)]
+
     def write_dataframe(
         self,
         df: pd.DataFrame,
@@ -137,10 +439,15 @@ class Worksheet:
             location: Cell location to start writing (e.g., 'A1').
             include_header: If True, include column names as first row.
             format_dict: Optional dict mapping range names to format dicts.
+
+        Missing values are written as empty cells and datetime columns are
+        written as 'YYYY-MM-DD HH:MM:SS' strings.
         """
-        values = df.values.tolist()
+        # Convert column-by-column to avoid upcasting the whole frame to object
+        columns = [_series_to_values(series) for _, series in df.items()]
+        values = [list(row) for row in zip(*columns, strict=True)]
         if include_header:
-            values = [df.columns.tolist()] + values
+            values.insert(0, df.columns.tolist())
 
         self._value_updates.append(
             {
@@ -232,6 +539,21 @@ class Worksheet:
             }
         )
 
+    def set_column_widths(self, widths: dict[str | int, int]) -> None:
+        """Queue width updates for several columns.
+
+        All widths go out with the rest of the queued requests in the single
+        batchUpdate sent by flush().
+
+        Args:
+            widths: Mapping of column letter or 1-based index to width in pixels.
+
+        Example:
+            ws.set_column_widths({'A': 100, 'B': 90, 'C': 90})
+        """
+        for column, width in widths.items():
+            self.set_column_width(column, width)
+
     def auto_resize_columns(
         self,
         start_col: int,
@@ -566,62 +888,83 @@ class Worksheet:
         if not self._ws:
             return
 
-        # Flush value updates via parent spreadsheet's batch update
+        # Flush value updates via parent spreadsheet's batch update, merging
+        # adjacent writes into single entries first and splitting the result
+        # into payloads of at most CHUNK_CELL_LIMIT cells
         if self._value_updates:
-            self._spreadsheet._execute_with_retry(
-                lambda: self._spreadsheet._gspread_spreadsheet.values_batch_update(
-                    {
-                        'valueInputOption': 'USER_ENTERED',
-                        'data': self._value_updates,
-                    }
-                ),
-                'values_batch_update',
-            )
+            merged = _coalesce_value_updates(self._value_updates)
+            for data in _chunk_value_updates(merged, CHUNK_CELL_LIMIT):
+                self._spreadsheet._execute_with_retry(
+                    lambda data=data: self._spreadsheet._values_batch_update(
+                        {
+                            'valueInputOption': 'USER_ENTERED',
+                            'data': data,
+                        }
+                    ),
+                    'values_batch_update',
+                )
 
-        # Flush batch requests using handler registry
-        for req in self._batch_requests:
+        # Translate batch requests using handler registry, dropping redundant
+        # repeats, then send them together in a single batchUpdate call
+        requests: list[dict] = []
+        for req in _deduplicate_batch_requests(self._batch_requests):
             req_type = req['type']
             method_name = BATCH_HANDLERS.get(req_type)
             if method_name is None:
                 raise ValueError(f"Unknown batch request type: '{req_type}'")
             handler = getattr(self, method_name)
-            handler(req)
+            requests.extend(handler(req))
+
+        if requests:
+            self._spreadsheet._execute_with_retry(
+                lambda: self._spreadsheet._batch_update({'requests': requests}),
+                'batch_update',
+            )
+
+    @property
+    def _sheet_id(self) -> int:
+        """Sheet ID of the underlying gspread worksheet, looked up once."""
+        if self._cached_sheet_id is None:
+            self._cached_sheet_id = self._ws.id
+        return self._cached_sheet_id
 
     @batch_handler('format')
-    def _handle_format(self, req: dict) -> None:
-        """Handle format request.
+    def _handle_format(self, req: dict) -> list[dict]:
+        """Build format request.
 
         API: https://developers.google.com/sheets/api/reference/rest/v4/spreadsheets/request#repeatcellrequest
         """
-        self._spreadsheet._execute_with_retry(
-            lambda: self._ws.format(req['range'], req['format']),
-            'format',
-        )
+        cell_format = req['format']
+        return [
+            {
+                'repeatCell': {
+                    'range': self._parse_range_to_grid_range(req['range']),
+                    'cell': {'userEnteredFormat': cell_format},
+                    'fields': f'userEnteredFormat({",".join(cell_format.keys())})',
+                }
+            }
+        ]
 
     @batch_handler('border')
-    def _handle_border(self, req: dict) -> None:
-        """Handle border request via raw batch update.
+    def _handle_border(self, req: dict) -> list[dict]:
+        """Build border request.
 
         API: https://developers.google.com/sheets/api/reference/rest/v4/spreadsheets/request#updatebordersrequest
         """
         range_obj = self._parse_range_to_grid_range(req['range'])
         borders = req['borders']
-        border_request = {
-            'updateBorders': {
-                'range': range_obj,
-                **borders,
+        return [
+            {
+                'updateBorders': {
+                    'range': range_obj,
+                    **borders,
+                }
             }
-        }
-        self._spreadsheet._execute_with_retry(
-            lambda: self._spreadsheet._gspread_spreadsheet.batch_update(
-                {'requests': [border_request]}
-            ),
-            'border',
-        )
+        ]
 
     @batch_handler('column_width')
-    def _handle_column_width(self, req: dict) -> None:
-        """Handle column width request.
+    def _handle_column_width(self, req: dict) -> list[dict]:
+        """Build column width request.
 
         API: https://developers.google.com/sheets/api/reference/rest/v4/spreadsheets/request#updatedimensionpropertiesrequest
         """
@@ -636,106 +979,95 @@ class Worksheet:
         else:
             col_idx = column - 1  # Convert 1-based to 0-based
 
-        request = {
-            'updateDimensionProperties': {
-                'range': {
-                    'sheetId': self._ws.id,
-                    'dimension': 'COLUMNS',
-                    'startIndex': col_idx,
-                    'endIndex': col_idx + 1,
-                },
-                'properties': {
-                    'pixelSize': width,
-                },
-                'fields': 'pixelSize',
+        return [
+            {
+                'updateDimensionProperties': {
+                    'range': {
+                        'sheetId': self._sheet_id,
+                        'dimension': 'COLUMNS',
+                        'startIndex': col_idx,
+                        'endIndex': col_idx + 1,
+                    },
+                    'properties': {
+                        'pixelSize': width,
+                    },
+                    'fields': 'pixelSize',
+                }
             }
-        }
-        self._spreadsheet._execute_with_retry(
-            lambda: self._spreadsheet._gspread_spreadsheet.batch_update(
-                {'requests': [request]}
-            ),
-            'column_width',
-        )
+        ]
 
     @batch_handler('auto_resize')
-    def _handle_auto_resize(self, req: dict) -> None:
-        """Handle auto resize columns request.
+    def _handle_auto_resize(self, req: dict) -> list[dict]:
+        """Build auto resize columns request.
 
         API: https://developers.google.com/sheets/api/reference/rest/v4/spreadsheets/request#autoresizedimensionsrequest
         """
         start_col = req['start_col'] - 1  # Convert to 0-based
         end_col = req['end_col']  # end is exclusive, so no -1
-        request = {
-            'autoResizeDimensions': {
-                'dimensions': {
-                    'sheetId': self._ws.id,
-                    'dimension': 'COLUMNS',
-                    'startIndex': start_col,
-                    'endIndex': end_col,
+        return [
+            {
+                'autoResizeDimensions': {
+                    'dimensions': {
+                        'sheetId': self._sheet_id,
+                        'dimension': 'COLUMNS',
+                        'startIndex': start_col,
+                        'endIndex': end_col,
+                    }
                 }
             }
-        }
-        self._spreadsheet._execute_with_retry(
-            lambda: self._spreadsheet._gspread_spreadsheet.batch_update(
-                {'requests': [request]}
-            ),
-            'auto_resize',
-        )
+        ]
 
     @batch_handler('notes')
-    def _handle_notes(self, req: dict) -> None:
-        """Handle notes request.
+    def _handle_notes(self, req: dict) -> list[dict]:
+        """Build notes requests (one per cell).
 
         API: https://developers.google.com/sheets/api/reference/rest/v4/spreadsheets/request#updatecellsrequest
         """
-        for cell_ref, note_text in req['notes'].items():
-            self._spreadsheet._execute_with_retry(
-                lambda c=cell_ref, n=note_text: self._ws.update_note(c, n),
-                'notes',
-            )
+        return [
+            {
+                'updateCells': {
+                    'range': self._parse_range_to_grid_range(cell_ref),
+                    'fields': 'note',
+                    'rows': [{'values': [{'note': note_text}]}],
+                }
+            }
+            for cell_ref, note_text in req['notes'].items()
+        ]
 
     @batch_handler('merge')
-    def _handle_merge(self, req: dict) -> None:
-        """Handle merge cells request.
+    def _handle_merge(self, req: dict) -> list[dict]:
+        """Build merge cells request.
 
         API: https://developers.google.com/sheets/api/reference/rest/v4/spreadsheets/request#mergecellsrequest
         """
         range_obj = self._parse_range_to_grid_range(req['range'])
-        request = {
-            'mergeCells': {
-                'range': range_obj,
-                'mergeType': req['merge_type'],
+        return [
+            {
+                'mergeCells': {
+                    'range': range_obj,
+                    'mergeType': req['merge_type'],
+                }
             }
-        }
-        self._spreadsheet._execute_with_retry(
-            lambda: self._spreadsheet._gspread_spreadsheet.batch_update(
-                {'requests': [request]}
-            ),
-            'merge',
-        )
+        ]
 
     @batch_handler('unmerge')
-    def _handle_unmerge(self, req: dict) -> None:
-        """Handle unmerge cells request.
+    def _handle_unmerge(self, req: dict) -> list[dict]:
+        """Build unmerge cells request.
 
         API: https://developers.google.com/sheets/api/reference/rest/v4/spreadsheets/request#unmergecellsrequest
         """
         range_obj = self._parse_range_to_grid_range(req['range'])
-        request = {
-            'unmergeCells': {
-                'range': range_obj,
+        return [
+            {
+                'unmergeCells': {
+                    'range': range_obj,
+                }
             }
-        }
-        self._spreadsheet._execute_with_retry(
-            lambda: self._spreadsheet._gspread_spreadsheet.batch_update(
-                {'requests': [request]}
-            ),
-            'unmerge',
-        )
+        ]
 
     @batch_handler('sort')
-    def _handle_sort(self, req: dict) -> None:
-        """Handle sort range request.
+    def _handle_sort(self, req: dict) -> list[dict]:
+        """Build sort range request.
 
         API: https://developers.google.com/sheets/api/reference/rest/v4/spreadsheets/request#sortrangerequest
         """
@@ -749,22 +1081,18 @@ class Worksheet:
             }
             for spec in req['sort_specs']
         ]
-        request = {
-            'sortRange': {
-                'range': range_obj,
-                'sortSpecs': sort_specs,
+        return [
+            {
+                'sortRange': {
+                    'range': range_obj,
+                    'sortSpecs': sort_specs,
+                }
             }
-        }
-        self._spreadsheet._execute_with_retry(
-            lambda: self._spreadsheet._gspread_spreadsheet.batch_update(
-                {'requests': [request]}
-            ),
-            'sort',
-        )
+        ]
 
     @batch_handler('data_validation')
-    def _handle_data_validation(self, req: dict) -> None:
-        """Handle data validation request.
+    def _handle_data_validation(self, req: dict) -> list[dict]:
+        """Build data validation request.
 
         API: https://developers.google.com/sheets/api/reference/rest/v4/spreadsheets/request#setdatavalidationrequest
         """
@@ -774,49 +1102,41 @@ class Worksheet:
         condition_type = rule.get('type', 'ONE_OF_LIST')
         condition_values = [{'userEnteredValue': v} for v in rule.get('values', [])]
 
-        request = {
-            'setDataValidation': {
-                'range': range_obj,
-                'rule': {
-                    'condition': {
-                        'type': condition_type,
-                        'values': condition_values,
+        return [
+            {
+                'setDataValidation': {
+                    'range': range_obj,
+                    'rule': {
+                        'condition': {
+                            'type': condition_type,
+                            'values': condition_values,
+                        },
+                        'showCustomUi': rule.get('showDropdown', True),
+                        'strict': rule.get('strict', True),
                     },
-                    'showCustomUi': rule.get('showDropdown', True),
-                    'strict': rule.get('strict', True),
-                },
+                }
             }
-        }
-        self._spreadsheet._execute_with_retry(
-            lambda: self._spreadsheet._gspread_spreadsheet.batch_update(
-                {'requests': [request]}
-            ),
-            'data_validation',
-        )
+        ]
 
     @batch_handler('clear_data_validation')
-    def _handle_clear_data_validation(self, req: dict) -> None:
-        """Handle clear data validation request.
+    def _handle_clear_data_validation(self, req: dict) -> list[dict]:
+        """Build clear data validation request.
 
         API: https://developers.google.com/sheets/api/reference/rest/v4/spreadsheets/request#setdatavalidationrequest
         """
         range_obj = self._parse_range_to_grid_range(req['range'])
-        request = {
-            'setDataValidation': {
-                'range': range_obj,
-                'rule': None,
+        return [
+            {
+                'setDataValidation': {
+                    'range': range_obj,
+                    'rule': None,
+                }
             }
-        }
-        self._spreadsheet._execute_with_retry(
-            lambda: self._spreadsheet._gspread_spreadsheet.batch_update(
-                {'requests': [request]}
-            ),
-            'clear_data_validation',
-        )
+        ]
 
     @batch_handler('conditional_format')
-    def _handle_conditional_format(self, req: dict) -> None:
-        """Handle conditional format request.
+    def _handle_conditional_format(self, req: dict) -> list[dict]:
+        """Build conditional format request.
 
         API: https://developers.google.com/sheets/api/reference/rest/v4/spreadsheets/request#addconditionalformatrulerequest
         """
@@ -826,192 +1146,159 @@ class Worksheet:
         condition_type = rule.get('type', 'CUSTOM_FORMULA')
         condition_values = [{'userEnteredValue': v} for v in rule.get('values', [])]
 
-        request = {
-            'addConditionalFormatRule': {
-                'rule': {
-                    'ranges': [range_obj],
-                    'booleanRule': {
-                        'condition': {
-                            'type': condition_type,
-                            'values': condition_values,
+        return [
+            {
+                'addConditionalFormatRule': {
+                    'rule': {
+                        'ranges': [range_obj],
+                        'booleanRule': {
+                            'condition': {
+                                'type': condition_type,
+                                'values': condition_values,
+                            },
+                            'format': rule.get('format', {}),
                         },
-                        'format': rule.get('format', {}),
                     },
-                },
-                'index': 0,
+                    'index': 0,
+                }
             }
-        }
-        self._spreadsheet._execute_with_retry(
-            lambda: self._spreadsheet._gspread_spreadsheet.batch_update(
-                {'requests': [request]}
-            ),
-            'conditional_format',
-        )
+        ]
 
     @batch_handler('insert_rows')
-    def _handle_insert_rows(self, req: dict) -> None:
-        """Handle insert rows request.
+    def _handle_insert_rows(self, req: dict) -> list[dict]:
+        """Build insert rows request.
 
         API: https://developers.google.com/sheets/api/reference/rest/v4/spreadsheets/request#insertdimensionrequest
         """
         start_row = req['start_row'] - 1  # Convert to 0-based
         num_rows = req['num_rows']
-        request = {
-            'insertDimension': {
-                'range': {
-                    'sheetId': self._ws.id,
-                    'dimension': 'ROWS',
-                    'startIndex': start_row,
-                    'endIndex': start_row + num_rows,
-                },
-                'inheritFromBefore': start_row > 0,
+        return [
+            {
+                'insertDimension': {
+                    'range': {
+                        'sheetId': self._sheet_id,
+                        'dimension': 'ROWS',
+                        'startIndex': start_row,
+                        'endIndex': start_row + num_rows,
+                    },
+                    'inheritFromBefore': start_row > 0,
+                }
             }
-        }
-        self._spreadsheet._execute_with_retry(
-            lambda: self._spreadsheet._gspread_spreadsheet.batch_update(
-                {'requests': [request]}
-            ),
-            'insert_rows',
-        )
+        ]
 
     @batch_handler('delete_rows')
-    def _handle_delete_rows(self, req: dict) -> None:
-        """Handle delete rows request.
+    def _handle_delete_rows(self, req: dict) -> list[dict]:
+        """Build delete rows request.
 
         API: https://developers.google.com/sheets/api/reference/rest/v4/spreadsheets/request#deletedimensionrequest
         """
         start_row = req['start_row'] - 1  # Convert to 0-based
         num_rows = req['num_rows']
-        request = {
-            'deleteDimension': {
-                'range': {
-                    'sheetId': self._ws.id,
-                    'dimension': 'ROWS',
-                    'startIndex': start_row,
-                    'endIndex': start_row + num_rows,
+        return [
+            {
+                'deleteDimension': {
+                    'range': {
+                        'sheetId': self._sheet_id,
+                        'dimension': 'ROWS',
+                        'startIndex': start_row,
+                        'endIndex': start_row + num_rows,
+                    }
                 }
             }
-        }
-        self._spreadsheet._execute_with_retry(
-            lambda: self._spreadsheet._gspread_spreadsheet.batch_update(
-                {'requests': [request]}
-            ),
-            'delete_rows',
-        )
+        ]
 
     @batch_handler('insert_columns')
-    def _handle_insert_columns(self, req: dict) -> None:
-        """Handle insert columns request.
+    def _handle_insert_columns(self, req: dict) -> list[dict]:
+        """Build insert columns request.
 
         API: https://developers.google.com/sheets/api/reference/rest/v4/spreadsheets/request#insertdimensionrequest
         """
         start_col = req['start_col'] - 1  # Convert to 0-based
         num_cols = req['num_cols']
-        request = {
-            'insertDimension': {
-                'range': {
-                    'sheetId': self._ws.id,
-                    'dimension': 'COLUMNS',
-                    'startIndex': start_col,
-                    'endIndex': start_col + num_cols,
-                },
-                'inheritFromBefore': start_col > 0,
+        return [
+            {
+                'insertDimension': {
+                    'range': {
+                        'sheetId': self._sheet_id,
+                        'dimension': 'COLUMNS',
+                        'startIndex': start_col,
+                        'endIndex': start_col + num_cols,
+                    },
+                    'inheritFromBefore': start_col > 0,
+                }
             }
-        }
-        self._spreadsheet._execute_with_retry(
-            lambda: self._spreadsheet._gspread_spreadsheet.batch_update(
-                {'requests': [request]}
-            ),
-            'insert_columns',
-        )
+        ]
 
     @batch_handler('delete_columns')
-    def _handle_delete_columns(self, req: dict) -> None:
-        """Handle delete columns request.
+    def _handle_delete_columns(self, req: dict) -> list[dict]:
+        """Build delete columns request.
 
         API: https://developers.google.com/sheets/api/reference/rest/v4/spreadsheets/request#deletedimensionrequest
         """
         start_col = req['start_col'] - 1  # Convert to 0-based
         num_cols = req['num_cols']
-        request = {
-            'deleteDimension': {
-                'range': {
-                    'sheetId': self._ws.id,
-                    'dimension': 'COLUMNS',
-                    'startIndex': start_col,
-                    'endIndex': start_col + num_cols,
+        return [
+            {
+                'deleteDimension': {
+                    'range': {
+                        'sheetId': self._sheet_id,
+                        'dimension': 'COLUMNS',
+                        'startIndex': start_col,
+                        'endIndex': start_col + num_cols,
+                    }
                 }
             }
-        }
-        self._spreadsheet._execute_with_retry(
-            lambda: self._spreadsheet._gspread_spreadsheet.batch_update(
-                {'requests': [request]}
-            ),
-            'delete_columns',
-        )
+        ]
 
     @batch_handler('freeze_rows')
-    def _handle_freeze_rows(self, req: dict) -> None:
-        """Handle freeze rows request.
+    def _handle_freeze_rows(self, req: dict) -> list[dict]:
+        """Build freeze rows request.
 
         API: https://developers.google.com/sheets/api/reference/rest/v4/spreadsheets/request#updatesheetpropertiesrequest
         """
         num_rows = req['num_rows']
-        request = {
-            'updateSheetProperties': {
-                'properties': {
-                    'sheetId': self._ws.id,
-                    'gridProperties': {
-                        'frozenRowCount': num_rows,
+        return [
+            {
+                'updateSheetProperties': {
+                    'properties': {
+                        'sheetId': self._sheet_id,
+                        'gridProperties': {
+                            'frozenRowCount': num_rows,
+                        },
                     },
-                },
-                'fields': 'gridProperties.frozenRowCount',
+                    'fields': 'gridProperties.frozenRowCount',
+                }
             }
-        }
-        self._spreadsheet._execute_with_retry(
-            lambda: self._spreadsheet._gspread_spreadsheet.batch_update(
-                {'requests': [request]}
-            ),
-            'freeze_rows',
-        )
+        ]
 
     @batch_handler('freeze_columns')
-    def _handle_freeze_columns(self, req: dict) -> None:
-        """Handle freeze columns request.
+    def _handle_freeze_columns(self, req: dict) -> list[dict]:
+        """Build freeze columns request.
 
         API: https://developers.google.com/sheets/api/reference/rest/v4/spreadsheets/request#updatesheetpropertiesrequest
         """
         num_cols = req['num_cols']
-        request = {
-            'updateSheetProperties': {
-                'properties': {
-                    'sheetId': self._ws.id,
-                    'gridProperties': {
-                        'frozenColumnCount': num_cols,
+        return [
+            {
+                'updateSheetProperties': {
+                    'properties': {
+                        'sheetId': self._sheet_id,
+                        'gridProperties': {
+                            'frozenColumnCount': num_cols,
+                        },
                     },
-                },
-                'fields': 'gridProperties.frozenColumnCount',
+                    'fields': 'gridProperties.frozenColumnCount',
+                }
             }
-        }
-        self._spreadsheet._execute_with_retry(
-            lambda: self._spreadsheet._gspread_spreadsheet.batch_update(
-                {'requests': [request]}
-            ),
-            'freeze_columns',
-        )
+        ]
 
     @batch_handler('raw')
-    def _handle_raw(self, req: dict) -> None:
-        """Handle raw batch update request.
+    def _handle_raw(self, req: dict) -> list[dict]:
+        """Pass raw batch update request through unchanged.
 
         API: https://developers.google.com/sheets/api/reference/rest/v4/spreadsheets/request
         """
-        self._spreadsheet._execute_with_retry(
-            lambda: self._spreadsheet._gspread_spreadsheet.batch_update(
-                {'requests': [req['request']]}
-            ),
-            'raw',
-        )
+        return [req['request']]
 
     def _parse_range_to_grid_range(self, range_name: str) -> dict:
         """Parse A1 notation range to GridRange dict for batch_update requests.
@@ -1024,7 +1311,18 @@ class Worksheet:
             GridRange dict with sheetId, startRowIndex, endRowIndex,
             startColumnIndex, endColumnIndex. endRowIndex is omitted for
             open-ended ranges (meaning "to end of sheet").
+
+        Parsed ranges are cached per worksheet, so repeated requests against
+        the same range string are only parsed once. A fresh copy of the
+        cached dict is returned so requests never share mutable state.
         """
+        cached = self._range_cache.get(range_name)
+        if cached is None:
+            cached = self._range_cache[range_name] = self._build_grid_range(range_name)
+        return dict(cached)
+
+    def _build_grid_range(self, range_name: str) -> dict:
+        """Build a GridRange dict from an A1 notation range (uncached)."""
         # Strip sheet name if present
         if '!' in range_name:
             range_name = range_name.split('!', 1)[1]
@@ -1039,7 +1337,7 @@ class Worksheet:
         end_row, end_col = parse_cell_reference(end_cell)
 
         result = {
-            'sheetId': self._ws.id,
+            'sheetId': self._sheet_id,
             'startRowIndex': start_row if start_row is not None else 0,
             'startColumnIndex': start_col,
             'endColumnIndex': end_col + 1,  # exclusive
@@ -1052,7 +1350,10 @@ class Worksheet:
         return result
 
     def _flush_to_preview(self) -> None:
-        """Render queued operations to local HTML preview as a unified grid."""
+        """Render queued operations to local HTML preview as a unified grid.
+
+        The HTML is streamed to the preview file one table row at a time.
+        """
         # Accumulate current updates into history
         self._preview_history.extend(self._value_updates)
 
@@ -1074,120 +1375,82 @@ class Worksheet:
                     row, col = parse_cell_reference(cell_ref)
                     self._preview_notes[(row, col)] = note_text
 
-        # Build a sparse grid from all updates
-        grid: dict[tuple[int, int], str] = {}
-        max_row = 0
-        max_col = 0
-
-        for update in self._preview_history:
-            start_row, start_col = parse_cell_reference(update['range'])
-            for row_offset, row_data in enumerate(update['values']):
-                for col_offset, cell_value in enumerate(row_data):
-                    r = start_row + row_offset
-                    c = start_col + col_offset
-                    grid[(r, c)] = str(cell_value) if cell_value is not None else ''
-                    max_row = max(max_row, r)
-                    max_col = max(max_col, c)
-
-        # Build HTML with Google Sheets-like styling
-        html = ['<!DOCTYPE html><html><head>']
-        html.append('<meta charset="utf-8">')
-        html.append(f'<title>{self.title}</title>')
-        html.append('<style>')
-        html.append(
-            'body { font-family: Arial, sans-serif; margin: 0; padding: 20px; '
-            'background-color: #f8f9fa; }'
-        )
-        html.append(
-            'h1 { color: #202124; font-size: 18px; font-weight: 400; '
-            'margin-bottom: 16px; }'
-        )
-        html.append(
-            '.sheet-container { background: white; border-radius: 8px; '
-            'box-shadow: 0 1px 3px rgba(0,0,0,0.12); overflow: auto; }'
-        )
-        html.append('table { border-collapse: collapse; border-spacing: 0; }')
-        html.append(
-            'td, th { border: 1px solid #e0e0e0; padding: 4px 8px; '
-            'font-size: 13px; vertical-align: middle; '
-            'white-space: nowrap; overflow: hidden; text-overflow: ellipsis; }'
-        )
-        html.append(
-            'th { background-color: #f8f9fa; color: #5f6368; '
-            'font-weight: 500; text-align: center; position: sticky; top: 0; }'
-        )
-        html.append(
-            '.row-header { background-color: #f8f9fa; color: #5f6368; '
-            'font-weight: 500; text-align: center; min-width: 46px; '
-            'position: sticky; left: 0; }'
-        )
-        html.append(
-            '.corner { background-color: #f8f9fa; position: sticky; '
-            'top: 0; left: 0; z-index: 2; }'
-        )
-        html.append(
-            'td { background-color: white; text-align: left; min-width: 80px; }'
+        # Size a dense grid from all updates, then fill it one row slice at a
+        # time (later updates overwrite earlier ones)
+        placed = [
+            (*parse_cell_reference(update['range']), update['values'])
+            for update in self._preview_history
+        ]
+        max_row = max(
+            (r + i for r, _, values in placed for i, row in enumerate(values) if row),
+            default=0,
         )
-        html.append('.has-note { background-color: #fff8e1; cursor: help; }')
-        html.append(
-            '.has-note::after { content: ""; position: absolute; '
-            'top: 0; right: 0; border-width: 0 6px 6px 0; '
-            'border-style: solid; border-color: #ffc107 #ffc107 '
-            'transparent transparent; }'
+        max_col = max(
+            (c + len(row) - 1 for _, c, values in placed for row in values if row),
+            default=0,
         )
-        html.append('td { position: relative; }')
-        html.append('</style>')
-        html.append('</head><body>')
-        html.append(f'<h1>📊 {self.title}</h1>')
-        html.append('<div class="sheet-container">')
-        html.append('<table>')
-
-        # Header row with column letters
-        html.append('<tr>')
-        html.append('<th class="corner"></th>')  # Corner cell
-        for c in range(max_col + 1):
-            width = self._preview_column_widths.get(c, 80)
-            html.append(
-                f'<th style="width: {width}px; min-width: {width}px;">'
-                f'{column_index_to_letter(c)}</th>'
+        grid = [[''] * (max_col + 1) for _ in range(max_row + 1)]
+        for start_row, start_col, values in placed:
+            for r, row_data in enumerate(values, start_row):
+                if not row_data:
+                    continue
+                grid[r][start_col : start_col + len(row_data)] = [
+                    html.escape(str(v)) if v is not None else '' for v in row_data
+                ]
+
+        widths = [self._preview_column_widths.get(c, 80) for c in range(max_col + 1)]
+        styles = [f'width: {width}px; max-width: {width}px;' for width in widths]
+        cell_open = [f'<td style="{style}">' for style in styles]
+        notes_by_row: dict[int, dict[int, str]] = {}
+        for (r, c), note in self._preview_notes.items():
+            if note:
+                notes_by_row.setdefault(r, {})[c] = html.escape(note)
+
+        self._preview_output.parent.mkdir(parents=True, exist_ok=True)
+        with self._preview_output.open('w', encoding='utf-8') as f:
+            f.write(_PREVIEW_HEAD.format(title=html.escape(self.title)))
+
+            # Header row with column letters
+            f.write('<tr><th class="corner"></th>')  # Corner cell
+            f.write(
+                ''.join(
+                    f'<th style="width: {width}px; min-width: {width}px;">'
+                    f'{column_index_to_letter(c)}</th>'
+                    for c, width in enumerate(widths)
+                )
             )
-        html.append('</tr>')
-
-        # Data rows
-        for r in range(max_row + 1):
-            html.append('<tr>')
-            html.append(f'<td class="row-header">{r + 1}</td>')
-            for c in range(max_col + 1):
-                cell_value = grid.get((r, c), '')
-                note = self._preview_notes.get((r, c))
-                width = self._preview_column_widths.get(c, 80)
-                style = f'width: {width}px; max-width: {width}px;'
-                if note:
-                    # Escape HTML in note text
-                    escaped_note = (
-                        note.replace('&', '&amp;')
-                        .replace('"', '&quot;')
-                        .replace('<', '&lt;')
-                        .replace('>', '&gt;')
-                    )
-                    html.append(
-                        f'<td class="has-note" style="{style}" '
-                        f'title="{escaped_note}">{cell_value}</td>'
+            f.write('</tr>\n')
+
+            # Data rows
+            for r, row_cells in enumerate(grid):
+                f.write(f'<tr><td class="row-header">{r + 1}</td>')
+                row_notes = notes_by_row.get(r)
+                if row_notes is None:
+                    f.write(
+                        ''.join(
+                            f'{opener}{value}</td>'
+                            for opener, value in zip(cell_open, row_cells, strict=True)
+                        )
                     )
                 else:
-                    html.append(f'<td style="{style}">{cell_value}</td>')
-            html.append('</tr>')
-
-        html.append('</table>')
-        html.append('</div>')
-        html.append('</body></html>')
+                    f.write(
+                        ''.join(
+                            f'<td class="has-note" style="{styles[c]}" '
+                            f'title="{row_notes[c]}">{value}</td>'
+                            if c in row_notes
+                            else f'{cell_open[c]}{value}</td>'
+                            for c, value in enumerate(row_cells)
+                        )
+                    )
+                f.write('</tr>\n')
 
-        self._preview_output.parent.mkdir(parents=True, exist_ok=True)
-        self._preview_output.write_text('\n'.join(html))
+            f.write(_PREVIEW_TAIL)
 
     def open_preview(self) -> None:
         """Open the preview HTML in browser (local_preview mode only)."""
         if not self._local_preview:
             raise RuntimeError('open_preview only available in local_preview mode')
 
+        import webbrowser
+
         webbrowser.open(f'file://{self._preview_output.absolute()}')
@@ -1,10 +1,9 @@
 """CellLocation type for specifying DataFrame locations within worksheets."""
 
-from dataclasses import dataclass
-from functools import cached_property
+from dataclasses import dataclass, field
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CellLocation:
     """Where a DataFrame should be written within a worksheet.
 
@@ -36,6 +35,11 @@ class CellLocation:
     """
 
     cell: str
+    # Parsed (column_letter, row_1indexed), filled in on first use. Kept out
+    # of __init__, repr, equality and hashing so instances still compare by cell
+    _parsed_cell: tuple[str, int] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @staticmethod
     def _parse_cell(cell: str) -> tuple[str, int]:
@@ -66,10 +70,14 @@ class CellLocation:
             col = col * 26 + (ord(char) - ord('A') + 1)
         return col - 1
 
-    @cached_property
+    @property
     def _parsed(self) -> tuple[str, int]:
         """Cached parsed cell reference."""
-        return self._parse_cell(self.cell)
+        parsed = self._parsed_cell
+        if parsed is None:
+            parsed = self._parse_cell(self.cell)
+            object.__setattr__(self, '_parsed_cell', parsed)
+        return parsed
 
     @property
     def col_letter(self) -> str:
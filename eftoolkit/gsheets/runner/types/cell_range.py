@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 
 from eftoolkit.gsheets.runner.types.cell_location import CellLocation
 from eftoolkit.gsheets.utils import column_index_to_letter
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CellRange:
     """A range of cells in A1 notation.
 
@@ -52,9 +53,13 @@ class CellRange:
     end: CellLocation
 
     @classmethod
+    @lru_cache(maxsize=4096)
     def from_string(cls, range_str: str) -> CellRange:
         """Parse A1 notation like 'B4:E14' or 'A1'.
 
+        Results are cached: CellRange is immutable, and the same range strings
+        are parsed repeatedly when assets are rendered.
+
         Args:
             range_str: A1 notation range string (e.g., 'B4:E14', 'A1').
 
@@ -77,6 +82,7 @@ class CellRange:
         )
 
     @classmethod
+    @lru_cache(maxsize=4096)
     def from_bounds(
         cls,
         start_row: int,
@@ -86,6 +92,9 @@ class CellRange:
     ) -> CellRange:
         """Create from 0-indexed row/col bounds.
 
+        Results are cached like from_string, since the same bounds recur on
+        every flush of an asset.
+
         Args:
             start_row: 0-indexed start row.
             start_col: 0-indexed start column.
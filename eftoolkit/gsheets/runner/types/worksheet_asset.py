@@ -6,13 +6,13 @@ from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
-from pandas import DataFrame
-
 from eftoolkit.gsheets.runner.types.cell_location import CellLocation
 from eftoolkit.gsheets.runner.types.cell_range import CellRange
 from eftoolkit.gsheets.utils import column_index_to_letter
 
 if TYPE_CHECKING:
+    from pandas import DataFrame
+
     from eftoolkit.gsheets.runner.types.hook_context import HookContext
 
 
@@ -2,9 +2,28 @@
 
 import json
 import re
+import string
 from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
 
+# Matches a cell reference ('A1', 'aa10') or a column-only reference ('X')
+_CELL_REFERENCE_PATTERN = re.compile(r'^([A-Za-z]+)(\d*)$')
+
+# Column letter -> 1-based value lookup (both cases) for A1 column arithmetic
+_COLUMN_LETTER_VALUES = {
+    **{c: i + 1 for i, c in enumerate(string.ascii_uppercase)},
+    **{c: i + 1 for i, c in enumerate(string.ascii_lowercase)},
+}
+
+# 0-indexed column -> letters for A..ZZ, covering every column a sheet
+# normally uses; column_index_to_letter falls back to arithmetic beyond it
+_COLUMN_LETTERS = tuple(string.ascii_uppercase) + tuple(
+    first + second
+    for first in string.ascii_uppercase
+    for second in string.ascii_uppercase
+)
+
 # Registry for batch request handlers. Starts empty; populated at import time
 BATCH_HANDLERS: dict[str, str] = {}
 
@@ -14,9 +33,13 @@ def batch_handler(req_type: str) -> Callable:
 
     Usage:
         @batch_handler('column_width')
-        def _handle_column_width(self, req: dict) -> None:
+        def _handle_column_width(self, req: dict) -> list[dict]:
             ...
 
+    Handlers translate a queued request into a list of Google Sheets API
+    batchUpdate request dicts; Worksheet collects them and sends a single
+    batchUpdate on flush.
+
     This eliminates the need to manually maintain a dispatch dict.
     When adding a new batch request type, simply decorate the handler method.
     """
@@ -47,6 +70,8 @@ def column_index_to_letter(index: int) -> str:
         >>> column_index_to_letter(27)
         'AB'
     """
+    if 0 <= index < len(_COLUMN_LETTERS):
+        return _COLUMN_LETTERS[index]
     result = ''
     index += 1  # Convert to 1-indexed for calculation
     while index > 0:
@@ -74,24 +99,20 @@ def parse_cell_reference(cell_ref: str) -> tuple[int | None, int]:
     if ':' in cell_ref:
         cell_ref = cell_ref.split(':')[0]
 
-    # Try parsing as column + row (e.g., 'A1', 'AA10')
-    match = re.match(r'^([A-Za-z]+)(\d+)$', cell_ref)
-    if match:
-        col_str, row_str = match.groups()
-        row: int | None = int(row_str) - 1  # Convert to 0-indexed
-    else:
-        # Try parsing as column-only (e.g., 'X' for open-ended ranges)
-        match = re.match(r'^([A-Za-z]+)$', cell_ref)
-        if match:
-            col_str = match.group(1)
-            row = None  # No row specified - open-ended
-        else:
-            return 0, 0  # Default to A1 if parsing fails
+    # Parse as column + row (e.g., 'A1', 'AA10') or column-only (e.g., 'X'
+    # for open-ended ranges)
+    match = _CELL_REFERENCE_PATTERN.match(cell_ref)
+    if not match:
+        return 0, 0  # Default to A1 if parsing fails
+
+    col_str, row_str = match.groups()
+    # No row specified means open-ended
+    row = int(row_str) - 1 if row_str else None  # Convert to 0-indexed
 
     # Convert column letters to index (A=0, B=1, ..., Z=25, AA=26, etc.)
     col = 0
-    for char in col_str.upper():
-        col = col * 26 + (ord(char) - ord('A') + 1)
+    for char in col_str:
+        col = col * 26 + _COLUMN_LETTER_VALUES[char]
     col -= 1  # Convert to 0-indexed
 
     return row, col
@@ -150,6 +171,21 @@ def _strip_comments(content: str) -> str:
     return '\n'.join(result_lines)
 
 
+def _drop_comment_pairs(pairs: list[tuple[str, object]]) -> dict:
+    """json object_pairs_hook that drops '_comment*' keys while parsing."""
+    return {k: v for k, v in pairs if not k.startswith('_comment')}
+
+
+@lru_cache(maxsize=32)
+def _read_stripped_json(path: str, mtime_ns: int, size: int) -> str:
+    """Read a JSON/JSONC file and strip its comments.
+
+    Cached on the file's path, modification time and size, so an edited file
+    is re-read while unchanged files skip the I/O and comment scan.
+    """
+    return _strip_comments(Path(path).read_text())
+
+
 def load_json_config(path: str | Path, *, strip_comment_keys: bool = False) -> dict:
     """Load a JSON config file, stripping JSONC-style comments.
 
@@ -161,10 +197,12 @@ def load_json_config(path: str | Path, *, strip_comment_keys: bool = False) -> d
     Args:
         path: Path to the JSON/JSONC file
         strip_comment_keys: If True, also remove keys starting with '_comment'
-            from the loaded config using remove_comments(). Default: False.
+            from the loaded config, like remove_comments(). Default: False.
 
     Returns:
-        Parsed JSON as a dictionary
+        Parsed JSON as a new dictionary on every call, so callers may mutate it.
+        Repeated loads of an unchanged file reuse the cached comment-stripped
+        text.
 
     Raises:
         FileNotFoundError: If the file does not exist
@@ -175,12 +213,12 @@ def load_json_config(path: str | Path, *, strip_comment_keys: bool = False) -> d
         >>> config = load_json_config('config.json', strip_comment_keys=True)
     """
     path = Path(path)
-    content = path.read_text()
-    stripped = _strip_comments(content)
-    result = json.loads(stripped)
+    stat = path.stat()
+    stripped = _read_stripped_json(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
     if strip_comment_keys:
-        result = remove_comments(result)
-    return result
+        # Filter during parsing instead of walking the tree a second time
+        return json.loads(stripped, object_pairs_hook=_drop_comment_pairs)
+    return json.loads(stripped)
 
 
 def remove_comments(obj: dict | list) -> dict | list:
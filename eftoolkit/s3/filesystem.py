@@ -1,15 +1,56 @@
 """S3 filesystem utilities."""
 
+import hashlib
 import io
+import json
 import os
+import threading
+from collections import OrderedDict
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from typing import TYPE_CHECKING, BinaryIO
 
 import boto3
-import pandas as pd
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+# Upper bound on concurrent GETs when reading a multi-file parquet prefix
+MAX_READ_WORKERS = 16
+
+# Connection pool size for the shared boto3 client; kept above
+# MAX_READ_WORKERS so concurrent reads never discard pooled connections
+MAX_POOL_CONNECTIONS = 50
+
+# Number of boto3 clients kept for reuse, least recently used evicted first
+MAX_CACHED_CLIENTS = 8
+
+# boto3 clients shared by S3FileSystem instances with the same credentials
+# and endpoint, so repeated instances reuse one session and connection pool.
+# Keyed on a digest of the configuration so secret keys are not held as keys.
+_client_cache: OrderedDict[str, object] = OrderedDict()
+_client_cache_lock = threading.Lock()
+
+# Parquet uploads above MULTIPART_THRESHOLD bytes are sent as a multipart
+# upload, with up to MAX_UPLOAD_WORKERS parts of MULTIPART_CHUNKSIZE in flight
+MULTIPART_THRESHOLD = 16 * 1024 * 1024
+MULTIPART_CHUNKSIZE = 16 * 1024 * 1024
+MAX_UPLOAD_WORKERS = 10
+
+# S3 DeleteObjects accepts at most 1000 keys per request
+DELETE_BATCH_SIZE = 1000
+
+# Parquet write layout: large row groups and 1 MiB data pages keep files
+# compact and cheap to scan, without changing how they are read back
+PARQUET_ROW_GROUP_SIZE = 1_000_000
+PARQUET_DATA_PAGE_SIZE = 1 << 20
+
 
 @dataclass(frozen=True)
 class S3ObjectMetadata:
@@ -94,6 +135,20 @@ class S3Object:
         return self.uri
 
 
+def _parquet_compression_level(
+    compression: str, compression_level: int | None
+) -> int | None:
+    """Drop the compression level for codecs that do not take one."""
+    import pyarrow as pa
+
+    if compression_level is not None and (
+        compression.lower() == 'none'
+        or not pa.Codec.supports_compression_level(compression)
+    ):
+        return None
+    return compression_level
+
+
 def _parse_s3_uri(s3_uri: str) -> tuple[str, str]:
     """Parse an S3 URI into bucket and key components.
 
@@ -162,16 +217,60 @@ class S3FileSystem:
                 'or set S3_ACCESS_KEY_ID/S3_SECRET_ACCESS_KEY environment variables.'
             )
 
+        self._client = None
+
     def _get_client(self):
-        """Get boto3 S3 client."""
-        endpoint_url = f'https://{self.endpoint}' if self.endpoint else None
-        return boto3.client(
-            's3',
-            aws_access_key_id=self.access_key_id,
-            aws_secret_access_key=self.secret_access_key,
-            region_name=self.region,
-            endpoint_url=endpoint_url,
-        )
+        """Get boto3 S3 client.
+
+        The client is created on first use and shared by every S3FileSystem
+        with the same credentials, region and endpoint, so its session and
+        connection pool are reused across calls and instances. Creation is
+        guarded by a lock; the client itself is thread-safe. Connections use
+        TCP keep-alive, and throttled requests are retried in botocore's
+        adaptive mode.
+        """
+        if self._client is None:
+            config = [
+                self.access_key_id,
+                self.secret_access_key,
+                self.region,
+                self.endpoint,
+            ]
+            key = hashlib.sha256(json.dumps(config).encode()).hexdigest()
+            with _client_cache_lock:
+                client = _client_cache.get(key)
+                if client is not None:
+                    _client_cache.move_to_end(key)
+                else:
+                    endpoint_url = f'https://{self.endpoint}' if self.endpoint else None
+                    client = boto3.client(
+                        's3',
+                        aws_access_key_id=self.access_key_id,
+                        aws_secret_access_key=self.secret_access_key,
+                        region_name=self.region,
+                        endpoint_url=endpoint_url,
+                        config=Config(
+                            max_pool_connections=MAX_POOL_CONNECTIONS,
+                            tcp_keepalive=True,
+                            retries={'max_attempts': 5, 'mode': 'adaptive'},
+                        ),
+                    )
+                    _client_cache[key] = client
+                    if len(_client_cache) > MAX_CACHED_CLIENTS:
+                        _client_cache.popitem(last=False)
+                self._client = client
+        return self._client
+
+    @staticmethod
+    def clear_client_cache() -> None:
+        """Drop all shared boto3 clients.
+
+        Instances that already fetched a client keep using it; instances
+        created afterwards get a fresh one. Useful after rotating
+        credentials, or to release the cached clients.
+        """
+        with _client_cache_lock:
+            _client_cache.clear()
 
     def put_object(
         self,
@@ -229,6 +328,47 @@ class S3FileSystem:
         client = self._get_client()
         client.delete_object(Bucket=bucket, Key=key)
 
+    def delete_objects(self, s3_uris: list[str]) -> None:
+        """Delete many objects from S3 with batched DeleteObjects requests.
+
+        Keys are grouped by bucket and sent up to DELETE_BATCH_SIZE per
+        request, instead of one round trip per object.
+
+        Args:
+            s3_uris: S3 URIs of the objects to delete
+
+        Raises:
+            RuntimeError: If S3 reports that any object could not be deleted
+
+        Note:
+            Like delete_object, missing objects are not an error.
+        """
+        keys_by_bucket: dict[str, list[str]] = {}
+        for s3_uri in s3_uris:
+            bucket, key = _parse_s3_uri(s3_uri)
+            keys_by_bucket.setdefault(bucket, []).append(key)
+
+        client = self._get_client()
+        failed = []
+        for bucket, keys in keys_by_bucket.items():
+            for start in range(0, len(keys), DELETE_BATCH_SIZE):
+                response = client.delete_objects(
+                    Bucket=bucket,
+                    Delete={
+                        'Objects': [
+                            {'Key': key}
+                            for key in keys[start : start + DELETE_BATCH_SIZE]
+                        ],
+                        'Quiet': True,
+                    },
+                )
+                failed.extend(
+                    f's3://{bucket}/{error["Key"]}'
+                    for error in response.get('Errors', [])
+                )
+        if failed:
+            raise RuntimeError(f'Failed to delete {len(failed)} objects: {failed}')
+
     def cp(self, src_uri: str, dst_uri: str) -> None:
         """Copy an object within or across buckets.
 
@@ -253,31 +393,157 @@ class S3FileSystem:
                 raise FileNotFoundError(f'{src_uri} does not exist') from e
             raise
 
-    def write_df_to_parquet(self, df: pd.DataFrame, s3_uri: str) -> None:
+    def write_df_to_parquet(
+        self,
+        df: 'pd.DataFrame',
+        s3_uri: str,
+        *,
+        compression: str = 'zstd',
+        compression_level: int | None = 3,
+    ) -> None:
         """Write DataFrame as parquet to S3.
 
+        Defaults to ZSTD, which trades a little CPU for noticeably smaller
+        uploads; pass compression='lz4' or 'snappy' when read speed matters
+        more than object size.
+
         Args:
             df: DataFrame to write
             s3_uri: S3 URI (e.g., 's3://bucket/path/file.parquet')
+            compression: Parquet compression codec
+            compression_level: Codec level, or None for the codec default.
+                Ignored by codecs without levels (e.g., snappy).
+
+        Raises:
+            ValueError: If URI does not end with .parquet
+        """
+        import pyarrow as pa
+
+        self.write_arrow_to_parquet(
+            pa.Table.from_pandas(df, preserve_index=False),
+            s3_uri,
+            compression=compression,
+            compression_level=compression_level,
+        )
+
+    def write_arrow_to_parquet(
+        self,
+        table: 'pa.Table',
+        s3_uri: str,
+        *,
+        compression: str = 'zstd',
+        compression_level: int | None = 3,
+    ) -> None:
+        """Write a pyarrow Table as parquet to S3.
+
+        Use this for data that is already in Arrow form (e.g. from
+        DuckDB.query_arrow) to skip the pandas conversion entirely.
+
+        Args:
+            table: pyarrow Table to write
+            s3_uri: S3 URI (e.g., 's3://bucket/path/file.parquet')
+            compression: Parquet compression codec
+            compression_level: Codec level, or None for the codec default.
+                Ignored by codecs without levels (e.g., snappy).
 
         Raises:
             ValueError: If URI does not end with .parquet
         """
-        _, key = _parse_s3_uri(s3_uri)
+        bucket, key = _parse_s3_uri(s3_uri)
         if not key.endswith('.parquet'):
             raise ValueError(f"S3 URI must end with .parquet, got: '{s3_uri}'")
 
+        import pyarrow.parquet as pq
+
+        # Serialize with pyarrow straight into the upload buffer and hand the
+        # buffer itself to boto3, avoiding a second in-memory bytes copy
         buffer = io.BytesIO()
-        df.to_parquet(buffer, engine='pyarrow', index=False)
+        pq.write_table(
+            table,
+            buffer,
+            compression=compression,
+            compression_level=_parquet_compression_level(
+                compression, compression_level
+            ),
+            use_dictionary=True,
+            row_group_size=PARQUET_ROW_GROUP_SIZE,
+            data_page_size=PARQUET_DATA_PAGE_SIZE,
+        )
         buffer.seek(0)
+        self._upload_parquet(buffer, bucket, key)
 
-        self.put_object(
-            s3_uri,
-            buffer.getvalue(),
-            content_type='application/octet-stream',
+    def write_batches_to_parquet(
+        self,
+        reader: 'pa.RecordBatchReader',
+        s3_uri: str,
+        *,
+        compression: str = 'zstd',
+        compression_level: int | None = 3,
+    ) -> int:
+        """Stream pyarrow RecordBatches into a single parquet file on S3.
+
+        Batches are written one at a time with a ParquetWriter into a spooled
+        temporary file, so memory stays bounded by about one batch plus one
+        upload part however large the result is (e.g. from
+        DuckDB.write_query_to_s3_parquet).
+
+        Args:
+            reader: RecordBatchReader supplying the schema and batches
+            s3_uri: S3 URI (e.g., 's3://bucket/path/file.parquet')
+            compression: Parquet compression codec
+            compression_level: Codec level, or None for the codec default.
+                Ignored by codecs without levels (e.g., snappy).
+
+        Returns:
+            Number of rows written.
+
+        Raises:
+            ValueError: If URI does not end with .parquet
+        """
+        bucket, key = _parse_s3_uri(s3_uri)
+        if not key.endswith('.parquet'):
+            raise ValueError(f"S3 URI must end with .parquet, got: '{s3_uri}'")
+
+        import tempfile
+
+        import pyarrow.parquet as pq
+
+        rows = 0
+        # Spills to disk past one multipart part, so large exports never sit
+        # in memory in full
+        with tempfile.SpooledTemporaryFile(max_size=MULTIPART_CHUNKSIZE) as spool:
+            with pq.ParquetWriter(
+                spool,
+                reader.schema,
+                compression=compression,
+                compression_level=_parquet_compression_level(
+                    compression, compression_level
+                ),
+                use_dictionary=True,
+                data_page_size=PARQUET_DATA_PAGE_SIZE,
+            ) as writer:
+                for batch in reader:
+                    writer.write_batch(batch, row_group_size=PARQUET_ROW_GROUP_SIZE)
+                    rows += batch.num_rows
+            spool.seek(0)
+            self._upload_parquet(spool, bucket, key)
+        return rows
+
+    def _upload_parquet(self, fileobj: BinaryIO, bucket: str, key: str) -> None:
+        """Upload serialized parquet, multipart with concurrent parts if large."""
+        self._get_client().upload_fileobj(
+            fileobj,
+            bucket,
+            key,
+            ExtraArgs={'ContentType': 'application/octet-stream'},
+            Config=TransferConfig(
+                multipart_threshold=MULTIPART_THRESHOLD,
+                multipart_chunksize=MULTIPART_CHUNKSIZE,
+                max_concurrency=MAX_UPLOAD_WORKERS,
+            ),
         )
 
-    def read_df_from_parquet(self, s3_uri: str) -> pd.DataFrame:
+    def read_df_from_parquet(self, s3_uri: str) -> 'pd.DataFrame':
         """Read parquet file(s) from S3.
 
         Supports both single files and directories containing parquet files.
@@ -287,9 +553,16 @@ class S3FileSystem:
                 - A URI ending in .parquet (reads that exact file)
                 - A prefix/directory URI (reads all .parquet files and concatenates)
 
+        Files under a prefix are downloaded concurrently (up to
+        MAX_READ_WORKERS at a time) and concatenated in listing order as
+        Arrow tables before a single conversion to pandas. Parts with
+        different columns are combined, with missing columns filled as null.
+
         Returns:
             DataFrame with parquet contents
         """
+        import pandas as pd
+
         bucket, key = _parse_s3_uri(s3_uri)
 
         if key.endswith('.parquet'):
@@ -302,28 +575,45 @@ class S3FileSystem:
         prefix = key.rstrip('/') + '/'
         paginator = client.get_paginator('list_objects_v2')
         parquet_keys = []
+        prefix_exists = False
 
         for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
             for obj in page.get('Contents', []):
+                prefix_exists = True
                 if obj['Key'].endswith('.parquet'):
                     parquet_keys.append(obj['Key'])
 
         if not parquet_keys:
-            # Check if the prefix exists at all
-            response = client.list_objects_v2(Bucket=bucket, Prefix=prefix, MaxKeys=1)
-            if not response.get('Contents'):
+            # The listing above already tells us whether the prefix exists
+            if not prefix_exists:
                 raise FileNotFoundError(
                     f'{s3_uri} does not exist. '
                     f'For single files, use a URI ending in .parquet'
                 )
             raise FileNotFoundError(f'{s3_uri} exists but contains no .parquet files')
 
-        dfs = []
-        for pq_key in parquet_keys:
-            data = self.get_object(f's3://{bucket}/{pq_key}')
-            dfs.append(pd.read_parquet(io.BytesIO(data)))
+        import pyarrow as pa
+        import pyarrow.parquet as pq
 
-        return pd.concat(dfs, ignore_index=True)
+        def read_part(pq_key: str) -> pa.Table:
+            data = self.get_object(f's3://{bucket}/{pq_key}')
+            return pq.read_table(pa.BufferReader(data))
+
+        # Fetch parts concurrently; map() keeps results in listing order
+        max_workers = min(MAX_READ_WORKERS, len(parquet_keys))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            tables = list(executor.map(read_part, parquet_keys))
+
+        # Concatenate at the Arrow layer and convert to pandas once, freeing
+        # Arrow buffers as columns are converted. Permissive promotion fills
+        # missing columns and widens differing types (e.g. int64 and float64
+        # to float64), as pd.concat would. Any index stored by the parts
+        # is dropped so the result gets a fresh RangeIndex, as concatenating
+        # with ignore_index=True would give.
+        combined = pa.concat_tables(tables, promote_options='permissive')
+        del tables
+        df = combined.to_pandas(self_destruct=True, split_blocks=True)
+        return df.reset_index(drop=True)
 
     def file_exists(self, s3_uri: str) -> bool:
         """Check if object exists.
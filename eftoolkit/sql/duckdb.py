@@ -1,15 +1,57 @@
 """DuckDB wrapper with S3 integration."""
 
-from contextlib import contextmanager
+import os
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Optional
 
 import duckdb
+import numpy as np
 import pandas as pd
 
 if TYPE_CHECKING:
+    import pyarrow as pa
+
     from eftoolkit.s3 import S3FileSystem
 
 
+# Extensions already INSTALLed by this process. INSTALL writes to the shared
+# extension directory, so it only needs to run once; LOAD is per connection.
+_installed_extensions: set[str] = set()
+_install_lock = threading.Lock()
+
+# Codecs DuckDB's COPY ... (FORMAT PARQUET) accepts for COMPRESSION
+PARQUET_COMPRESSION_CODECS = frozenset(
+    {'uncompressed', 'snappy', 'gzip', 'zstd', 'brotli', 'lz4', 'lz4_raw'}
+)
+
+
+def _install_extension(
+    conn: duckdb.DuckDBPyConnection, name: str, repository: str | None = None
+) -> None:
+    """INSTALL a DuckDB extension unless this process already did."""
+    if name in _installed_extensions:
+        return
+    with _install_lock:
+        if name not in _installed_extensions:
+            source = f' FROM {repository}' if repository else ''
+            conn.execute(f'INSTALL {name}{source};')
+            _installed_extensions.add(name)
+
+
+def _quote_literal(value: str) -> str:
+    """Quote a string value for use as a SQL literal."""
+    escaped = value.replace("'", "''")
+    return f"'{escaped}'"
+
+
+def _quote_identifier(name: str) -> str:
+    """Quote a column name for use in SQL."""
+    escaped = name.replace('"', '""')
+    return f'"{escaped}"'
+
+
 class DuckDB:
     """Thin wrapper around duckdb.DuckDBPyConnection with S3 integration.
 
@@ -29,6 +71,7 @@ class DuckDB:
         s3_secret_access_key: str | None = None,
         s3_endpoint: str | None = None,
         s3_url_style: str | None = None,
+        enable_httpfs_cache: bool = False,
     ):
         """Initialize DuckDB with optional S3 integration.
 
@@ -40,6 +83,9 @@ class DuckDB:
             s3_secret_access_key: AWS secret access key for S3 access
             s3_endpoint: Custom S3 endpoint
             s3_url_style: S3 URL style ('path' or 'vhost')
+            enable_httpfs_cache: If True, load the cache_httpfs community
+                extension so repeated S3 reads are served from an in-memory
+                cache. Requires downloading the extension on first use.
         """
         self.database = database
         self._s3 = s3
@@ -48,7 +94,13 @@ class DuckDB:
         self.s3_secret_access_key = s3_secret_access_key
         self.s3_endpoint = s3_endpoint
         self.s3_url_style = s3_url_style
-        self._active_conn: duckdb.DuckDBPyConnection | None = None
+        self.enable_httpfs_cache = enable_httpfs_cache
+        self._conn: duckdb.DuckDBPyConnection | None = None
+        self._conn_thread: int | None = None  # Thread that opened self._conn
+        self._conn_lock = threading.Lock()
+        self._local = threading.local()  # Per-thread cursor on self._conn
+        # Cursors handed out to other threads, by thread; see _cursor()
+        self._cursors: dict[threading.Thread, duckdb.DuckDBPyConnection] = {}
 
         # Create S3FileSystem from credentials if provided and no s3 instance given
         if self._s3 is None and s3_access_key_id and s3_secret_access_key:
@@ -69,58 +121,120 @@ class DuckDB:
     @property
     def connection(self) -> duckdb.DuckDBPyConnection:
         """Underlying DuckDB connection (for direct access to native API)."""
-        return self._get_connection().__enter__()
+        return self._ensure_connection()
 
     def _setup_s3(self, conn: duckdb.DuckDBPyConnection) -> None:
         """Configure S3 credentials on the connection."""
         if self.s3_access_key_id and self.s3_secret_access_key:
-            conn.execute('INSTALL httpfs;')
+            _install_extension(conn, 'httpfs')
             conn.execute('LOAD httpfs;')
 
+            if self.enable_httpfs_cache:
+                _install_extension(conn, 'cache_httpfs', 'community')
+                conn.execute('LOAD cache_httpfs;')
+                conn.execute("SET cache_httpfs_type='in_mem';")
+
             if self.s3_url_style:
-                conn.execute(f"SET s3_url_style='{self.s3_url_style}';")
+                conn.execute(f'SET s3_url_style={_quote_literal(self.s3_url_style)};')
 
-            endpoint_clause = (
-                f", ENDPOINT '{self.s3_endpoint}'" if self.s3_endpoint else ''
-            )
-            conn.execute(f"""
-                CREATE SECRET IF NOT EXISTS (
-                    TYPE S3,
-                    KEY_ID '{self.s3_access_key_id}',
-                    SECRET '{self.s3_secret_access_key}',
-                    REGION '{self.s3_region}'
-                    {endpoint_clause}
-                );
-            """)
-
-    @contextmanager
-    def _get_connection(self):
-        """Get a configured database connection.
-
-        If used within a context manager (with statement), reuses the active
-        connection. Otherwise, creates a new connection for each operation.
+            conn.execute(self._s3_secret_sql())
+
+    def _s3_secret_sql(self) -> str:
+        """Build the CREATE SECRET statement for the configured S3 credentials.
+
+        DuckDB does not accept prepared parameters in CREATE SECRET, so the
+        values are embedded as escaped literals. IF NOT EXISTS keeps reruns
+        on the same connection a no-op.
         """
-        if self._active_conn is not None:
-            # Reuse active connection from context manager
-            yield self._active_conn
-        else:
-            # Create a new connection for this operation
-            conn = duckdb.connect(database=self.database)
-            self._setup_s3(conn)
-            try:
-                yield conn
-            finally:
-                conn.close()
+        options = [
+            'TYPE S3',
+            f'KEY_ID {_quote_literal(self.s3_access_key_id)}',
+            f'SECRET {_quote_literal(self.s3_secret_access_key)}',
+        ]
+        if self.s3_region:
+            options.append(f'REGION {_quote_literal(self.s3_region)}')
+        if self.s3_endpoint:
+            options.append(f'ENDPOINT {_quote_literal(self.s3_endpoint)}')
+        return f'CREATE SECRET IF NOT EXISTS ({", ".join(options)});'
+
+    def _ensure_connection(self) -> duckdb.DuckDBPyConnection:
+        """Get the configured database connection, opening it on first use.
+
+        The connection (and its S3 setup) is created once and reused by every
+        operation until close() is called. Creation is guarded by a lock.
+        """
+        if self._conn is None:
+            with self._conn_lock:
+                if self._conn is None:
+                    conn = duckdb.connect(database=self.database)
+                    self._setup_s3(conn)
+                    self._conn = conn
+                    self._conn_thread = threading.get_ident()
+        return self._conn
+
+    def _cursor(self) -> duckdb.DuckDBPyConnection:
+        """Get the connection handle for the calling thread.
+
+        The thread that opened the connection uses it directly; every other
+        thread gets its own cursor from conn.cursor(), created once and reused,
+        so concurrent callers do not serialize on a single connection.
+        Cursors share the database, catalog, loaded extensions and secrets,
+        but temporary tables, registered DataFrames and open transactions are
+        local to each thread's handle.
+
+        Cursors of threads that have exited are closed whenever a new thread
+        gets its cursor, so instances used from churning thread pools hold
+        at most one cursor per live thread.
+        """
+        conn = self._ensure_connection()
+        if threading.get_ident() == self._conn_thread:
+            return conn
+
+        # Thread-local entries from before a close()/reopen are discarded
+        if getattr(self._local, 'parent', None) is not conn:
+            cursor = conn.cursor()
+            with self._conn_lock:
+                for thread in [t for t in self._cursors if not t.is_alive()]:
+                    self._cursors.pop(thread).close()
+                self._cursors[threading.current_thread()] = cursor
+            self._local.parent = conn
+            self._local.cursor = cursor
+        return self._local.cursor
 
     def _clean_df(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Replace inf/nan values with None."""
-        return df.replace([float('inf'), float('-inf'), float('nan')], None)
+        """Replace inf/nan values with None.
 
-    def query(self, sql: str) -> pd.DataFrame:
+        NumPy float columns are checked with a single np.isfinite pass and
+        only converted to object when they contain special values; integer
+        and boolean columns cannot hold them and are skipped. Other columns
+        fall back to Series.replace. The input DataFrame is not modified.
+        """
+        cleaned = df.copy(deep=False)
+        for i, (_, series) in enumerate(df.items()):
+            kind = series.dtype.kind if isinstance(series.dtype, np.dtype) else None
+            if kind in ('i', 'u', 'b'):
+                continue
+            if kind == 'f':
+                values = series.to_numpy()
+                mask = ~np.isfinite(values)
+                if not mask.any():
+                    continue
+                replaced = values.astype(object)
+                replaced[mask] = None
+            else:
+                replaced = series.replace(
+                    [float('inf'), float('-inf'), float('nan')], None
+                )
+            cleaned.isetitem(i, replaced)
+        return cleaned
+
+    def query(self, sql: str, params: list | dict | None = None) -> pd.DataFrame:
         """Execute SQL and return DataFrame.
 
         Args:
             sql: SQL query to execute.
+            params: Optional values bound to ``?`` (list) or ``$name`` (dict)
+                placeholders in the SQL, instead of interpolating them.
 
         Returns:
             DataFrame containing the query results.
@@ -131,9 +245,130 @@ class DuckDB:
             >>> print(df)
                id   name
             0   1  Alice
+            >>> db.query('SELECT ? AS id', [1])
+               id
+            0   1
+        """
+        if params is None:
+            return self._cursor().query(sql).fetchdf()
+        return self._cursor().execute(sql, params).fetchdf()
+
+    def scalar(self, sql: str, params: list | dict | None = None) -> object:
+        """Execute SQL and return the first column of the first row.
+
+        Fetches a single row as native Python objects, avoiding the DataFrame
+        (or NumPy array) that query() would build for one value.
+
+        Args:
+            sql: SQL query to execute.
+            params: Optional values bound to ``?`` or ``$name`` placeholders.
+
+        Returns:
+            The value, or None if the query returned no rows.
+
+        Example:
+            >>> db = DuckDB()
+            >>> db.scalar('SELECT max(x) FROM range(5) t(x)')
+            4
+        """
+        row = self._cursor().execute(sql, params).fetchone()
+        return row[0] if row is not None else None
+
+    def query_many(
+        self, queries: list[str], max_workers: int | None = None
+    ) -> list[pd.DataFrame]:
+        """Execute independent SQL queries concurrently.
+
+        Each query runs on its own cursor in a thread pool, so I/O-bound scans
+        (e.g. of S3 parquet) overlap instead of running back to back. Results
+        are returned in the same order as the queries.
+
+        Args:
+            queries: SQL queries to execute.
+            max_workers: Maximum concurrent queries. Defaults to one per query,
+                capped at the number of CPUs.
+
+        Returns:
+            List of DataFrames, one per query.
+
+        Example:
+            >>> db = DuckDB()
+            >>> scores, picks = db.query_many([
+            ...     'SELECT * FROM scoreboard',
+            ...     'SELECT * FROM worst_picks',
+            ... ])
+        """
+        if not queries:
+            return []
+        conn = self._ensure_connection()
+
+        def run(sql: str) -> pd.DataFrame:
+            cursor = conn.cursor()
+            try:
+                return cursor.query(sql).fetchdf()
+            finally:
+                cursor.close()
+
+        if max_workers is None:
+            max_workers = min(len(queries), os.cpu_count() or 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(run, queries))
+
+    def query_arrow(self, sql: str) -> 'pa.Table':
+        """Execute SQL and return a pyarrow Table.
+
+        Skips the pandas conversion entirely, so columnar results are handed
+        over without copying into NumPy/pandas blocks.
+
+        Args:
+            sql: SQL query to execute.
+
+        Returns:
+            pyarrow Table containing the query results.
+
+        Example:
+            >>> db = DuckDB()
+            >>> table = db.query_arrow('SELECT 1 as id')
+            >>> table.num_rows
+            1
+        """
+        result = self._cursor().execute(sql)
+        # to_arrow_table() replaces fetch_arrow_table() in newer duckdb releases
+        fetch = getattr(result, 'to_arrow_table', None) or result.fetch_arrow_table
+        return fetch()
+
+    def query_chunks(
+        self, sql: str, batch_size: int = 1_000_000
+    ) -> Iterator['pa.RecordBatch']:
+        """Execute SQL and yield the results as pyarrow RecordBatches.
+
+        Lets callers stream large results without holding them in memory all
+        at once. Run other queries on this instance from the same thread only
+        after the iteration has finished.
+
+        Args:
+            sql: SQL query to execute.
+            batch_size: Maximum number of rows per batch.
+
+        Yields:
+            pyarrow RecordBatches of at most batch_size rows.
+
+        Example:
+            >>> db = DuckDB()
+            >>> for batch in db.query_chunks('SELECT * FROM range(10)', 4):
+            ...     print(batch.num_rows)
+            4
+            4
+            2
         """
-        with self._get_connection() as conn:
-            return conn.query(sql).fetchdf()
+        yield from self._record_batch_reader(sql, batch_size)
+
+    def _record_batch_reader(self, sql: str, batch_size: int) -> 'pa.RecordBatchReader':
+        """Execute SQL and return a pyarrow RecordBatchReader over the result."""
+        result = self._cursor().execute(sql)
+        # to_arrow_reader() replaces fetch_record_batch() in newer duckdb releases
+        fetch = getattr(result, 'to_arrow_reader', None) or result.fetch_record_batch
+        return fetch(batch_size)
 
     def execute(self, sql: str, *args: object, **kwargs: object) -> None:
         """Execute SQL without returning results.
@@ -148,17 +383,29 @@ class DuckDB:
             *args: Positional arguments passed to duckdb execute.
             **kwargs: Keyword arguments passed to duckdb execute.
         """
-        with self._get_connection() as conn:
-            conn.execute(sql, *args, **kwargs)
+        self._cursor().execute(sql, *args, **kwargs)
 
-    def get_table(self, table_name: str, where: str | None = None) -> pd.DataFrame:
-        """SELECT * FROM table with optional WHERE clause.
+    def get_table(
+        self,
+        table_name: str,
+        where: str | None = None,
+        *,
+        columns: list[str] | dict[str, str] | None = None,
+        params: list | dict | None = None,
+    ) -> pd.DataFrame:
+        """SELECT from table with optional column list and WHERE clause.
 
         Automatically cleans inf/nan values to None.
 
         Args:
             table_name: Name of the table to query.
             where: Optional WHERE clause (without 'WHERE' keyword).
+            columns: Optional columns to select, either a list of names or a
+                dict mapping stored names to output names. The projection is
+                part of the SQL, so parquet/S3-backed tables only read the
+                selected columns. Defaults to all columns.
+            params: Optional values bound to ``?`` or ``$name`` placeholders
+                in the WHERE clause.
 
         Returns:
             DataFrame with table contents.
@@ -168,23 +415,42 @@ class DuckDB:
             >>> db.create_table('users', "SELECT 1 as id, 'Alice' as name")
             >>> df = db.get_table('users')
             >>> filtered = db.get_table('users', where="id = 1")
+            >>> bound = db.get_table('users', where='id = ?', params=[1])
+            >>> names = db.get_table('users', columns={'name': 'Name'})
         """
+        if columns is None:
+            select_list = '*'
+        else:
+            aliases = columns if isinstance(columns, dict) else {c: c for c in columns}
+            select_list = ', '.join(
+                f'{_quote_identifier(source)} AS {_quote_identifier(alias)}'
+                for source, alias in aliases.items()
+            )
         where_clause = f' WHERE {where}' if where else ''
-        df = self.query(f'SELECT * FROM {table_name}{where_clause}')
+        df = self.query(f'SELECT {select_list} FROM {table_name}{where_clause}', params)
         return self._clean_df(df)
 
-    def create_table(self, table_name: str, sql: str) -> None:
+    def create_table(
+        self, table_name: str, sql: str, params: list | dict | None = None
+    ) -> None:
         """CREATE OR REPLACE TABLE from SQL.
 
         Args:
             table_name: Name for the new table.
             sql: SQL SELECT statement to define table contents.
+            params: Optional values bound to ``?`` or ``$name`` placeholders
+                in the SQL.
 
         Example:
             >>> db = DuckDB()
             >>> db.create_table('active_users', "SELECT * FROM users WHERE active = true")
+            >>> db.create_table('recent', 'SELECT * FROM users WHERE year >= ?', [2024])
         """
-        self.execute(f'CREATE OR REPLACE TABLE {table_name} AS ({sql})')
+        create_sql = f'CREATE OR REPLACE TABLE {table_name} AS ({sql})'
+        if params is None:
+            self.execute(create_sql)
+        else:
+            self.execute(create_sql, params)
 
     def create_table_from_df(self, table_name: str, df: pd.DataFrame) -> None:
         """CREATE OR REPLACE TABLE from DataFrame.
@@ -199,11 +465,14 @@ class DuckDB:
             >>> df = pd.DataFrame({'id': [1, 2], 'name': ['Alice', 'Bob']})
             >>> db.create_table_from_df('users', df)
         """
-        with self._get_connection() as conn:
-            conn.register('temp_df', df)
+        conn = self._cursor()
+        conn.register('temp_df', df)
+        try:
             conn.execute(
                 f'CREATE OR REPLACE TABLE {table_name} AS (SELECT * FROM temp_df)'
             )
+        finally:
+            conn.unregister('temp_df')
 
     def read_parquet_from_s3(self, s3_uri: str) -> pd.DataFrame:
         """Read parquet from S3.
@@ -223,12 +492,15 @@ class DuckDB:
             )
         return self._s3.read_df_from_parquet(s3_uri)
 
-    def write_df_to_s3_parquet(self, df: pd.DataFrame, s3_uri: str) -> None:
+    def write_df_to_s3_parquet(
+        self, df: pd.DataFrame, s3_uri: str, *, compression: str = 'zstd'
+    ) -> None:
         """Write DataFrame to S3 as parquet.
 
         Args:
             df: DataFrame to write
             s3_uri: S3 URI (e.g., 's3://bucket/path/file.parquet')
+            compression: Parquet compression codec (e.g., 'zstd', 'lz4')
 
         Raises:
             ValueError: If S3 is not configured
@@ -237,13 +509,126 @@ class DuckDB:
             raise ValueError(
                 'S3 not configured. Pass s3= or S3 credentials to __init__'
             )
-        self._s3.write_df_to_parquet(df, s3_uri)
+        self._s3.write_df_to_parquet(df, s3_uri, compression=compression)
+
+    def write_query_to_s3_parquet(
+        self,
+        sql: str,
+        s3_uri: str,
+        *,
+        compression: str = 'zstd',
+        batch_size: int = 100_000,
+    ) -> int:
+        """Stream query results to S3 as a single parquet file.
+
+        Results are fetched as RecordBatches and written incrementally, so
+        memory stays bounded regardless of table size and no DataFrame is
+        built.
+
+        Args:
+            sql: SELECT statement whose results are written.
+            s3_uri: S3 URI (e.g., 's3://bucket/path/file.parquet')
+            compression: Parquet compression codec (e.g., 'zstd', 'lz4')
+            batch_size: Rows fetched from DuckDB per batch.
+
+        Returns:
+            Number of rows written.
+
+        Raises:
+            ValueError: If S3 is not configured
+
+        Example:
+            >>> db = DuckDB(s3_access_key_id='...', s3_secret_access_key='...')
+            >>> db.write_query_to_s3_parquet(
+            ...     'SELECT * FROM users', 's3://bucket/users.parquet'
+            ... )
+            3
+        """
+        if self._s3 is None:
+            raise ValueError(
+                'S3 not configured. Pass s3= or S3 credentials to __init__'
+            )
+        return self._s3.write_batches_to_parquet(
+            self._record_batch_reader(sql, batch_size),
+            s3_uri,
+            compression=compression,
+        )
+
+    def copy_to_parquet(
+        self,
+        sql: str,
+        uri: str,
+        *,
+        compression: str = 'zstd',
+        row_group_size: int = 122_880,
+        partition_by: list[str] | None = None,
+    ) -> int:
+        """Write query results to parquet with DuckDB's COPY.
+
+        DuckDB streams row groups straight to the target (through httpfs for
+        s3:// URIs), so the result is never materialized as a DataFrame.
+
+        Args:
+            sql: SELECT statement whose results are written.
+            uri: Destination path or S3 URI (e.g., 's3://bucket/out.parquet').
+                With partition_by, the directory or prefix to write under.
+            compression: Parquet compression codec, one of
+                PARQUET_COMPRESSION_CODECS (e.g., 'zstd', 'snappy').
+            row_group_size: Rows per parquet row group.
+            partition_by: Optional columns to Hive-partition the output by
+                (e.g., ``year=2024/month=1/data_0.parquet``), so downstream
+                scans filtering on them skip other partitions. Existing files
+                under uri are kept unless this write produces a file with the
+                same name, which is overwritten; writing the same partition
+                values again therefore replaces those partitions' files.
+
+        Returns:
+            Number of rows written.
+
+        Raises:
+            ValueError: If compression is not a supported codec, or uri is an
+                S3 URI and S3 credentials are not configured
+
+        Example:
+            >>> db = DuckDB(s3_access_key_id='...', s3_secret_access_key='...')
+            >>> db.copy_to_parquet('SELECT * FROM users', 's3://bucket/users.parquet')
+            3
+            >>> db.copy_to_parquet(
+            ...     'SELECT * FROM events', 's3://bucket/events/', partition_by=['year']
+            ... )
+            120
+        """
+        if compression.lower() not in PARQUET_COMPRESSION_CODECS:
+            raise ValueError(
+                f'Unsupported parquet compression {compression!r}; expected one '
+                f'of {sorted(PARQUET_COMPRESSION_CODECS)}'
+            )
+        if uri.startswith('s3://') and not (
+            self.s3_access_key_id and self.s3_secret_access_key
+        ):
+            raise ValueError(
+                'S3 not configured. Pass S3 credentials to __init__ to COPY to S3'
+            )
+        options = [
+            'FORMAT PARQUET',
+            f'COMPRESSION {compression}',
+            f'ROW_GROUP_SIZE {int(row_group_size)}',
+        ]
+        if partition_by:
+            columns = ', '.join(_quote_identifier(c) for c in partition_by)
+            options += [f'PARTITION_BY ({columns})', 'OVERWRITE_OR_IGNORE']
+        row = (
+            self._cursor()
+            .execute(f'COPY ({sql}) TO {_quote_literal(uri)} ({", ".join(options)})')
+            .fetchone()
+        )
+        return row[0]
 
     def __enter__(self) -> 'DuckDB':
-        """Context manager entry - opens a persistent connection.
+        """Context manager entry - opens the connection if not already open.
 
-        When used as a context manager, all operations within the block
-        reuse the same connection for better performance.
+        All operations on a DuckDB instance share one connection; the
+        context manager closes it on exit.
 
         Example:
             >>> with DuckDB() as db:
@@ -251,18 +636,24 @@ class DuckDB:
             ...     db.execute("INSERT INTO t VALUES (1)")
             ...     result = db.query("SELECT * FROM t")
         """
-        self._active_conn = duckdb.connect(database=self.database)
-        self._setup_s3(self._active_conn)
+        self._ensure_connection()
         return self
 
     def __exit__(self, *_args) -> None:
-        """Context manager exit - closes the persistent connection."""
-        if self._active_conn is not None:
-            self._active_conn.close()
-            self._active_conn = None
+        """Context manager exit - closes the connection."""
+        self.close()
 
     def close(self) -> None:
-        """Close the active connection if one exists."""
-        if self._active_conn is not None:
-            self._active_conn.close()
-            self._active_conn = None
+        """Close the connection if one is open.
+
+        A later operation opens a fresh connection. For ':memory:' databases
+        this means starting from an empty database.
+        """
+        with self._conn_lock:
+            for cursor in self._cursors.values():
+                cursor.close()
+            self._cursors.clear()
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+                self._conn_thread = None
@@ -0,0 +1,10 @@
+"""Helpers shared by test modules and fixtures."""
+
+
+def empty_bucket(conn, bucket: str) -> None:
+    """Delete every object in a mocked bucket."""
+    paginator = conn.get_paginator('list_objects_v2')
+    for page in paginator.paginate(Bucket=bucket):
+        keys = [{'Key': obj['Key']} for obj in page.get('Contents', [])]
+        if keys:
+            conn.delete_objects(Bucket=bucket, Delete={'Objects': keys})
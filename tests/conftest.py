@@ -5,12 +5,15 @@ import pandas as pd
 import pytest
 from moto import mock_aws
 
+from eftoolkit.s3 import S3FileSystem
+from tests._helpers import empty_bucket
+
 TEST_BUCKET = 'test-bucket'
 
 
-@pytest.fixture
-def sample_df():
-    """Create a sample DataFrame for testing."""
+@pytest.fixture(scope='session')
+def _sample_df_template():
+    """Build the sample DataFrame once per test session."""
     return pd.DataFrame(
         {
             'id': [1, 2, 3],
@@ -21,12 +24,73 @@ def sample_df():
 
 
 @pytest.fixture
-def mock_s3_bucket():
-    """Create a mocked S3 bucket for testing.
+def sample_df(_sample_df_template):
+    """Sample DataFrame for testing.
+
+    Each test gets its own copy of the session-wide frame, so mutating it
+    cannot leak into other tests.
+    """
+    return _sample_df_template.copy()
+
+
+@pytest.fixture(autouse=True)
+def fresh_s3_client_cache():
+    """Give each test an empty boto3 client cache.
+
+    Clients must be created inside each test's moto context, so one cached
+    by an earlier test must not be reused.
+    """
+    S3FileSystem.clear_client_cache()
+    yield
+    S3FileSystem.clear_client_cache()
+
 
-    Yields the bucket name for S3FileSystem tests.
+@pytest.fixture(scope='session')
+def _mock_aws_session():
+    """Start moto once per session and create the shared test bucket.
+
+    Yields a boto3 S3 client bound to the mock. Fake credentials are set per
+    test by ``mock_s3_bucket`` rather than by moto, since some tests clear the
+    AWS environment variables.
     """
-    with mock_aws():
-        conn = boto3.client('s3', region_name='us-east-1')
+    with mock_aws(config={'core': {'mock_credentials': False}}):
+        conn = boto3.client(
+            's3',
+            region_name='us-east-1',
+            aws_access_key_id='testing',
+            aws_secret_access_key='testing',
+        )
         conn.create_bucket(Bucket=TEST_BUCKET)
-        yield TEST_BUCKET
+        yield conn
+
+
+@pytest.fixture
+def mock_s3_bucket(_mock_aws_session, monkeypatch):
+    """Provide an empty mocked S3 bucket for testing.
+
+    Yields the bucket name for S3FileSystem tests. The moto mock is shared
+    across the session; afterwards the test's objects, and any extra buckets
+    it created, are removed so the next test starts clean. Buckets that
+    existed before the test (e.g. module-scoped seeded buckets) are kept.
+    """
+    for key in (
+        'AWS_ACCESS_KEY_ID',
+        'AWS_SECRET_ACCESS_KEY',
+        'AWS_SECURITY_TOKEN',
+        'AWS_SESSION_TOKEN',
+    ):
+        monkeypatch.setenv(key, 'testing')
+    monkeypatch.setenv('AWS_DEFAULT_REGION', 'us-east-1')
+
+    existing = {b['Name'] for b in _mock_aws_session.list_buckets()['Buckets']}
+
+    yield TEST_BUCKET
+
+    conn = _mock_aws_session
+    for bucket in conn.list_buckets()['Buckets']:
+        name = bucket['Name']
+        if name == TEST_BUCKET:
+            empty_bucket(conn, name)
+        elif name not in existing:
+            empty_bucket(conn, name)
+            conn.delete_bucket(Bucket=name)
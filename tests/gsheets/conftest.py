@@ -5,6 +5,8 @@ from unittest.mock import MagicMock
 import pytest
 from gspread.exceptions import APIError
 
+from eftoolkit.gsheets import Spreadsheet
+
 
 class MockResponse:
     """Mock response object for APIError."""
@@ -31,6 +33,43 @@ def create_api_error(status_code: int) -> APIError:
     return error
 
 
+@pytest.fixture(autouse=True)
+def fresh_client_cache():
+    """Give each test an empty gspread client cache.
+
+    Tests patch service_account_from_dict with different mocks, so a client
+    cached by one test must not leak into the next.
+    """
+    Spreadsheet.clear_client_cache()
+    yield
+    Spreadsheet.clear_client_cache()
+
+
+@pytest.fixture(autouse=True)
+def stdlib_json_requests(monkeypatch):
+    """Send batch requests through gspread's own methods by default.
+
+    Most tests assert on mock gspread batch_update/values_batch_update
+    calls, so the orjson fast path is disabled unless a test opts back in.
+    """
+    monkeypatch.setattr('eftoolkit.gsheets.core.spreadsheet.orjson', None)
+
+
+@pytest.fixture
+def mock_service_account(monkeypatch):
+    """Replace service_account_from_dict with a mock and return it.
+
+    The mock's return_value is the gspread client, whose open() returns a
+    mock spreadsheet. A fresh mock is built per test: copying a shared one
+    would also share its child mocks and their call history.
+    """
+    mock_sa = MagicMock(name='service_account_from_dict')
+    monkeypatch.setattr(
+        'eftoolkit.gsheets.core.spreadsheet.service_account_from_dict', mock_sa
+    )
+    return mock_sa
+
+
 @pytest.fixture
 def mock_gspread_spreadsheet():
     """Create a mock gspread spreadsheet object."""
@@ -20,6 +20,16 @@ def test_frozen_immutable():
         location.cell = 'C5'
 
 
+def test_uses_slots():
+    """CellLocation stores attributes in slots, not a __dict__."""
+    location = CellLocation(cell='B4')
+
+    assert location.col == 1  # populates the parse cache
+    assert not hasattr(location, '__dict__')
+    assert location == CellLocation(cell='B4')
+    assert hash(location) == hash(CellLocation(cell='B4'))
+
+
 def test_equality():
     """CellLocation instances with same values are equal."""
     loc1 = CellLocation(cell='B4')
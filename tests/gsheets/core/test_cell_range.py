@@ -1,5 +1,7 @@
 """Tests for CellRange dataclass."""
 
+import pytest
+
 from eftoolkit.gsheets.runner import CellLocation, CellRange
 
 
@@ -16,14 +18,17 @@ def test_create_with_cell_locations():
 
 def test_frozen_immutable():
     """CellRange is immutable (frozen=True)."""
-    import pytest
-
     cell_range = CellRange.from_string('B4:E14')
 
     with pytest.raises(AttributeError):
         cell_range.start = CellLocation(cell='A1')
 
 
+def test_uses_slots():
+    """CellRange stores attributes in slots, not a __dict__."""
+    assert not hasattr(CellRange.from_string('B4:E14'), '__dict__')
+
+
 def test_equality():
     """CellRange instances with same values are equal."""
     range1 = CellRange.from_string('B4:E14')
@@ -60,6 +65,11 @@ def test_from_string_multi_cell_range():
     assert cell_range.end.cell == 'E14'
 
 
+def test_from_string_is_cached():
+    """Repeated parses of the same string return the same immutable instance."""
+    assert CellRange.from_string('C3:D9') is CellRange.from_string('C3:D9')
+
+
 def test_from_string_single_cell():
     """from_string parses single cell 'A1' (start == end)."""
     cell_range = CellRange.from_string('A1')
@@ -113,6 +123,11 @@ def test_from_bounds_basic():
     assert cell_range.end.cell == 'E14'
 
 
+def test_from_bounds_is_cached():
+    """Repeated calls with the same bounds return the same immutable instance."""
+    assert CellRange.from_bounds(2, 2, 8, 3) is CellRange.from_bounds(2, 2, 8, 3)
+
+
 def test_from_bounds_single_cell():
     """from_bounds creates single cell when bounds are equal."""
     cell_range = CellRange.from_bounds(
@@ -143,104 +158,55 @@ def test_from_bounds_double_letter_columns():
 # Computed property tests
 
 
-def test_start_row_returns_0_indexed():
-    """start_row property returns 0-indexed start row."""
-    cell_range = CellRange.from_string('B4:E14')
-
-    assert cell_range.start_row == 3
-
-
-def test_end_row_returns_0_indexed():
-    """end_row property returns 0-indexed end row."""
-    cell_range = CellRange.from_string('B4:E14')
-
-    assert cell_range.end_row == 13
-
-
-def test_start_col_returns_0_indexed():
-    """start_col property returns 0-indexed start column."""
-    cell_range = CellRange.from_string('B4:E14')
-
-    assert cell_range.start_col == 1
-
-
-def test_end_col_returns_0_indexed():
-    """end_col property returns 0-indexed end column."""
-    cell_range = CellRange.from_string('B4:E14')
-
-    assert cell_range.end_col == 4
-
-
-def test_start_row_1indexed():
-    """start_row_1indexed returns 1-indexed start row for API."""
-    cell_range = CellRange.from_string('B4:E14')
-
-    assert cell_range.start_row_1indexed == 4
-
-
-def test_end_row_1indexed():
-    """end_row_1indexed returns 1-indexed end row for API."""
-    cell_range = CellRange.from_string('B4:E14')
-
-    assert cell_range.end_row_1indexed == 14
-
-
-def test_start_col_letter():
-    """start_col_letter returns start column letter(s)."""
-    cell_range = CellRange.from_string('B4:E14')
-
-    assert cell_range.start_col_letter == 'B'
-
-
-def test_end_col_letter():
-    """end_col_letter returns end column letter(s)."""
-    cell_range = CellRange.from_string('B4:E14')
-
-    assert cell_range.end_col_letter == 'E'
-
-
-def test_num_rows():
-    """num_rows returns number of rows in the range."""
-    cell_range = CellRange.from_string('B4:E14')
-
-    # Rows 4-14 inclusive = 11 rows
-    assert cell_range.num_rows == 11
-
-
-def test_num_cols():
-    """num_cols returns number of columns in the range."""
-    cell_range = CellRange.from_string('B4:E14')
-
-    # Columns B-E inclusive = 4 columns
-    assert cell_range.num_cols == 4
-
-
-def test_num_rows_single_cell():
-    """num_rows returns 1 for single cell."""
-    cell_range = CellRange.from_string('A1')
-
-    assert cell_range.num_rows == 1
-
-
-def test_num_cols_single_cell():
-    """num_cols returns 1 for single cell."""
-    cell_range = CellRange.from_string('A1')
-
-    assert cell_range.num_cols == 1
-
-
-def test_is_single_cell_true():
-    """is_single_cell returns True for single cell."""
-    cell_range = CellRange.from_string('A1')
-
-    assert cell_range.is_single_cell is True
-
-
-def test_is_single_cell_false():
-    """is_single_cell returns False for multi-cell range."""
-    cell_range = CellRange.from_string('B4:E14')
-
-    assert cell_range.is_single_cell is False
+@pytest.fixture(scope='module')
+def b4_e14():
+    """CellRange for B4:E14, parsed once for the property tests."""
+    return CellRange.from_string('B4:E14')
+
+
+@pytest.fixture(scope='module')
+def a1():
+    """Single-cell CellRange for A1, parsed once for the property tests."""
+    return CellRange.from_string('A1')
+
+
+@pytest.mark.parametrize(
+    ('attr', 'expected'),
+    [
+        # 0-indexed bounds
+        ('start_row', 3),
+        ('end_row', 13),
+        ('start_col', 1),
+        ('end_col', 4),
+        # 1-indexed rows and column letters for the API
+        ('start_row_1indexed', 4),
+        ('end_row_1indexed', 14),
+        ('start_col_letter', 'B'),
+        ('end_col_letter', 'E'),
+        # Rows 4-14 and columns B-E inclusive
+        ('num_rows', 11),
+        ('num_cols', 4),
+        ('is_single_cell', False),
+    ],
+)
+def test_multi_cell_range_properties(b4_e14, attr, expected):
+    """Computed properties of B4:E14."""
+    value = getattr(b4_e14, attr)
+
+    assert value == expected
+    assert type(value) is type(expected)
+
+
+@pytest.mark.parametrize(
+    ('attr', 'expected'),
+    [('num_rows', 1), ('num_cols', 1), ('is_single_cell', True)],
+)
+def test_single_cell_range_properties(a1, attr, expected):
+    """Computed properties of a single cell."""
+    value = getattr(a1, attr)
+
+    assert value == expected
+    assert type(value) is type(expected)
 
 
 # __str__ tests
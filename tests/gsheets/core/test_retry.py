@@ -1,14 +1,21 @@
 """Tests for retry logic with exponential backoff."""
 
-from unittest.mock import patch
-
 import pytest
+from gspread.exceptions import APIError
 
 from eftoolkit.gsheets import Spreadsheet
 from tests.gsheets.conftest import create_api_error
 
 
-def test_retry_on_429_error():
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Replace time.sleep with a recorder and return the delays it was given."""
+    delays = []
+    monkeypatch.setattr('time.sleep', delays.append)
+    return delays
+
+
+def test_retry_on_429_error(sleeps):
     """_execute_with_retry retries on 429 error."""
     ss = Spreadsheet(local_preview=True, spreadsheet_name='Test', max_retries=3)
 
@@ -21,14 +28,13 @@ def test_retry_on_429_error():
             raise create_api_error(429)
         return 'success'
 
-    with patch('time.sleep'):
-        result = ss._execute_with_retry(flaky_func, 'test_op')
+    result = ss._execute_with_retry(flaky_func, 'test_op')
 
     assert result == 'success'
     assert call_count == 3
 
 
-def test_retry_on_500_error():
+def test_retry_on_500_error(sleeps):
     """_execute_with_retry retries on 500 error."""
     ss = Spreadsheet(local_preview=True, spreadsheet_name='Test', max_retries=2)
 
@@ -41,14 +47,13 @@ def test_retry_on_500_error():
             raise create_api_error(500)
         return 'success'
 
-    with patch('time.sleep'):
-        result = ss._execute_with_retry(flaky_func, 'test_op')
+    result = ss._execute_with_retry(flaky_func, 'test_op')
 
     assert result == 'success'
     assert call_count == 2
 
 
-def test_retry_on_502_error():
+def test_retry_on_502_error(sleeps):
     """_execute_with_retry retries on 502 error."""
     ss = Spreadsheet(local_preview=True, spreadsheet_name='Test', max_retries=2)
 
@@ -61,13 +66,12 @@ def test_retry_on_502_error():
             raise create_api_error(502)
         return 'success'
 
-    with patch('time.sleep'):
-        result = ss._execute_with_retry(flaky_func, 'test_op')
+    result = ss._execute_with_retry(flaky_func, 'test_op')
 
     assert result == 'success'
 
 
-def test_retry_on_503_error():
+def test_retry_on_503_error(sleeps):
     """_execute_with_retry retries on 503 error."""
     ss = Spreadsheet(local_preview=True, spreadsheet_name='Test', max_retries=2)
 
@@ -80,13 +84,12 @@ def test_retry_on_503_error():
             raise create_api_error(503)
         return 'success'
 
-    with patch('time.sleep'):
-        result = ss._execute_with_retry(flaky_func, 'test_op')
+    result = ss._execute_with_retry(flaky_func, 'test_op')
 
     assert result == 'success'
 
 
-def test_retry_on_504_error():
+def test_retry_on_504_error(sleeps):
     """_execute_with_retry retries on 504 error."""
     ss = Spreadsheet(local_preview=True, spreadsheet_name='Test', max_retries=2)
 
@@ -99,13 +102,12 @@ def test_retry_on_504_error():
             raise create_api_error(504)
         return 'success'
 
-    with patch('time.sleep'):
-        result = ss._execute_with_retry(flaky_func, 'test_op')
+    result = ss._execute_with_retry(flaky_func, 'test_op')
 
     assert result == 'success'
 
 
-def test_retry_exponential_backoff():
+def test_retry_exponential_backoff(sleeps, monkeypatch):
     """_execute_with_retry uses exponential backoff delays."""
     ss = Spreadsheet(
         local_preview=True, spreadsheet_name='Test', max_retries=3, base_delay=1.0
@@ -120,37 +122,65 @@ def test_retry_exponential_backoff():
             raise create_api_error(429)
         return 'success'
 
-    with patch('time.sleep') as mock_sleep:
-        with patch('random.uniform', return_value=0.5):
-            result = ss._execute_with_retry(flaky_func, 'test_op')
-            delays = [call[0][0] for call in mock_sleep.call_args_list]
+    monkeypatch.setattr(ss._rng, 'random', lambda: 0.5)
+
+    result = ss._execute_with_retry(flaky_func, 'test_op')
 
     assert result == 'success'
-    # With base_delay=1.0 and random.uniform returning 0.5:
+    # With base_delay=1.0 and jitter returning 0.5:
     # attempt 0: 1.0 * 2^0 + 0.5 = 1.5
     # attempt 1: 1.0 * 2^1 + 0.5 = 2.5
     # attempt 2: 1.0 * 2^2 + 0.5 = 4.5
-    assert delays == [1.5, 2.5, 4.5]
+    assert sleeps == [1.5, 2.5, 4.5]
 
 
-def test_max_retries_exhausted():
-    """_execute_with_retry raises after max retries exhausted."""
-    from gspread.exceptions import APIError
+def test_delay_schedule_precomputed():
+    """Backoff delays are precomputed once per Spreadsheet."""
+    ss = Spreadsheet(
+        local_preview=True, spreadsheet_name='Test', max_retries=4, base_delay=0.5
+    )
+
+    assert ss._delay_schedule == (0.5, 1.0, 2.0, 4.0)
+
+
+def test_retry_jitter_uses_instance_rng(sleeps, monkeypatch):
+    """Jitter comes from the Spreadsheet's own RNG, not the global one."""
+    ss = Spreadsheet(
+        local_preview=True, spreadsheet_name='Test', max_retries=1, base_delay=1.0
+    )
+
+    calls = iter([create_api_error(503), None])
+
+    def flaky_func():
+        error = next(calls)
+        if error:
+            raise error
+        return 'success'
+
+    global_calls = []
+    monkeypatch.setattr('random.uniform', lambda *a: global_calls.append(a))
+    monkeypatch.setattr('random.random', lambda: global_calls.append(()))
+    monkeypatch.setattr(ss._rng, 'random', lambda: 0.25)
 
+    ss._execute_with_retry(flaky_func, 'test_op')
+
+    assert sleeps == [1.25]
+    assert global_calls == []
+
+
+def test_max_retries_exhausted(sleeps):
+    """_execute_with_retry raises after max retries exhausted."""
     ss = Spreadsheet(local_preview=True, spreadsheet_name='Test', max_retries=2)
 
     def always_fails():
         raise create_api_error(429)
 
-    with patch('time.sleep'):
-        with pytest.raises(APIError):
-            ss._execute_with_retry(always_fails, 'test_op')
+    with pytest.raises(APIError):
+        ss._execute_with_retry(always_fails, 'test_op')
 
 
 def test_non_retryable_error_raises_immediately():
     """_execute_with_retry raises immediately on non-retryable error."""
-    from gspread.exceptions import APIError
-
     ss = Spreadsheet(local_preview=True, spreadsheet_name='Test', max_retries=5)
 
     call_count = 0
@@ -176,3 +206,47 @@ def test_success_on_first_try():
     result = ss._execute_with_retry(succeeds, 'test_op')
 
     assert result == 'success'
+
+
+def test_retry_honors_retry_after_header(sleeps, monkeypatch):
+    """A Retry-After header longer than the backoff delay is respected."""
+    ss = Spreadsheet(
+        local_preview=True, spreadsheet_name='Test', max_retries=1, base_delay=1.0
+    )
+    error = create_api_error(429)
+    error.response.headers = {'Retry-After': '30'}
+    calls = iter([error, None])
+
+    def flaky_func():
+        error = next(calls)
+        if error:
+            raise error
+        return 'success'
+
+    monkeypatch.setattr(ss._rng, 'random', lambda: 0.5)
+
+    ss._execute_with_retry(flaky_func, 'test_op')
+
+    assert sleeps == [30.0]
+
+
+def test_retry_ignores_unparseable_retry_after_header(sleeps, monkeypatch):
+    """A non-numeric Retry-After header falls back to the backoff schedule."""
+    ss = Spreadsheet(
+        local_preview=True, spreadsheet_name='Test', max_retries=1, base_delay=1.0
+    )
+    error = create_api_error(503)
+    error.response.headers = {'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'}
+    calls = iter([error, None])
+
+    def flaky_func():
+        error = next(calls)
+        if error:
+            raise error
+        return 'success'
+
+    monkeypatch.setattr(ss._rng, 'random', lambda: 0.5)
+
+    ss._execute_with_retry(flaky_func, 'test_op')
+
+    assert sleeps == [1.5]
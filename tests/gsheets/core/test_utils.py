@@ -26,6 +26,13 @@ def test_column_index_to_letter_triple_letters():
     assert column_index_to_letter(702) == 'AAA'
 
 
+def test_column_index_to_letter_lookup_boundary():
+    """The precomputed lookup and arithmetic fallback agree at ZZ/AAA."""
+    assert column_index_to_letter(701) == 'ZZ'
+    assert column_index_to_letter(703) == 'AAB'
+    assert column_index_to_letter(18277) == 'ZZZ'
+
+
 class TestParseCellReference:
     """Tests for parse_cell_reference function."""
 
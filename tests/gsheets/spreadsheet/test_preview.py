@@ -144,6 +144,24 @@ class TestPreviewNotes:
 
         assert 'Note on B2' in content
 
+    def test_empty_note_renders_plain_cell_beside_noted_cell(self, tmp_path):
+        """A cell with an empty note renders without a tooltip next to a noted one."""
+        ss = Spreadsheet(
+            local_preview=True, spreadsheet_name='Test', preview_dir=str(tmp_path)
+        )
+        ws = ss.worksheet('Sheet1')
+
+        ws.write_values('A1', [['plain', 'noted']])
+        ws.set_notes({'A1': '', 'B1': 'Note on B1'})
+        ws.flush()
+
+        html_file = list(tmp_path.glob('*.html'))[0]
+        content = html_file.read_text()
+
+        assert content.count('class="has-note"') == 1
+        assert 'title="Note on B1">noted</td>' in content
+        assert '>plain</td>' in content
+
 
 class TestPreviewAccumulation:
     """Tests for preview history accumulation across multiple flushes."""
@@ -166,3 +184,76 @@ class TestPreviewAccumulation:
 
         assert 'First' in content
         assert 'Second' in content
+
+
+class TestPreviewCellValues:
+    """Tests for cell value rendering in preview mode."""
+
+    def test_cell_values_are_html_escaped(self, tmp_path):
+        """Cell values containing HTML are escaped in preview."""
+        ss = Spreadsheet(
+            local_preview=True, spreadsheet_name='Test', preview_dir=str(tmp_path)
+        )
+        ws = ss.worksheet('Sheet1')
+
+        ws.write_values('A1', [['<b>bold</b>', 'A & B']])
+        ws.flush()
+
+        html_file = list(tmp_path.glob('*.html'))[0]
+        content = html_file.read_text()
+
+        assert '&lt;b&gt;bold&lt;/b&gt;' in content
+        assert 'A &amp; B' in content
+        assert '<b>bold</b>' not in content
+
+    def test_empty_cells_render_blank(self, tmp_path):
+        """Cells not covered by any write render as empty cells."""
+        ss = Spreadsheet(
+            local_preview=True, spreadsheet_name='Test', preview_dir=str(tmp_path)
+        )
+        ws = ss.worksheet('Sheet1')
+
+        ws.write_values('B2', [[None]])
+        ws.flush()
+
+        html_file = list(tmp_path.glob('*.html'))[0]
+        content = html_file.read_text()
+
+        # Grid spans A1:B2, so all four data cells are empty
+        assert content.count('<td style="width: 80px; max-width: 80px;"></td>') == 4
+
+    def test_later_writes_overwrite_earlier_cells(self, tmp_path):
+        """Overlapping writes show the most recent value for each cell."""
+        ss = Spreadsheet(
+            local_preview=True, spreadsheet_name='Test', preview_dir=str(tmp_path)
+        )
+        ws = ss.worksheet('Sheet1')
+
+        ws.write_values('A1', [['old1', 'old2', 'old3']])
+        ws.write_values('B1', [['new2']])
+        ws.flush()
+
+        html_file = list(tmp_path.glob('*.html'))[0]
+        content = html_file.read_text()
+
+        assert 'old1' in content
+        assert 'old2' not in content
+        assert 'new2' in content
+        assert 'old3' in content
+
+    def test_empty_rows_do_not_extend_grid(self, tmp_path):
+        """Empty rows, including ones below all other data, render without error."""
+        ss = Spreadsheet(
+            local_preview=True, spreadsheet_name='Test', preview_dir=str(tmp_path)
+        )
+        ws = ss.worksheet('Sheet1')
+
+        ws.write_values('A1', [['a'], []])
+        ws.write_values('A5', [[]])
+        ws.flush()
+
+        html_file = list(tmp_path.glob('*.html'))[0]
+        content = html_file.read_text()
+
+        assert '>a</td>' in content
+        assert content.count('class="row-header"') == 1
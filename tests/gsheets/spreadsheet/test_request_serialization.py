@@ -0,0 +1,116 @@
+"""Tests for how Spreadsheet serializes batch request bodies."""
+
+import datetime as dt
+import json
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from eftoolkit.gsheets import Spreadsheet, Worksheet
+
+orjson = pytest.importorskip('orjson')
+
+
+def _api_spreadsheet(monkeypatch):
+    """Spreadsheet in API mode with the orjson fast path enabled."""
+    monkeypatch.setattr('eftoolkit.gsheets.core.spreadsheet.orjson', orjson)
+    mock_gspread = MagicMock()
+    mock_gspread.id = 'abc123'
+
+    ss = Spreadsheet(local_preview=True, spreadsheet_name='Test')
+    ss._local_preview = False
+    ss._gspread_spreadsheet = mock_gspread
+    return ss, mock_gspread
+
+
+def test_batch_update_posts_orjson_bytes(monkeypatch):
+    """batch_update bodies are serialized with orjson and posted directly."""
+    ss, mock_gspread = _api_spreadsheet(monkeypatch)
+    body = {'requests': [{'mergeCells': {'mergeType': 'MERGE_ALL'}}]}
+
+    ss._batch_update(body)
+
+    mock_gspread.batch_update.assert_not_called()
+    method, url = mock_gspread.client.request.call_args[0]
+    kwargs = mock_gspread.client.request.call_args[1]
+    assert method == 'post'
+    assert url.endswith('/abc123:batchUpdate')
+    assert kwargs['headers'] == {'Content-Type': 'application/json'}
+    assert json.loads(kwargs['data']) == body
+
+
+def test_values_batch_update_serializes_numpy_values(monkeypatch):
+    """Values requests can carry numpy scalars when orjson is used."""
+    ss, mock_gspread = _api_spreadsheet(monkeypatch)
+    mock_ws = MagicMock()
+    mock_ws.title = 'Sheet1'
+    ws = Worksheet(mock_ws, ss)
+
+    ws.write_values('A1', [[np.int64(1), np.float64(2.5)]])
+    ws.flush()
+
+    mock_gspread.values_batch_update.assert_not_called()
+    url = mock_gspread.client.request.call_args[0][1]
+    data = json.loads(mock_gspread.client.request.call_args[1]['data'])
+    assert url.endswith('/abc123/values:batchUpdate')
+    assert data['data'] == [{'range': 'Sheet1!A1', 'values': [[1, 2.5]]}]
+
+
+def test_falls_back_to_gspread_without_orjson(monkeypatch):
+    """Without orjson, bodies go through gspread's own methods."""
+    monkeypatch.setattr('eftoolkit.gsheets.core.spreadsheet.orjson', None)
+    mock_gspread = MagicMock()
+    ss = Spreadsheet(local_preview=True, spreadsheet_name='Test')
+    ss._local_preview = False
+    ss._gspread_spreadsheet = mock_gspread
+
+    ss._batch_update({'requests': []})
+
+    mock_gspread.batch_update.assert_called_once_with({'requests': []})
+    mock_gspread.client.request.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ('value', 'expected'),
+    [
+        (np.int64(7), 7),
+        (np.float32(2.5), 2.5),
+        (np.bool_(True), True),
+        (float('nan'), None),
+        (np.float64('inf'), None),
+        (np.float32('nan'), None),
+        (dt.datetime(2024, 1, 2, 3, 4, 5), '2024-01-02T03:04:05'),
+        (dt.date(2024, 1, 2), '2024-01-02'),
+        (pd.Timestamp('2024-01-02 03:04'), '2024-01-02T03:04:00'),
+        (np.datetime64('2024-01-02T03:04'), '2024-01-02T03:04:00'),
+    ],
+)
+def test_orjson_and_stdlib_send_the_same_json(monkeypatch, value, expected):
+    """Both serialization paths encode the same payload identically."""
+    body = {'data': [{'range': 'Sheet1!A1', 'values': [['label', value]]}]}
+
+    ss, fast_gspread = _api_spreadsheet(monkeypatch)
+    ss._values_batch_update(body)
+    fast = json.loads(fast_gspread.client.request.call_args[1]['data'])
+
+    ss, stdlib_gspread = _api_spreadsheet(monkeypatch)
+    monkeypatch.setattr('eftoolkit.gsheets.core.spreadsheet.orjson', None)
+    ss._values_batch_update(body)
+    sent = stdlib_gspread.values_batch_update.call_args[0][0]
+    stdlib = json.loads(json.dumps(sent, allow_nan=False))
+
+    assert fast == stdlib
+    assert fast['data'][0]['values'] == [['label', expected]]
+
+
+@pytest.mark.parametrize('use_orjson', [True, False])
+def test_unserializable_values_raise_type_error(monkeypatch, use_orjson):
+    """Values neither path can encode raise TypeError on both paths."""
+    ss, _ = _api_spreadsheet(monkeypatch)
+    if not use_orjson:
+        monkeypatch.setattr('eftoolkit.gsheets.core.spreadsheet.orjson', None)
+
+    with pytest.raises(TypeError):
+        ss._values_batch_update({'data': [{'values': [[object()]]}]})
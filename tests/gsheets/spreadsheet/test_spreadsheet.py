@@ -1,11 +1,54 @@
 """Tests for Spreadsheet class."""
 
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
 
 import pytest
 from gspread.exceptions import WorksheetNotFound
 
 from eftoolkit.gsheets import Spreadsheet
+from eftoolkit.gsheets.core.spreadsheet import MAX_CACHED_CLIENTS, _client_cache
+
+
+class FakeGspreadSpreadsheet:
+    """Stand-in for a gspread Spreadsheet that records the calls made on it.
+
+    Tabs are plain SimpleNamespace objects with a title; adding and deleting
+    worksheets updates them, so later listings see the change.
+    """
+
+    def __init__(self, *titles: str):
+        self.tabs = [SimpleNamespace(title=title) for title in titles]
+        self.calls: list[tuple] = []
+
+    def worksheets(self):
+        self.calls.append(('worksheets',))
+        return list(self.tabs)
+
+    def add_worksheet(self, title, rows, cols):
+        self.calls.append(('add_worksheet', title, rows, cols))
+        ws = SimpleNamespace(title=title)
+        self.tabs.append(ws)
+        return ws
+
+    def del_worksheet(self, ws):
+        self.calls.append(('del_worksheet', ws))
+        self.tabs.remove(ws)
+
+    def reorder_worksheets(self, worksheets):
+        self.calls.append(('reorder_worksheets', worksheets))
+
+    def reordered_titles(self) -> list[str]:
+        """Titles passed to the single reorder_worksheets call."""
+        (order,) = [call[1] for call in self.calls if call[0] == 'reorder_worksheets']
+        return [ws.title for ws in order]
+
+
+def _connected_spreadsheet(fake: FakeGspreadSpreadsheet) -> Spreadsheet:
+    """Build a Spreadsheet that talks to fake instead of the Sheets API."""
+    ss = Spreadsheet(local_preview=True, spreadsheet_name='Test')
+    ss._local_preview = False
+    ss._gspread_spreadsheet = fake
+    return ss
 
 
 def test_spreadsheet_local_preview_mode():
@@ -22,30 +65,105 @@ def test_spreadsheet_requires_credentials():
         Spreadsheet(spreadsheet_name='Test')
 
 
+def test_spreadsheet_and_worksheet_use_slots():
+    """Spreadsheet and Worksheet store attributes in slots, not a __dict__."""
+    ss = Spreadsheet(local_preview=True, spreadsheet_name='Test')
+
+    ws = ss.worksheet('Sheet1')
+
+    assert not hasattr(ss, '__dict__')
+    assert not hasattr(ws, '__dict__')
+
+
 def test_spreadsheet_context_manager():
     """Spreadsheet works as context manager."""
     with Spreadsheet(local_preview=True, spreadsheet_name='Test') as ss:
         assert ss.is_local_preview is True
 
 
-def test_spreadsheet_init_with_credentials():
+def test_spreadsheet_init_with_credentials(mock_service_account):
     """Spreadsheet initializes with mocked gspread connection."""
-    with patch(
-        'eftoolkit.gsheets.core.spreadsheet.service_account_from_dict'
-    ) as mock_sa:
-        mock_gc = MagicMock()
-        mock_spreadsheet = MagicMock()
-        mock_gc.open.return_value = mock_spreadsheet
-        mock_sa.return_value = mock_gc
+    mock_gc = mock_service_account.return_value
+
+    ss = Spreadsheet(
+        credentials={'type': 'service_account'},
+        spreadsheet_name='TestSheet',
+    )
+
+    mock_service_account.assert_called_once_with({'type': 'service_account'})
+    mock_gc.open.assert_called_once_with('TestSheet')
+    assert ss._gspread_spreadsheet == mock_gc.open.return_value
+
+
+def test_spreadsheet_init_mounts_transport_retry_adapter(mock_service_account):
+    """The gspread session gets a pooled adapter that retries connect errors."""
+    mock_gc = mock_service_account.return_value
+
+    Spreadsheet(
+        credentials={'type': 'service_account'},
+        spreadsheet_name='TestSheet',
+        max_retries=3,
+    )
+
+    prefix, adapter = mock_gc.http_client.session.mount.call_args[0]
+    assert prefix == 'https://'
+    assert adapter.max_retries.total == 3
+    assert adapter.max_retries.read == 0
+    assert adapter._pool_maxsize == 20
+
+
+def test_spreadsheet_reuses_client_for_same_credentials(mock_service_account):
+    """Spreadsheets opened with the same credentials share one gspread client."""
+    mock_gc = mock_service_account.return_value
 
-        ss = Spreadsheet(
-            credentials={'type': 'service_account'},
-            spreadsheet_name='TestSheet',
-        )
+    Spreadsheet(credentials={'type': 'service_account'}, spreadsheet_name='A')
+    Spreadsheet(credentials={'type': 'service_account'}, spreadsheet_name='B')
 
-        mock_sa.assert_called_once_with({'type': 'service_account'})
-        mock_gc.open.assert_called_once_with('TestSheet')
-        assert ss._gspread_spreadsheet == mock_spreadsheet
+    mock_service_account.assert_called_once()
+    mock_gc.http_client.session.mount.assert_called_once()
+    assert [c.args for c in mock_gc.open.call_args_list] == [('A',), ('B',)]
+
+
+def test_spreadsheet_new_client_for_different_credentials(mock_service_account):
+    """Different credentials or retry settings get their own client."""
+    Spreadsheet(credentials={'client_email': 'a'}, spreadsheet_name='A')
+    Spreadsheet(credentials={'client_email': 'b'}, spreadsheet_name='A')
+    Spreadsheet(credentials={'client_email': 'a'}, spreadsheet_name='A', max_retries=1)
+
+    assert mock_service_account.call_count == 3
+
+
+def test_spreadsheet_client_cache_evicts_least_recently_used(mock_service_account):
+    """Only the MAX_CACHED_CLIENTS most recently used clients are kept."""
+    for i in range(MAX_CACHED_CLIENTS + 1):
+        Spreadsheet(credentials={'client_email': f'lru{i}'}, spreadsheet_name='A')
+    Spreadsheet(credentials={'client_email': 'lru0'}, spreadsheet_name='A')
+    Spreadsheet(
+        credentials={'client_email': f'lru{MAX_CACHED_CLIENTS}'},
+        spreadsheet_name='A',
+    )
+
+    # lru0 was evicted and re-authorized; the newest entry was still cached
+    assert mock_service_account.call_count == MAX_CACHED_CLIENTS + 2
+
+
+def test_spreadsheet_client_cache_keys_hold_no_credentials(mock_service_account):
+    """Cached clients are keyed on a digest, not the raw credentials."""
+    Spreadsheet(credentials={'private_key': 'digest-secret'}, spreadsheet_name='A')
+
+    assert len(_client_cache) == 1
+    assert 'digest-secret' not in repr(list(_client_cache))
+
+
+def test_spreadsheet_clear_client_cache(mock_service_account):
+    """clear_client_cache() makes the next Spreadsheet authorize again."""
+    credentials = {'client_email': 'cleared'}
+
+    Spreadsheet(credentials=credentials, spreadsheet_name='A')
+    Spreadsheet.clear_client_cache()
+    Spreadsheet(credentials=credentials, spreadsheet_name='A')
+
+    assert mock_service_account.call_count == 2
 
 
 def test_spreadsheet_worksheet_local_preview():
@@ -70,21 +188,46 @@ def test_spreadsheet_worksheet_local_preview_returns_cached():
 
 def test_spreadsheet_worksheet_returns_worksheet():
     """worksheet() returns Worksheet wrapping gspread worksheet."""
-    mock_gspread = MagicMock()
-    mock_ws = MagicMock()
-    mock_ws.title = 'Sheet1'
-    mock_gspread.worksheet.return_value = mock_ws
-
-    ss = Spreadsheet(local_preview=True, spreadsheet_name='Test')
-    ss._local_preview = False
-    ss._gspread_spreadsheet = mock_gspread
+    fake = FakeGspreadSpreadsheet('Sheet1')
+    ss = _connected_spreadsheet(fake)
 
     ws = ss.worksheet('Sheet1')
 
-    assert ws._ws == mock_ws
+    assert ws._ws is fake.tabs[0]
     assert ws.title == 'Sheet1'
 
 
+def test_spreadsheet_worksheet_raises_when_missing():
+    """worksheet() raises WorksheetNotFound for an unknown title."""
+    ss = _connected_spreadsheet(FakeGspreadSpreadsheet())
+
+    with pytest.raises(WorksheetNotFound):
+        ss.worksheet('Missing')
+
+
+def test_spreadsheet_worksheet_metadata_fetched_once():
+    """Opening several tabs lists the spreadsheet's worksheets only once."""
+    fake = FakeGspreadSpreadsheet('Sheet1', 'Sheet2')
+    ss = _connected_spreadsheet(fake)
+
+    ss.worksheet('Sheet1')
+    ss.worksheet('Sheet2')
+    names = ss.get_worksheet_names()
+
+    assert names == ['Sheet1', 'Sheet2']
+    assert fake.calls == [('worksheets',)]
+
+
+def test_spreadsheet_worksheet_metadata_refreshed_after_create():
+    """create_worksheet() invalidates the cached worksheet listing."""
+    ss = _connected_spreadsheet(FakeGspreadSpreadsheet('Sheet1'))
+
+    assert ss.get_worksheet_names() == ['Sheet1']
+    ss.create_worksheet('New')
+
+    assert ss.get_worksheet_names() == ['Sheet1', 'New']
+
+
 def test_spreadsheet_get_worksheet_names_local_preview():
     """get_worksheet_names() returns empty list in local preview mode."""
     ss = Spreadsheet(local_preview=True, spreadsheet_name='Test')
@@ -96,16 +239,7 @@ def test_spreadsheet_get_worksheet_names_local_preview():
 
 def test_spreadsheet_get_worksheet_names_returns_titles():
     """get_worksheet_names() returns list of worksheet titles."""
-    mock_gspread = MagicMock()
-    mock_ws1 = MagicMock()
-    mock_ws1.title = 'Sheet1'
-    mock_ws2 = MagicMock()
-    mock_ws2.title = 'Sheet2'
-    mock_gspread.worksheets.return_value = [mock_ws1, mock_ws2]
-
-    ss = Spreadsheet(local_preview=True, spreadsheet_name='Test')
-    ss._local_preview = False
-    ss._gspread_spreadsheet = mock_gspread
+    ss = _connected_spreadsheet(FakeGspreadSpreadsheet('Sheet1', 'Sheet2'))
 
     result = ss.get_worksheet_names()
 
@@ -134,39 +268,27 @@ def test_spreadsheet_create_worksheet_local_preview_returns_cached():
 
 def test_spreadsheet_create_worksheet_without_replace():
     """create_worksheet without replace creates worksheet directly."""
-    mock_gspread = MagicMock()
-    mock_ws = MagicMock()
-    mock_ws.title = 'NewSheet'
-    mock_gspread.add_worksheet.return_value = mock_ws
-
-    ss = Spreadsheet(local_preview=True, spreadsheet_name='Test')
-    ss._local_preview = False
-    ss._gspread_spreadsheet = mock_gspread
+    fake = FakeGspreadSpreadsheet()
+    ss = _connected_spreadsheet(fake)
 
     ws = ss.create_worksheet('NewSheet', replace=False)
 
-    mock_gspread.del_worksheet.assert_not_called()
-    mock_gspread.add_worksheet.assert_called_once_with(
-        title='NewSheet', rows=1000, cols=26
-    )
-    assert ws._ws == mock_ws
+    assert fake.calls == [('add_worksheet', 'NewSheet', 1000, 26)]
+    assert ws._ws is fake.tabs[0]
 
 
 def test_spreadsheet_create_worksheet_with_replace():
     """create_worksheet with replace=True deletes existing first."""
-    mock_gspread = MagicMock()
-    mock_ws = MagicMock()
-    mock_gspread.worksheet.return_value = mock_ws
-    mock_gspread.add_worksheet.return_value = MagicMock(title='NewSheet')
-
-    ss = Spreadsheet(local_preview=True, spreadsheet_name='Test')
-    ss._local_preview = False
-    ss._gspread_spreadsheet = mock_gspread
+    fake = FakeGspreadSpreadsheet('NewSheet')
+    old_ws = fake.tabs[0]
+    ss = _connected_spreadsheet(fake)
 
     ss.create_worksheet('NewSheet', replace=True)
 
-    mock_gspread.del_worksheet.assert_called_once_with(mock_ws)
-    mock_gspread.add_worksheet.assert_called_once()
+    assert [call for call in fake.calls if call[0] != 'worksheets'] == [
+        ('del_worksheet', old_ws),
+        ('add_worksheet', 'NewSheet', 1000, 26),
+    ]
 
 
 def test_spreadsheet_delete_worksheet_local_preview():
@@ -179,41 +301,29 @@ def test_spreadsheet_delete_worksheet_local_preview():
 
 def test_spreadsheet_delete_worksheet_success():
     """delete_worksheet deletes existing worksheet."""
-    mock_gspread = MagicMock()
-    mock_ws = MagicMock()
-    mock_gspread.worksheet.return_value = mock_ws
-
-    ss = Spreadsheet(local_preview=True, spreadsheet_name='Test')
-    ss._local_preview = False
-    ss._gspread_spreadsheet = mock_gspread
+    fake = FakeGspreadSpreadsheet('Sheet1')
+    ws = fake.tabs[0]
+    ss = _connected_spreadsheet(fake)
 
     ss.delete_worksheet('Sheet1')
 
-    mock_gspread.worksheet.assert_called_once_with('Sheet1')
-    mock_gspread.del_worksheet.assert_called_once_with(mock_ws)
+    assert fake.calls == [('worksheets',), ('del_worksheet', ws)]
 
 
 def test_spreadsheet_delete_worksheet_ignore_missing():
     """delete_worksheet with ignore_missing=True doesn't raise."""
-    mock_gspread = MagicMock()
-    mock_gspread.worksheet.side_effect = WorksheetNotFound('Sheet1')
-
-    ss = Spreadsheet(local_preview=True, spreadsheet_name='Test')
-    ss._local_preview = False
-    ss._gspread_spreadsheet = mock_gspread
+    fake = FakeGspreadSpreadsheet()
+    ss = _connected_spreadsheet(fake)
 
     # Should not raise
     ss.delete_worksheet('Sheet1', ignore_missing=True)
 
+    assert fake.calls == [('worksheets',)]
+
 
 def test_spreadsheet_delete_worksheet_raises_when_not_ignoring():
     """delete_worksheet with ignore_missing=False raises WorksheetNotFound."""
-    mock_gspread = MagicMock()
-    mock_gspread.worksheet.side_effect = WorksheetNotFound('Sheet1')
-
-    ss = Spreadsheet(local_preview=True, spreadsheet_name='Test')
-    ss._local_preview = False
-    ss._gspread_spreadsheet = mock_gspread
+    ss = _connected_spreadsheet(FakeGspreadSpreadsheet())
 
     with pytest.raises(WorksheetNotFound):
         ss.delete_worksheet('Sheet1', ignore_missing=False)
@@ -231,16 +341,17 @@ def test_preview_path_sanitizes_names():
     assert ' ' not in path.name
 
 
-def test_spreadsheet_context_manager_flushes_worksheets(tmp_path):
+def test_spreadsheet_context_manager_flushes_worksheets(tmp_path, monkeypatch):
     """Spreadsheet context manager flushes all accessed worksheets on exit."""
-    with patch('webbrowser.open'):  # Suppress browser opening
-        with Spreadsheet(
-            local_preview=True, spreadsheet_name='Test', preview_dir=str(tmp_path)
-        ) as ss:
-            ws1 = ss.worksheet('Sheet1')
-            ws1.write_values('A1', [['data1']])
-            ws2 = ss.worksheet('Sheet2')
-            ws2.write_values('A1', [['data2']])
+    monkeypatch.setattr('webbrowser.open', lambda url: None)
+
+    with Spreadsheet(
+        local_preview=True, spreadsheet_name='Test', preview_dir=str(tmp_path)
+    ) as ss:
+        ws1 = ss.worksheet('Sheet1')
+        ws1.write_values('A1', [['data1']])
+        ws2 = ss.worksheet('Sheet2')
+        ws2.write_values('A1', [['data2']])
 
     # Both worksheets should have been flushed (queues cleared)
     assert len(ws1._value_updates) == 0
@@ -254,6 +365,7 @@ def test_spreadsheet_context_manager_flushes_worksheets(tmp_path):
 def test_spreadsheet_context_manager_no_flush_on_error():
     """Spreadsheet context manager does not flush worksheets on exception."""
     ss = Spreadsheet(local_preview=True, spreadsheet_name='Test')
+
     try:
         with ss:
             ws = ss.worksheet('Sheet1')
@@ -266,74 +378,68 @@ def test_spreadsheet_context_manager_no_flush_on_error():
     assert len(ws._value_updates) == 1
 
 
-def test_spreadsheet_context_manager_flush_is_idempotent(tmp_path):
+def test_spreadsheet_context_manager_flush_is_idempotent(tmp_path, monkeypatch):
     """Flushing via worksheet then spreadsheet context is idempotent."""
-    with patch('webbrowser.open'):  # Suppress browser opening
-        with Spreadsheet(
-            local_preview=True, spreadsheet_name='Test', preview_dir=str(tmp_path)
-        ) as ss:
-            with ss.worksheet('Sheet1') as ws:
-                ws.write_values('A1', [['data']])
-            # ws already flushed here
+    monkeypatch.setattr('webbrowser.open', lambda url: None)
+
+    with Spreadsheet(
+        local_preview=True, spreadsheet_name='Test', preview_dir=str(tmp_path)
+    ) as ss:
+        with ss.worksheet('Sheet1') as ws:
+            ws.write_values('A1', [['data']])
+        # ws already flushed here
 
     # Should not raise, and still have one HTML file
     html_files = list(tmp_path.glob('*.html'))
     assert len(html_files) == 1
 
 
-def test_spreadsheet_context_manager_opens_previews_in_local_mode(tmp_path):
+def test_spreadsheet_context_manager_opens_previews_in_local_mode(
+    tmp_path, monkeypatch
+):
     """Spreadsheet context manager opens previews in browser in local_preview mode."""
-    with patch('webbrowser.open') as mock_open:
-        with Spreadsheet(
-            local_preview=True, spreadsheet_name='Test', preview_dir=str(tmp_path)
-        ) as ss:
-            ss.worksheet('Sheet1').write_values('A1', [['data1']])
-            ss.worksheet('Sheet2').write_values('A1', [['data2']])
+    opened = []
+    monkeypatch.setattr('webbrowser.open', opened.append)
+
+    with Spreadsheet(
+        local_preview=True, spreadsheet_name='Test', preview_dir=str(tmp_path)
+    ) as ss:
+        ss.worksheet('Sheet1').write_values('A1', [['data1']])
+        ss.worksheet('Sheet2').write_values('A1', [['data2']])
 
     # Should have opened browser for both worksheets
-    assert mock_open.call_count == 2
+    assert len(opened) == 2
 
 
-def test_spreadsheet_context_manager_no_preview_in_normal_mode():
+def test_spreadsheet_context_manager_no_preview_in_normal_mode(
+    mock_service_account, monkeypatch
+):
     """Spreadsheet context manager does not open browser in normal mode."""
-    with patch(
-        'eftoolkit.gsheets.core.spreadsheet.service_account_from_dict'
-    ) as mock_sa:
-        mock_gc = MagicMock()
-        mock_spreadsheet = MagicMock()
-        mock_gc.open.return_value = mock_spreadsheet
-        mock_sa.return_value = mock_gc
-
-        with patch('webbrowser.open') as mock_open:
-            with Spreadsheet(
-                credentials={'type': 'service_account'},
-                spreadsheet_name='Test',
-            ):
-                pass
-
-        # Should not have opened browser
-        mock_open.assert_not_called()
-
-
-def test_spreadsheet_open_all_previews_raises_in_normal_mode():
-    """open_all_previews() raises RuntimeError when not in preview mode."""
-    with patch(
-        'eftoolkit.gsheets.core.spreadsheet.service_account_from_dict'
-    ) as mock_sa:
-        mock_gc = MagicMock()
-        mock_gc.open.return_value = MagicMock()
-        mock_sa.return_value = mock_gc
+    opened = []
+    monkeypatch.setattr('webbrowser.open', opened.append)
 
-        ss = Spreadsheet(
-            credentials={'type': 'service_account'},
-            spreadsheet_name='Test',
-        )
+    with Spreadsheet(
+        credentials={'type': 'service_account'},
+        spreadsheet_name='Test',
+    ):
+        pass
+
+    # Should not have opened browser
+    assert opened == []
+
+
+def test_spreadsheet_open_all_previews_raises_in_normal_mode(mock_service_account):
+    """open_all_previews() raises RuntimeError when not in preview mode."""
+    ss = Spreadsheet(
+        credentials={'type': 'service_account'},
+        spreadsheet_name='Test',
+    )
 
-        with pytest.raises(RuntimeError, match='local_preview mode'):
-            ss.open_all_previews()
+    with pytest.raises(RuntimeError, match='local_preview mode'):
+        ss.open_all_previews()
 
 
-def test_spreadsheet_open_all_previews_opens_browser(tmp_path):
+def test_spreadsheet_open_all_previews_opens_browser(tmp_path, monkeypatch):
     """open_all_previews() opens browser for each worksheet."""
     ss = Spreadsheet(
         local_preview=True, spreadsheet_name='Test', preview_dir=str(tmp_path)
@@ -345,24 +451,18 @@ def test_spreadsheet_open_all_previews_opens_browser(tmp_path):
     ws2.write_values('A1', [['test2']])
     ws2.flush()
 
-    with patch('webbrowser.open') as mock_open:
-        ss.open_all_previews()
+    opened = []
+    monkeypatch.setattr('webbrowser.open', opened.append)
+
+    ss.open_all_previews()
 
-        assert mock_open.call_count == 2
+    assert len(opened) == 2
 
 
 def test_spreadsheet_create_worksheet_with_replace_clears_cache():
     """create_worksheet with replace=True clears cached worksheet."""
-    mock_gspread = MagicMock()
-    mock_ws_old = MagicMock()
-    mock_ws_new = MagicMock()
-    mock_ws_new.title = 'Sheet1'
-    mock_gspread.worksheet.return_value = mock_ws_old
-    mock_gspread.add_worksheet.return_value = mock_ws_new
-
-    ss = Spreadsheet(local_preview=True, spreadsheet_name='Test')
-    ss._local_preview = False
-    ss._gspread_spreadsheet = mock_gspread
+    fake = FakeGspreadSpreadsheet('Sheet1')
+    ss = _connected_spreadsheet(fake)
 
     # First, access the worksheet to cache it
     ss.worksheet('Sheet1')
@@ -372,7 +472,7 @@ def test_spreadsheet_create_worksheet_with_replace_clears_cache():
     ws2 = ss.create_worksheet('Sheet1', replace=True)
 
     # Should be a different instance
-    assert ws2._ws == mock_ws_new
+    assert ws2._ws is fake.tabs[-1]
     assert ss._worksheets['Sheet1'] is ws2
 
 
@@ -386,88 +486,41 @@ def test_reorder_worksheets_local_preview():
 
 def test_reorder_worksheets_reorders_to_specified_order():
     """reorder_worksheets() reorders worksheets to match specified order."""
-    mock_gspread = MagicMock()
-    mock_ws1 = MagicMock()
-    mock_ws1.title = 'Alpha'
-    mock_ws2 = MagicMock()
-    mock_ws2.title = 'Beta'
-    mock_ws3 = MagicMock()
-    mock_ws3.title = 'Gamma'
-    mock_gspread.worksheets.return_value = [mock_ws1, mock_ws2, mock_ws3]
-
-    ss = Spreadsheet(local_preview=True, spreadsheet_name='Test')
-    ss._local_preview = False
-    ss._gspread_spreadsheet = mock_gspread
+    fake = FakeGspreadSpreadsheet('Alpha', 'Beta', 'Gamma')
+    ss = _connected_spreadsheet(fake)
 
     ss.reorder_worksheets(['Gamma', 'Alpha', 'Beta'])
 
-    mock_gspread.reorder_worksheets.assert_called_once()
-    call_args = mock_gspread.reorder_worksheets.call_args[0][0]
-
-    assert [ws.title for ws in call_args] == ['Gamma', 'Alpha', 'Beta']
+    assert fake.reordered_titles() == ['Gamma', 'Alpha', 'Beta']
 
 
 def test_reorder_worksheets_unspecified_tabs_at_end():
     """reorder_worksheets() moves unspecified tabs to end in original order."""
-    mock_gspread = MagicMock()
-    mock_ws1 = MagicMock()
-    mock_ws1.title = 'Alpha'
-    mock_ws2 = MagicMock()
-    mock_ws2.title = 'Beta'
-    mock_ws3 = MagicMock()
-    mock_ws3.title = 'Gamma'
-    mock_ws4 = MagicMock()
-    mock_ws4.title = 'Delta'
-    mock_gspread.worksheets.return_value = [mock_ws1, mock_ws2, mock_ws3, mock_ws4]
-
-    ss = Spreadsheet(local_preview=True, spreadsheet_name='Test')
-    ss._local_preview = False
-    ss._gspread_spreadsheet = mock_gspread
+    fake = FakeGspreadSpreadsheet('Alpha', 'Beta', 'Gamma', 'Delta')
+    ss = _connected_spreadsheet(fake)
 
     # Only specify Gamma and Alpha, Beta and Delta should follow in original order
     ss.reorder_worksheets(['Gamma', 'Alpha'])
 
-    call_args = mock_gspread.reorder_worksheets.call_args[0][0]
-
-    assert [ws.title for ws in call_args] == ['Gamma', 'Alpha', 'Beta', 'Delta']
+    assert fake.reordered_titles() == ['Gamma', 'Alpha', 'Beta', 'Delta']
 
 
 def test_reorder_worksheets_skips_missing_tabs():
     """reorder_worksheets() skips tabs that don't exist."""
-    mock_gspread = MagicMock()
-    mock_ws1 = MagicMock()
-    mock_ws1.title = 'Alpha'
-    mock_ws2 = MagicMock()
-    mock_ws2.title = 'Beta'
-    mock_gspread.worksheets.return_value = [mock_ws1, mock_ws2]
-
-    ss = Spreadsheet(local_preview=True, spreadsheet_name='Test')
-    ss._local_preview = False
-    ss._gspread_spreadsheet = mock_gspread
+    fake = FakeGspreadSpreadsheet('Alpha', 'Beta')
+    ss = _connected_spreadsheet(fake)
 
     # 'Missing' doesn't exist, should be skipped
     ss.reorder_worksheets(['Missing', 'Beta', 'Alpha'])
 
-    call_args = mock_gspread.reorder_worksheets.call_args[0][0]
-
-    assert [ws.title for ws in call_args] == ['Beta', 'Alpha']
+    assert fake.reordered_titles() == ['Beta', 'Alpha']
 
 
 def test_reorder_worksheets_empty_order_preserves_original():
     """reorder_worksheets() with empty list preserves original order."""
-    mock_gspread = MagicMock()
-    mock_ws1 = MagicMock()
-    mock_ws1.title = 'Alpha'
-    mock_ws2 = MagicMock()
-    mock_ws2.title = 'Beta'
-    mock_gspread.worksheets.return_value = [mock_ws1, mock_ws2]
-
-    ss = Spreadsheet(local_preview=True, spreadsheet_name='Test')
-    ss._local_preview = False
-    ss._gspread_spreadsheet = mock_gspread
+    fake = FakeGspreadSpreadsheet('Alpha', 'Beta')
+    ss = _connected_spreadsheet(fake)
 
     ss.reorder_worksheets([])
 
-    call_args = mock_gspread.reorder_worksheets.call_args[0][0]
-
-    assert [ws.title for ws in call_args] == ['Alpha', 'Beta']
+    assert fake.reordered_titles() == ['Alpha', 'Beta']
@@ -4,6 +4,7 @@ import json
 
 import pytest
 
+import eftoolkit.gsheets.utils as utils
 from eftoolkit.gsheets.utils import _strip_comments, load_json_config, remove_comments
 
 
@@ -321,6 +322,22 @@ def test_load_json_config_strip_comment_keys_nested(tmp_path):
     assert result == {'setting': 'value', 'nested': {'key': 'nested_value'}}
 
 
+def test_load_json_config_strip_comment_keys_matches_remove_comments(tmp_path):
+    """Parse-time stripping gives the same result as remove_comments."""
+    raw = {
+        '_comment': 'top',
+        'items': [{'_comment_1': 'x', 'a': 1}, [{'_comment': 'y', 'b': 2}]],
+        '_private': {'_comment': 'z', 'c': 3},
+    }
+    config_file = tmp_path / 'config.json'
+    config_file.write_text(json.dumps(raw))
+
+    result = load_json_config(config_file, strip_comment_keys=True)
+
+    assert result == remove_comments(raw)
+    assert result == {'items': [{'a': 1}, [{'b': 2}]], '_private': {'c': 3}}
+
+
 def test_load_json_config_strip_comment_keys_with_jsonc_comments(tmp_path):
     """load_json_config strips both JSONC comments and _comment keys."""
     config_file = tmp_path / 'config.jsonc'
@@ -343,3 +360,33 @@ def test_load_json_config_strip_comment_keys_explicit_false(tmp_path):
     result = load_json_config(config_file, strip_comment_keys=False)
 
     assert result == {'_comment': 'preserved', 'key': 'value'}
+
+
+def test_load_json_config_caches_stripped_content(tmp_path, monkeypatch):
+    """Repeated loads of an unchanged file skip the comment scan."""
+    config_file = tmp_path / 'cached.json'
+    config_file.write_text('{"key": "value"} // comment')
+    calls = []
+    real_strip = utils._strip_comments
+    monkeypatch.setattr(
+        utils, '_strip_comments', lambda c: calls.append(c) or real_strip(c)
+    )
+
+    first = load_json_config(config_file)
+    second = load_json_config(config_file)
+
+    assert len(calls) == 1
+    assert first == second == {'key': 'value'}
+    first['key'] = 'mutated'
+    assert load_json_config(config_file) == {'key': 'value'}
+
+
+def test_load_json_config_rereads_modified_file(tmp_path):
+    """Editing the file invalidates the cached content."""
+    config_file = tmp_path / 'edited.json'
+    config_file.write_text('{"key": "old"}')
+    assert load_json_config(config_file) == {'key': 'old'}
+
+    config_file.write_text('{"key": "newer"}')
+
+    assert load_json_config(config_file) == {'key': 'newer'}
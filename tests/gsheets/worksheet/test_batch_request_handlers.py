@@ -7,7 +7,7 @@ Google Sheets API batchUpdate reference:
 https://developers.google.com/sheets/api/reference/rest/v4/spreadsheets/request
 """
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -67,6 +67,24 @@ def test_set_column_width_with_number_calls_batch_update():
     assert request['updateDimensionProperties']['properties']['pixelSize'] == 150
 
 
+def test_set_column_widths_sends_one_batch_update():
+    """set_column_widths sends every width in a single batchUpdate."""
+    ws, mock_gspread, mock_ws = _create_mock_worksheet_with_api()
+
+    ws.set_column_widths({'A': 100, 'B': 90, 7: 80})
+    ws.flush()
+
+    mock_gspread.batch_update.assert_called_once()
+    requests = mock_gspread.batch_update.call_args[0][0]['requests']
+    assert [
+        (
+            r['updateDimensionProperties']['range']['startIndex'],
+            r['updateDimensionProperties']['properties']['pixelSize'],
+        )
+        for r in requests
+    ] == [(0, 100), (1, 90), (6, 80)]
+
+
 def test_set_column_width_uses_worksheet_id():
     """set_column_width includes the correct worksheet ID."""
     ws, mock_gspread, mock_ws = _create_mock_worksheet_with_api()
@@ -202,18 +220,26 @@ def test_unmerge_cells_calls_batch_update():
     assert 'unmergeCells' in request
 
 
-def test_set_notes_calls_update_note():
-    """set_notes queues request that calls update_note on worksheet."""
+def test_set_notes_calls_batch_update():
+    """set_notes queues one updateCells request per note."""
     ws, mock_gspread, mock_ws = _create_mock_worksheet_with_api()
 
     ws.set_notes({'A1': 'Note 1', 'B2': 'Note 2'})
     ws.flush()
 
-    assert mock_ws.update_note.call_count == 2
-    calls = [call[0] for call in mock_ws.update_note.call_args_list]
+    mock_gspread.batch_update.assert_called_once()
+    requests = mock_gspread.batch_update.call_args[0][0]['requests']
 
-    assert ('A1', 'Note 1') in calls
-    assert ('B2', 'Note 2') in calls
+    assert len(requests) == 2
+    first, second = (r['updateCells'] for r in requests)
+    assert first['fields'] == 'note'
+    assert first['rows'] == [{'values': [{'note': 'Note 1'}]}]
+    assert first['range']['startRowIndex'] == 0
+    assert first['range']['startColumnIndex'] == 0
+    assert second['rows'] == [{'values': [{'note': 'Note 2'}]}]
+    assert second['range']['startRowIndex'] == 1
+    assert second['range']['startColumnIndex'] == 1
+    mock_ws.update_note.assert_not_called()
 
 
 def test_sort_range_calls_batch_update():
@@ -443,8 +469,8 @@ def test_unknown_request_type_raises_value_error():
         ws.flush()
 
 
-def test_multiple_batch_requests_all_executed():
-    """Multiple batch requests of different types are all executed."""
+def test_multiple_batch_requests_sent_in_single_batch_update():
+    """Multiple batch requests of different types share one batch_update call."""
     ws, mock_gspread, mock_ws = _create_mock_worksheet_with_api()
 
     ws.set_column_width('A', 100)
@@ -452,20 +478,65 @@ def test_multiple_batch_requests_all_executed():
     ws.freeze_rows(1)
     ws.flush()
 
-    # batch_update should be called 3 times (once per request)
-    assert mock_gspread.batch_update.call_count == 3
+    mock_gspread.batch_update.assert_called_once()
+    requests = mock_gspread.batch_update.call_args[0][0]['requests']
+
+    # Requests preserve queue order
+    assert [next(iter(r)) for r in requests] == [
+        'updateDimensionProperties',
+        'autoResizeDimensions',
+        'updateSheetProperties',
+    ]
 
 
 def test_format_and_column_width_both_executed():
     """Both format and column_width requests execute correctly."""
     ws, mock_gspread, mock_ws = _create_mock_worksheet_with_api()
 
-    ws.format_range('A1', {'bold': True})
+    ws.format_range('A1:B2', {'textFormat': {'bold': True}})
     ws.set_column_width('A', 200)
     ws.flush()
 
-    mock_ws.format.assert_called_once_with('A1', {'bold': True})
     mock_gspread.batch_update.assert_called_once()
+    requests = mock_gspread.batch_update.call_args[0][0]['requests']
+
+    assert len(requests) == 2
+    repeat_cell = requests[0]['repeatCell']
+    assert repeat_cell['range'] == {
+        'sheetId': 12345,
+        'startRowIndex': 0,
+        'endRowIndex': 2,
+        'startColumnIndex': 0,
+        'endColumnIndex': 2,
+    }
+    assert repeat_cell['cell'] == {'userEnteredFormat': {'textFormat': {'bold': True}}}
+    assert repeat_cell['fields'] == 'userEnteredFormat(textFormat)'
+    assert 'updateDimensionProperties' in requests[1]
+    mock_ws.format.assert_not_called()
+
+
+def test_no_batch_update_when_no_batch_requests():
+    """flush() skips batch_update when only values are queued."""
+    ws, mock_gspread, mock_ws = _create_mock_worksheet_with_api()
+
+    ws.write_values('A1', [[1]])
+    ws.flush()
+
+    mock_gspread.values_batch_update.assert_called_once()
+    mock_gspread.batch_update.assert_not_called()
+
+
+def test_unknown_request_type_sends_nothing():
+    """Unknown request type raises before any batch_update is sent."""
+    ws, mock_gspread, mock_ws = _create_mock_worksheet_with_api()
+
+    ws.set_column_width('A', 100)
+    ws._batch_requests.append({'type': 'unknown_type'})
+
+    with pytest.raises(ValueError, match='Unknown batch request type'):
+        ws.flush()
+
+    mock_gspread.batch_update.assert_not_called()
 
 
 def test_context_manager_flushes_column_width():
@@ -556,3 +627,119 @@ def test_read_range_returns_2d_list_for_multiple_columns():
     result = ws.read_range('A1:B2')
 
     assert result == [['a', 'b'], ['c', 'd']]
+
+
+def test_read_ranges_uses_single_batch_get():
+    """read_ranges reads every range with one gspread batch_get call."""
+    ws, mock_gspread, mock_ws = _create_mock_worksheet_with_api()
+
+    mock_ws.batch_get.return_value = [[['$0'], [''], ['$5']], [['a', 'b']]]
+
+    result = ws.read_ranges(['V5:V7', 'A1:B1'])
+
+    mock_ws.batch_get.assert_called_once_with(['V5:V7', 'A1:B1'])
+    mock_ws.acell.assert_not_called()
+    mock_ws.get.assert_not_called()
+    assert result == [[['$0'], [''], ['$5']], [['a', 'b']]]
+
+
+def test_grid_range_parse_is_cached_per_range():
+    """Repeated requests on the same range parse A1 notation only once."""
+    ws, mock_gspread, mock_ws = _create_mock_worksheet_with_api()
+
+    with patch.object(
+        Worksheet,
+        '_build_grid_range',
+        autospec=True,
+        side_effect=Worksheet._build_grid_range,
+    ) as mock_build:
+        ws.format_range('A1:C3', {'bold': True})
+        ws.set_borders('A1:C3', {'top': {'style': 'SOLID'}})
+        ws.merge_cells('A1:C3')
+        ws.flush()
+
+    mock_build.assert_called_once_with(ws, 'A1:C3')
+    requests = mock_gspread.batch_update.call_args[0][0]['requests']
+    ranges = [
+        requests[0]['repeatCell']['range'],
+        requests[1]['updateBorders']['range'],
+        requests[2]['mergeCells']['range'],
+    ]
+
+    # Equal values but independent dicts
+    assert ranges[0] == ranges[1] == ranges[2]
+    assert ranges[0] is not ranges[1]
+
+
+def _sent_requests(mock_gspread):
+    """Return the 'requests' list sent to batch_update."""
+    return mock_gspread.batch_update.call_args[0][0]['requests']
+
+
+def test_identical_format_requests_are_sent_once():
+    """Repeating the same format call only sends one repeatCell."""
+    ws, mock_gspread, mock_ws = _create_mock_worksheet_with_api()
+
+    for _ in range(5):
+        ws.format_range('A1:B2', {'bold': True})
+    ws.flush()
+
+    assert len(_sent_requests(mock_gspread)) == 1
+
+
+def test_different_formats_on_same_range_are_all_sent():
+    """Formats setting different fields on one range are not collapsed."""
+    ws, mock_gspread, mock_ws = _create_mock_worksheet_with_api()
+
+    ws.format_range('A1', {'bold': True})
+    ws.format_range('A1', {'italic': True})
+    ws.flush()
+
+    assert len(_sent_requests(mock_gspread)) == 2
+
+
+def test_repeated_format_keeps_last_position():
+    """A deduplicated request stays after anything queued between repeats."""
+    ws, mock_gspread, mock_ws = _create_mock_worksheet_with_api()
+
+    ws.format_range('A1', {'bold': True})
+    ws.format_range('A1', {'bold': False})
+    ws.format_range('A1', {'bold': True})
+    ws.flush()
+
+    requests = _sent_requests(mock_gspread)
+    assert [r['repeatCell']['cell']['userEnteredFormat'] for r in requests] == [
+        {'bold': False},
+        {'bold': True},
+    ]
+
+
+def test_only_last_freeze_and_column_width_are_sent():
+    """Later freeze and column-width calls supersede earlier ones."""
+    ws, mock_gspread, mock_ws = _create_mock_worksheet_with_api()
+
+    ws.freeze_rows(1)
+    ws.set_column_width('A', 100)
+    ws.freeze_rows(2)
+    ws.set_column_width('A', 150)
+    ws.set_column_width('B', 100)
+    ws.flush()
+
+    requests = _sent_requests(mock_gspread)
+    assert len(requests) == 3
+    freeze = requests[0]['updateSheetProperties']['properties']['gridProperties']
+    assert freeze == {'frozenRowCount': 2}
+    widths = [r['updateDimensionProperties']['properties'] for r in requests[1:]]
+    assert widths == [{'pixelSize': 150}, {'pixelSize': 100}]
+
+
+def test_no_deduplication_across_structural_requests():
+    """Identical requests separated by a row insert are both sent."""
+    ws, mock_gspread, mock_ws = _create_mock_worksheet_with_api()
+
+    ws.format_range('A1', {'bold': True})
+    ws.insert_rows(1, 1)
+    ws.format_range('A1', {'bold': True})
+    ws.flush()
+
+    assert len(_sent_requests(mock_gspread)) == 3
@@ -1,6 +1,6 @@
 """Tests for Worksheet flush, read, and preview functionality."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -65,8 +65,157 @@ def test_worksheet_flush_calls_api():
     mock_gspread.values_batch_update.assert_called_once()
 
 
+def _api_worksheet():
+    """Worksheet wired to a mock gspread spreadsheet, plus that mock."""
+    mock_gspread = MagicMock()
+    mock_ws = MagicMock()
+    mock_ws.title = 'Sheet1'
+
+    ss = Spreadsheet(local_preview=True, spreadsheet_name='Test')
+    ss._local_preview = False
+    ss._gspread_spreadsheet = mock_gspread
+
+    return Worksheet(mock_ws, ss), mock_gspread
+
+
+def _sent_value_data(mock_gspread):
+    """Return the 'data' list sent to values_batch_update."""
+    return mock_gspread.values_batch_update.call_args[0][0]['data']
+
+
+def test_worksheet_flush_merges_vertically_adjacent_writes():
+    """Writes stacked directly below each other are sent as one entry."""
+    ws, mock_gspread = _api_worksheet()
+
+    ws.write_values('A1', [['h1', 'h2']])
+    ws.write_values('A2:B3', [[1, 2], [3, 4]])
+    ws.flush()
+
+    assert _sent_value_data(mock_gspread) == [
+        {'range': 'Sheet1!A1', 'values': [['h1', 'h2'], [1, 2], [3, 4]]}
+    ]
+
+
+def test_worksheet_flush_merges_horizontally_adjacent_writes():
+    """Writes side by side with equal row counts are sent as one entry."""
+    ws, mock_gspread = _api_worksheet()
+
+    ws.write_values('B2', [[1], [2]])
+    ws.write_values('C2', [['a', 'b'], ['c', 'd']])
+    ws.flush()
+
+    assert _sent_value_data(mock_gspread) == [
+        {'range': 'Sheet1!B2', 'values': [[1, 'a', 'b'], [2, 'c', 'd']]}
+    ]
+
+
+def test_worksheet_flush_does_not_merge_non_adjacent_writes():
+    """Writes with a gap between them are sent unchanged."""
+    ws, mock_gspread = _api_worksheet()
+
+    ws.write_values('A1', [[1]])
+    ws.write_values('A3', [[2]])
+    ws.write_values('Other!A2', [[3]])
+    ws.flush()
+
+    assert _sent_value_data(mock_gspread) == [
+        {'range': 'Sheet1!A1', 'values': [[1]]},
+        {'range': 'Sheet1!A3', 'values': [[2]]},
+        {'range': 'Other!A2', 'values': [[3]]},
+    ]
+
+
+def test_worksheet_flush_does_not_merge_formulas():
+    """Writes containing formulas are never merged."""
+    ws, mock_gspread = _api_worksheet()
+
+    ws.write_values('A1', [[1]])
+    ws.write_values('A2', [['=A1*2']])
+    ws.flush()
+
+    assert len(_sent_value_data(mock_gspread)) == 2
+
+
+def test_worksheet_flush_does_not_merge_column_only_ranges():
+    """A write whose range has no row number is never merged."""
+    ws, mock_gspread = _api_worksheet()
+
+    ws.write_values('A1', [[1]])
+    ws.write_values('A:A', [[2]])
+    ws.write_values('A2', [[3]])
+    ws.flush()
+
+    assert _sent_value_data(mock_gspread) == [
+        {'range': 'Sheet1!A1', 'values': [[1]]},
+        {'range': 'Sheet1!A:A', 'values': [[2]]},
+        {'range': 'Sheet1!A2', 'values': [[3]]},
+    ]
+
+
+def test_worksheet_flush_merge_does_not_mutate_queued_values():
+    """Merging builds new lists rather than extending caller data."""
+    ws, mock_gspread = _api_worksheet()
+    first = [[1]]
+
+    ws.write_values('A1', first)
+    ws.write_values('A2', [[2]])
+    ws.flush()
+
+    assert first == [[1]]
+
+
+def test_worksheet_flush_chunks_values_by_cell_limit(monkeypatch):
+    """Value updates are split across calls to stay under CHUNK_CELL_LIMIT."""
+    ws, mock_gspread = _api_worksheet()
+
+    ws.write_values('A1', [[1, 2]])
+    ws.write_values('D1', [[3, 4]])
+    ws.write_values('G1', [[5, 6]])
+    monkeypatch.setattr('eftoolkit.gsheets.core.worksheet.CHUNK_CELL_LIMIT', 4)
+    ws.flush()
+
+    sent = [c[0][0]['data'] for c in mock_gspread.values_batch_update.call_args_list]
+    assert sent == [
+        [
+            {'range': 'Sheet1!A1', 'values': [[1, 2]]},
+            {'range': 'Sheet1!D1', 'values': [[3, 4]]},
+        ],
+        [{'range': 'Sheet1!G1', 'values': [[5, 6]]}],
+    ]
+
+
+def test_worksheet_flush_splits_oversized_update_into_row_ranges(monkeypatch):
+    """A single update over the cell limit is sent as row-range pieces."""
+    ws, mock_gspread = _api_worksheet()
+
+    ws.write_values('B3:C7', [[i, i] for i in range(5)])
+    monkeypatch.setattr('eftoolkit.gsheets.core.worksheet.CHUNK_CELL_LIMIT', 4)
+    ws.flush()
+
+    sent = [c[0][0]['data'] for c in mock_gspread.values_batch_update.call_args_list]
+    assert sent == [
+        [{'range': 'Sheet1!B3', 'values': [[0, 0], [1, 1]]}],
+        [{'range': 'Sheet1!B5', 'values': [[2, 2], [3, 3]]}],
+        [{'range': 'Sheet1!B7', 'values': [[4, 4]]}],
+    ]
+
+
+def test_worksheet_flush_keeps_oversized_column_only_range_whole(monkeypatch):
+    """An oversized update without a start row cannot be split and is sent as-is."""
+    ws, mock_gspread = _api_worksheet()
+
+    ws.write_values('A:C', [[i, i, i] for i in range(3)])
+    monkeypatch.setattr('eftoolkit.gsheets.core.worksheet.CHUNK_CELL_LIMIT', 4)
+    ws.flush()
+
+    sent = [c[0][0]['data'] for c in mock_gspread.values_batch_update.call_args_list]
+    assert sent == [
+        [{'range': 'Sheet1!A:C', 'values': [[0, 0, 0], [1, 1, 1], [2, 2, 2]]}],
+    ]
+
+
 def test_worksheet_flush_with_format_calls_api():
-    """flush() calls format on worksheet when format requests queued."""
+    """flush() sends format requests as repeatCell via batch_update."""
     mock_gspread = MagicMock()
     mock_ws = MagicMock()
     mock_ws.title = 'Sheet1'
@@ -79,7 +228,11 @@ def test_worksheet_flush_with_format_calls_api():
     ws.format_range('A1', {'bold': True})
     ws.flush()
 
-    mock_ws.format.assert_called_once_with('A1', {'bold': True})
+    mock_gspread.batch_update.assert_called_once()
+    request = mock_gspread.batch_update.call_args[0][0]['requests'][0]
+    assert request['repeatCell']['cell'] == {'userEnteredFormat': {'bold': True}}
+    assert request['repeatCell']['fields'] == 'userEnteredFormat(bold)'
+    mock_ws.format.assert_not_called()
 
 
 def test_worksheet_flush_to_api_with_no_ws():
@@ -117,7 +270,7 @@ def test_worksheet_flush_with_non_format_batch_request():
 def test_worksheet_read_returns_dataframe():
     """read() returns DataFrame from worksheet."""
     mock_ws = MagicMock()
-    mock_ws.get_all_values.return_value = [['a', 'b'], [1, 2], [3, 4]]
+    mock_ws.spreadsheet.values_get.return_value = {'values': [['a', 1, 3], ['b', 2, 4]]}
 
     ss = Spreadsheet(local_preview=True, spreadsheet_name='Test')
     ws = Worksheet(mock_ws, ss)
@@ -128,10 +281,55 @@ def test_worksheet_read_returns_dataframe():
     assert len(result) == 2
 
 
+def test_worksheet_read_requests_unformatted_columns():
+    """read() asks for typed, column-major values for the whole sheet."""
+    mock_ws = MagicMock()
+    mock_ws.title = "Bob's Sheet"
+    mock_ws.spreadsheet.values_get.return_value = {'values': [['a', 1]]}
+
+    ss = Spreadsheet(local_preview=True, spreadsheet_name='Test')
+    Worksheet(mock_ws, ss).read()
+
+    range_name = mock_ws.spreadsheet.values_get.call_args[0][0]
+    params = mock_ws.spreadsheet.values_get.call_args[1]['params']
+    assert range_name == "'Bob''s Sheet'"
+    assert params['valueRenderOption'] == 'UNFORMATTED_VALUE'
+    assert params['majorDimension'] == 'COLUMNS'
+
+
+def test_worksheet_read_keeps_types_and_pads_short_columns():
+    """Typed values keep their dtype; trimmed trailing cells become ''."""
+    mock_ws = MagicMock()
+    mock_ws.spreadsheet.values_get.return_value = {
+        'values': [['id', 1, 2, 3], ['score', 1.5], ['name', 'x', '', 'z']]
+    }
+
+    ss = Spreadsheet(local_preview=True, spreadsheet_name='Test')
+    result = Worksheet(mock_ws, ss).read()
+
+    assert list(result.columns) == ['id', 'score', 'name']
+    assert result['id'].tolist() == [1, 2, 3]
+    assert result['id'].dtype == 'int64'
+    assert result['score'].tolist() == [1.5, '', '']
+    assert result['name'].tolist() == ['x', '', 'z']
+
+
+def test_worksheet_read_keeps_duplicate_headers():
+    """Duplicate header names are preserved as separate columns."""
+    mock_ws = MagicMock()
+    mock_ws.spreadsheet.values_get.return_value = {'values': [['a', 1], ['a', 2], []]}
+
+    ss = Spreadsheet(local_preview=True, spreadsheet_name='Test')
+    result = Worksheet(mock_ws, ss).read()
+
+    assert list(result.columns) == ['a', 'a', '']
+    assert result.iloc[0].tolist() == [1, 2, '']
+
+
 def test_worksheet_read_empty_returns_empty_dataframe():
     """read() returns empty DataFrame when worksheet is empty."""
     mock_ws = MagicMock()
-    mock_ws.get_all_values.return_value = []
+    mock_ws.spreadsheet.values_get.return_value = {'range': "'Sheet1'!A1:Z1000"}
 
     ss = Spreadsheet(local_preview=True, spreadsheet_name='Test')
     ws = Worksheet(mock_ws, ss)
@@ -204,7 +402,7 @@ def test_worksheet_open_preview_raises_in_normal_mode():
         ws.open_preview()
 
 
-def test_worksheet_open_preview_opens_browser(tmp_path):
+def test_worksheet_open_preview_opens_browser(tmp_path, monkeypatch):
     """open_preview() opens browser with file path."""
     ss = Spreadsheet(
         local_preview=True, spreadsheet_name='Test', preview_dir=str(tmp_path)
@@ -213,7 +411,10 @@ def test_worksheet_open_preview_opens_browser(tmp_path):
     ws.write_values('A1', [['test']])
     ws.flush()
 
-    with patch('webbrowser.open') as mock_open:
-        ws.open_preview()
-        mock_open.assert_called_once()
-        assert 'file://' in mock_open.call_args[0][0]
+    opened = []
+    monkeypatch.setattr('webbrowser.open', opened.append)
+
+    ws.open_preview()
+
+    assert len(opened) == 1
+    assert opened[0].startswith('file://')
@@ -1,6 +1,7 @@
 """Tests for Worksheet batch operations (queuing methods)."""
 
 import pandas as pd
+import pytest
 
 from eftoolkit.gsheets import Spreadsheet
 
@@ -30,6 +31,39 @@ def test_worksheet_write_dataframe_without_header():
     assert ws._value_updates[0]['values'] == [[1, 3], [2, 4]]
 
 
+def test_worksheet_write_dataframe_converts_missing_to_none():
+    """write_dataframe converts NaN/None/NaT values to None."""
+    ss = Spreadsheet(local_preview=True, spreadsheet_name='Test')
+    ws = ss.worksheet('Sheet1')
+
+    df = pd.DataFrame(
+        {
+            'num': [1.5, float('nan')],
+            'text': ['x', None],
+            'when': pd.to_datetime(['2024-01-15 08:30:00', None]),
+        }
+    )
+    ws.write_dataframe(df)
+
+    assert ws._value_updates[0]['values'] == [
+        ['num', 'text', 'when'],
+        [1.5, 'x', '2024-01-15 08:30:00'],
+        [None, None, None],
+    ]
+
+
+def test_worksheet_write_dataframe_returns_python_scalars():
+    """write_dataframe produces native Python types, not numpy scalars."""
+    ss = Spreadsheet(local_preview=True, spreadsheet_name='Test')
+    ws = ss.worksheet('Sheet1')
+
+    df = pd.DataFrame({'i': [1], 'f': [2.5], 'b': [True]})
+    ws.write_dataframe(df, include_header=False)
+
+    row = ws._value_updates[0]['values'][0]
+    assert [type(v) for v in row] == [int, float, bool]
+
+
 def test_worksheet_write_dataframe_with_format():
     """write_dataframe with format_dict queues format requests."""
     ss = Spreadsheet(local_preview=True, spreadsheet_name='Test')
@@ -349,8 +383,6 @@ def test_worksheet_add_raw_request_queues():
 
 def test_worksheet_read_cell_raises_in_local_preview():
     """read_cell raises NotImplementedError in local preview mode."""
-    import pytest
-
     ss = Spreadsheet(local_preview=True, spreadsheet_name='Test')
     ws = ss.worksheet('Sheet1')
 
@@ -360,10 +392,17 @@ def test_worksheet_read_cell_raises_in_local_preview():
 
 def test_worksheet_read_range_raises_in_local_preview():
     """read_range raises NotImplementedError in local preview mode."""
-    import pytest
-
     ss = Spreadsheet(local_preview=True, spreadsheet_name='Test')
     ws = ss.worksheet('Sheet1')
 
     with pytest.raises(NotImplementedError):
         ws.read_range('V5:V10')
+
+
+def test_worksheet_read_ranges_raises_in_local_preview():
+    """read_ranges raises NotImplementedError in local preview mode."""
+    ss = Spreadsheet(local_preview=True, spreadsheet_name='Test')
+    ws = ss.worksheet('Sheet1')
+
+    with pytest.raises(NotImplementedError):
+        ws.read_ranges(['V5:V10'])
@@ -3,6 +3,7 @@
 import os
 
 from eftoolkit.s3 import S3FileSystem
+from eftoolkit.s3.filesystem import MAX_CACHED_CLIENTS, MAX_READ_WORKERS, _client_cache
 
 
 def test_get_client_returns_boto3_client(mock_s3_bucket):
@@ -67,3 +68,98 @@ def test_get_client_without_region():
     finally:
         os.environ.pop('S3_ACCESS_KEY_ID', None)
         os.environ.pop('S3_SECRET_ACCESS_KEY', None)
+
+
+def test_get_client_is_cached(mock_s3_bucket):
+    """_get_client returns the same client instance on repeated calls."""
+    fs = S3FileSystem(
+        access_key_id='testing',
+        secret_access_key='testing',
+        region='us-east-1',
+    )
+
+    assert fs._get_client() is fs._get_client()
+
+
+def test_get_client_shared_between_instances_with_same_config(mock_s3_bucket):
+    """Instances with the same credentials and endpoint share one client."""
+    kwargs = {
+        'access_key_id': 'testing',
+        'secret_access_key': 'testing',
+        'region': 'us-east-1',
+    }
+
+    assert S3FileSystem(**kwargs)._get_client() is S3FileSystem(**kwargs)._get_client()
+
+
+def test_get_client_not_shared_between_different_configs(mock_s3_bucket):
+    """Different credentials or regions get separate clients."""
+    kwargs = {
+        'access_key_id': 'testing',
+        'secret_access_key': 'testing',
+        'region': 'us-east-1',
+    }
+
+    client = S3FileSystem(**kwargs)._get_client()
+
+    assert S3FileSystem(**{**kwargs, 'region': 'us-west-2'})._get_client() is not client
+    assert (
+        S3FileSystem(**{**kwargs, 'access_key_id': 'other'})._get_client() is not client
+    )
+
+
+def test_get_client_connection_config(mock_s3_bucket):
+    """The client pools enough connections for concurrent reads."""
+    fs = S3FileSystem(
+        access_key_id='testing',
+        secret_access_key='testing',
+        region='us-east-1',
+    )
+
+    config = fs._get_client().meta.config
+
+    assert config.max_pool_connections >= MAX_READ_WORKERS
+    assert config.tcp_keepalive is True
+    assert config.retries['mode'] == 'adaptive'
+
+
+def test_get_client_cache_evicts_least_recently_used(mock_s3_bucket):
+    """Only the MAX_CACHED_CLIENTS most recently used clients are kept."""
+
+    def client_for(key_id):
+        return S3FileSystem(
+            access_key_id=key_id, secret_access_key='testing', region='us-east-1'
+        )._get_client()
+
+    first = client_for('lru0')
+    for i in range(1, MAX_CACHED_CLIENTS + 1):
+        newest = client_for(f'lru{i}')
+
+    assert client_for(f'lru{MAX_CACHED_CLIENTS}') is newest
+    assert client_for('lru0') is not first
+
+
+def test_get_client_cache_keys_hold_no_credentials(mock_s3_bucket):
+    """Shared clients are keyed on a digest, not the raw secret key."""
+    S3FileSystem(
+        access_key_id='testing',
+        secret_access_key='digest-secret',
+        region='us-east-1',
+    )._get_client()
+
+    assert len(_client_cache) == 1
+    assert 'digest-secret' not in repr(list(_client_cache))
+
+
+def test_clear_client_cache(mock_s3_bucket):
+    """clear_client_cache() makes new instances create a fresh client."""
+    kwargs = {
+        'access_key_id': 'testing',
+        'secret_access_key': 'testing',
+        'region': 'us-east-1',
+    }
+    client = S3FileSystem(**kwargs)._get_client()
+
+    S3FileSystem.clear_client_cache()
+
+    assert S3FileSystem(**kwargs)._get_client() is not client
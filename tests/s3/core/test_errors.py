@@ -97,3 +97,21 @@ def test_read_missing_prefix_raises_error(mock_s3_bucket):
         fs.read_df_from_parquet(f's3://{mock_s3_bucket}/error_prefix/nonexistent_dir')
 
     assert 'does not exist' in str(exc_info.value)
+
+
+def test_read_missing_prefix_lists_only_once(mock_s3_bucket):
+    """Missing-prefix detection reuses the listing instead of listing again."""
+    fs = S3FileSystem(
+        access_key_id='testing',
+        secret_access_key='testing',
+        region='us-east-1',
+    )
+    client = fs._get_client()
+
+    with patch.object(
+        client, 'list_objects_v2', wraps=client.list_objects_v2
+    ) as mock_list:
+        with pytest.raises(FileNotFoundError):
+            fs.read_df_from_parquet(f's3://{mock_s3_bucket}/error_prefix/nothing')
+
+    assert mock_list.call_count == 1
@@ -1,5 +1,10 @@
 """Tests for S3FileSystem delete_object method."""
 
+from unittest.mock import MagicMock
+
+import pytest
+
+import eftoolkit.s3.filesystem as filesystem
 from eftoolkit.s3 import S3FileSystem
 
 
@@ -78,3 +83,57 @@ def test_delete_object_nested_path(mock_s3_bucket):
     fs.delete_object(f's3://{mock_s3_bucket}/a/b/c/d/e/file.txt')
 
     assert fs.file_exists(f's3://{mock_s3_bucket}/a/b/c/d/e/file.txt') is False
+
+
+def test_delete_objects_removes_all_in_batches(mock_s3_bucket, monkeypatch):
+    """delete_objects removes every object, batching keys per request."""
+    monkeypatch.setattr(filesystem, 'DELETE_BATCH_SIZE', 2)
+    fs = S3FileSystem(
+        access_key_id='testing',
+        secret_access_key='testing',
+        region='us-east-1',
+    )
+    uris = [f's3://{mock_s3_bucket}/bulk/{i}.txt' for i in range(5)]
+    for uri in uris:
+        fs.put_object(uri, b'data')
+
+    client = fs._get_client()
+    calls = []
+    real_delete_objects = client.delete_objects
+    monkeypatch.setattr(
+        client,
+        'delete_objects',
+        lambda **kwargs: calls.append(kwargs) or real_delete_objects(**kwargs),
+    )
+
+    fs.delete_objects([*uris, f's3://{mock_s3_bucket}/bulk/missing.txt'])
+
+    assert len(calls) == 3
+    assert not any(fs.file_exists(uri) for uri in uris)
+
+
+def test_delete_objects_empty_list_is_noop(mock_s3_bucket):
+    """delete_objects with no URIs makes no requests."""
+    fs = S3FileSystem(
+        access_key_id='testing',
+        secret_access_key='testing',
+        region='us-east-1',
+    )
+
+    fs.delete_objects([])
+
+
+def test_delete_objects_raises_on_reported_errors(mock_s3_bucket):
+    """Per-key errors returned by DeleteObjects are raised."""
+    fs = S3FileSystem(
+        access_key_id='testing',
+        secret_access_key='testing',
+        region='us-east-1',
+    )
+    fs._client = MagicMock()
+    fs._client.delete_objects.return_value = {
+        'Errors': [{'Key': 'locked.txt', 'Code': 'AccessDenied'}]
+    }
+
+    with pytest.raises(RuntimeError, match='s3://bucket/locked.txt'):
+        fs.delete_objects(['s3://bucket/locked.txt'])
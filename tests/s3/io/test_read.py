@@ -93,3 +93,93 @@ def test_read_directory_ignores_non_parquet_files(mock_s3_bucket):
 
     assert len(result) == 2
     pd.testing.assert_frame_equal(result.sort_values('id').reset_index(drop=True), df)
+
+
+def test_read_directory_preserves_listing_order(mock_s3_bucket):
+    """Concurrently-read parts are concatenated in key order."""
+    fs = S3FileSystem(
+        access_key_id='testing',
+        secret_access_key='testing',
+        region='us-east-1',
+    )
+
+    for i in range(20):
+        fs.write_df_to_parquet(
+            pd.DataFrame({'id': [i]}),
+            f's3://{mock_s3_bucket}/read_dir_order/part{i:02d}.parquet',
+        )
+
+    result = fs.read_df_from_parquet(f's3://{mock_s3_bucket}/read_dir_order')
+
+    assert result['id'].tolist() == list(range(20))
+
+
+def test_read_directory_combines_differing_columns(mock_s3_bucket):
+    """Parts with different columns are combined with nulls for gaps."""
+    fs = S3FileSystem(
+        access_key_id='testing',
+        secret_access_key='testing',
+        region='us-east-1',
+    )
+
+    fs.write_df_to_parquet(
+        pd.DataFrame({'id': [1], 'name': ['Alice']}),
+        f's3://{mock_s3_bucket}/read_dir_schema/part1.parquet',
+    )
+    fs.write_df_to_parquet(
+        pd.DataFrame({'id': [2]}),
+        f's3://{mock_s3_bucket}/read_dir_schema/part2.parquet',
+    )
+
+    result = fs.read_df_from_parquet(f's3://{mock_s3_bucket}/read_dir_schema')
+
+    assert result['id'].tolist() == [1, 2]
+    assert result['name'].iloc[0] == 'Alice'
+    assert pd.isna(result['name'].iloc[1])
+
+
+def test_read_directory_widens_differing_column_types(mock_s3_bucket):
+    """An int64 column in one part and float64 in another is read as float64."""
+    fs = S3FileSystem(
+        access_key_id='testing',
+        secret_access_key='testing',
+        region='us-east-1',
+    )
+
+    fs.write_df_to_parquet(
+        pd.DataFrame({'value': [1, 2]}),
+        f's3://{mock_s3_bucket}/read_dir_widen/part1.parquet',
+    )
+    fs.write_df_to_parquet(
+        pd.DataFrame({'value': [2.5]}),
+        f's3://{mock_s3_bucket}/read_dir_widen/part2.parquet',
+    )
+
+    result = fs.read_df_from_parquet(f's3://{mock_s3_bucket}/read_dir_widen')
+
+    assert result['value'].dtype == 'float64'
+    assert result['value'].tolist() == [1.0, 2.0, 2.5]
+
+
+def test_read_directory_resets_stored_indexes(mock_s3_bucket):
+    """Indexes stored by the parts are replaced by a fresh RangeIndex."""
+    fs = S3FileSystem(
+        access_key_id='testing',
+        secret_access_key='testing',
+        region='us-east-1',
+    )
+    # pandas' own writer stores non-default indexes in the file
+    fs.put_object(
+        f's3://{mock_s3_bucket}/read_dir_index/part1.parquet',
+        pd.DataFrame({'id': [1, 2, 3]}, index=[10, 11, 12]).to_parquet(),
+    )
+    fs.put_object(
+        f's3://{mock_s3_bucket}/read_dir_index/part2.parquet',
+        pd.DataFrame({'id': [4, 5]}, index=[1, 2]).to_parquet(),
+    )
+
+    result = fs.read_df_from_parquet(f's3://{mock_s3_bucket}/read_dir_index')
+
+    assert result.index.tolist() == [0, 1, 2, 3, 4]
+    assert result['id'].tolist() == [1, 2, 3, 4, 5]
+    assert list(result.columns) == ['id']
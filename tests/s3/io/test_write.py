@@ -1,11 +1,15 @@
 """Tests for S3FileSystem write_df_to_parquet method."""
 
 import io
+import os
 
 import boto3
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 
+import eftoolkit.s3.filesystem as filesystem
 from eftoolkit.s3 import S3FileSystem
 
 
@@ -75,3 +79,111 @@ def test_write_df_to_parquet_requires_parquet_extension(mock_s3_bucket):
         fs.write_df_to_parquet(df, f's3://{mock_s3_bucket}/write/data')
 
     assert '.parquet' in str(exc_info.value)
+
+
+@pytest.mark.parametrize(
+    ('compression', 'expected'), [('zstd', 'ZSTD'), ('snappy', 'SNAPPY')]
+)
+def test_write_df_to_parquet_compression(
+    mock_s3_bucket, sample_df, compression, expected
+):
+    """Parquet is written with ZSTD by default and honors compression=."""
+    fs = S3FileSystem(
+        access_key_id='testing',
+        secret_access_key='testing',
+        region='us-east-1',
+    )
+    uri = f's3://{mock_s3_bucket}/write_codec/{compression}.parquet'
+
+    if compression == 'zstd':
+        fs.write_df_to_parquet(sample_df, uri)
+    else:
+        fs.write_df_to_parquet(sample_df, uri, compression=compression)
+
+    metadata = pq.read_metadata(io.BytesIO(fs.get_object(uri)))
+    assert metadata.row_group(0).column(0).compression == expected
+
+
+def test_write_df_to_parquet_uses_multipart_above_threshold(
+    mock_s3_bucket, monkeypatch
+):
+    """Files above the multipart threshold are uploaded in concurrent parts."""
+    monkeypatch.setattr(filesystem, 'MULTIPART_THRESHOLD', 5 * 1024 * 1024)
+    monkeypatch.setattr(filesystem, 'MULTIPART_CHUNKSIZE', 5 * 1024 * 1024)
+    fs = S3FileSystem(
+        access_key_id='testing',
+        secret_access_key='testing',
+        region='us-east-1',
+    )
+    df = pd.DataFrame({'blob': [os.urandom(1024).hex() for _ in range(6000)]})
+    uri = f's3://{mock_s3_bucket}/write_multipart/big.parquet'
+
+    fs.write_df_to_parquet(df, uri, compression='none')
+
+    conn = boto3.client('s3', region_name='us-east-1')
+    head = conn.head_object(Bucket=mock_s3_bucket, Key='write_multipart/big.parquet')
+    # Multipart ETags carry a '-<part count>' suffix
+    assert head['ETag'].strip('"').endswith('-3')
+    pd.testing.assert_frame_equal(fs.read_df_from_parquet(uri), df)
+
+
+def test_write_arrow_to_parquet_round_trip(mock_s3_bucket, sample_df):
+    """An Arrow table is written without going through pandas."""
+    fs = S3FileSystem(
+        access_key_id='testing',
+        secret_access_key='testing',
+        region='us-east-1',
+    )
+    table = pa.Table.from_pandas(sample_df, preserve_index=False)
+    uri = f's3://{mock_s3_bucket}/write_arrow/data.parquet'
+
+    fs.write_arrow_to_parquet(table, uri)
+
+    pd.testing.assert_frame_equal(fs.read_df_from_parquet(uri), sample_df)
+    with pytest.raises(ValueError, match='.parquet'):
+        fs.write_arrow_to_parquet(table, f's3://{mock_s3_bucket}/write_arrow/data')
+
+
+def test_write_batches_to_parquet(mock_s3_bucket, sample_df):
+    """RecordBatches are written incrementally as one parquet file."""
+    fs = S3FileSystem(
+        access_key_id='testing',
+        secret_access_key='testing',
+        region='us-east-1',
+    )
+    table = pa.Table.from_pandas(sample_df, preserve_index=False)
+    reader = pa.RecordBatchReader.from_batches(
+        table.schema, table.to_batches(max_chunksize=1)
+    )
+    uri = f's3://{mock_s3_bucket}/write_batches/data.parquet'
+
+    rows = fs.write_batches_to_parquet(reader, uri)
+
+    assert rows == 3
+    assert pq.read_metadata(io.BytesIO(fs.get_object(uri))).num_row_groups == 3
+    pd.testing.assert_frame_equal(fs.read_df_from_parquet(uri), sample_df)
+
+
+def test_write_batches_to_parquet_empty_reader(mock_s3_bucket):
+    """An empty reader still writes a file with the reader's schema."""
+    fs = S3FileSystem(
+        access_key_id='testing',
+        secret_access_key='testing',
+        region='us-east-1',
+    )
+    schema = pa.schema([('id', pa.int64())])
+    uri = f's3://{mock_s3_bucket}/write_batches/empty.parquet'
+
+    rows = fs.write_batches_to_parquet(
+        pa.RecordBatchReader.from_batches(schema, []), uri
+    )
+
+    assert rows == 0
+    result = fs.read_df_from_parquet(uri)
+    assert list(result.columns) == ['id']
+    assert len(result) == 0
+    with pytest.raises(ValueError, match='.parquet'):
+        fs.write_batches_to_parquet(
+            pa.RecordBatchReader.from_batches(schema, []),
+            f's3://{mock_s3_bucket}/write_batches/empty',
+        )
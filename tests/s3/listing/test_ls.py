@@ -1,9 +1,68 @@
 """Tests for S3FileSystem ls method."""
 
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
 from eftoolkit.s3 import S3FileSystem, S3Object
+from tests._helpers import empty_bucket
+
+LS_BUCKET = 'ls-test-bucket'
+
+# Concurrent uploads used to seed LS_BUCKET
+SEED_WORKERS = 8
+
+# Every key the ls tests list, each test under its own top-level prefix
+LS_KEYS = [
+    'ls_iter/data.parquet',
+    'ls_meta/data.parquet',
+    'ls_str/data.parquet',
+    'ls_all/a/data1.parquet',
+    'ls_all/b/data2.parquet',
+    'ls_prefix/prefix1/data.parquet',
+    'ls_prefix/prefix2/data.parquet',
+    'ls_nonrec/a/nested.parquet',
+    'ls_nonrec/b/deep/file.parquet',
+    'ls_nonrec/root.parquet',
+    'ls_subdir/level1/file1.parquet',
+    'ls_subdir/level1/level2/file2.parquet',
+    'ls_items/data.parquet',
+    'ls_dict_conv/data.parquet',
+    'ls_prefixes/subdir1/file1.parquet',
+    'ls_prefixes/subdir2/file2.parquet',
+    'ls_prefixes/root.parquet',
+    'ls_no_prefixes/subdir/file.parquet',
+    'ls_no_prefixes/root.parquet',
+]
+
+
+@pytest.fixture(scope='module')
+def seeded_bucket(_mock_aws_session, _sample_df_template):
+    """Write the key layout for the whole module once, then yield its bucket.
+
+    The sample frame is serialized to parquet a single time and the same
+    bytes are uploaded concurrently under every key through the raw moto
+    client, since the tests only list objects.
+    """
+    conn = _mock_aws_session
+    conn.create_bucket(Bucket=LS_BUCKET)
+    body = _sample_df_template.to_parquet(index=False)
+    with ThreadPoolExecutor(max_workers=SEED_WORKERS) as executor:
+        list(
+            executor.map(
+                lambda key: conn.put_object(Bucket=LS_BUCKET, Key=key, Body=body),
+                LS_KEYS,
+            )
+        )
+
+    yield LS_BUCKET
 
+    empty_bucket(_mock_aws_session, LS_BUCKET)
+    _mock_aws_session.delete_bucket(Bucket=LS_BUCKET)
 
-def test_ls_returns_iterator_of_s3_objects(mock_s3_bucket, sample_df):
+
+def test_ls_returns_iterator_of_s3_objects(seeded_bucket):
     """ls returns an iterator of S3Object instances."""
     fs = S3FileSystem(
         access_key_id='testing',
@@ -11,23 +70,20 @@ def test_ls_returns_iterator_of_s3_objects(mock_s3_bucket, sample_df):
         region='us-east-1',
     )
 
-    fs.write_df_to_parquet(sample_df, f's3://{mock_s3_bucket}/ls_iter/data.parquet')
-
-    result = fs.ls(f's3://{mock_s3_bucket}')
+    result = fs.ls(f's3://{seeded_bucket}/ls_iter')
 
     # Should be an iterator, not a list
-    assert hasattr(result, '__iter__')
-    assert hasattr(result, '__next__')
+    assert isinstance(result, Iterator)
 
-    # Should yield S3Object instances
-    objects = list(result)
+    # Should yield S3Object instances, one at a time
+    first = next(result)
 
-    assert len(objects) == 1
-    assert isinstance(objects[0], S3Object)
-    assert objects[0].key == 'ls_iter/data.parquet'
+    assert isinstance(first, S3Object)
+    assert first.key == 'ls_iter/data.parquet'
+    assert next(result, None) is None
 
 
-def test_ls_s3_object_has_metadata(mock_s3_bucket, sample_df):
+def test_ls_s3_object_has_metadata(seeded_bucket):
     """S3Object includes metadata like size and last_modified."""
     fs = S3FileSystem(
         access_key_id='testing',
@@ -35,15 +91,12 @@ def test_ls_s3_object_has_metadata(mock_s3_bucket, sample_df):
         region='us-east-1',
     )
 
-    fs.write_df_to_parquet(sample_df, f's3://{mock_s3_bucket}/ls_meta/data.parquet')
-
-    objects = list(fs.ls(f's3://{mock_s3_bucket}'))
-    obj = objects[0]
+    obj = next(fs.ls(f's3://{seeded_bucket}/ls_meta'))
 
     # Core attributes
     assert obj.key == 'ls_meta/data.parquet'
-    assert obj.bucket == mock_s3_bucket
-    assert obj.uri == f's3://{mock_s3_bucket}/ls_meta/data.parquet'
+    assert obj.bucket == seeded_bucket
+    assert obj.uri == f's3://{seeded_bucket}/ls_meta/data.parquet'
 
     # Metadata object
     assert obj.metadata is not None
@@ -54,7 +107,7 @@ def test_ls_s3_object_has_metadata(mock_s3_bucket, sample_df):
     assert obj.metadata.is_prefix is False
 
 
-def test_ls_s3_object_str_returns_uri(mock_s3_bucket, sample_df):
+def test_ls_s3_object_str_returns_uri(seeded_bucket):
     """S3Object __str__ returns the full S3 URI."""
     fs = S3FileSystem(
         access_key_id='testing',
@@ -62,15 +115,13 @@ def test_ls_s3_object_str_returns_uri(mock_s3_bucket, sample_df):
         region='us-east-1',
     )
 
-    fs.write_df_to_parquet(sample_df, f's3://{mock_s3_bucket}/ls_str/data.parquet')
-
-    obj = next(fs.ls(f's3://{mock_s3_bucket}'))
+    obj = next(fs.ls(f's3://{seeded_bucket}/ls_str'))
 
-    assert str(obj) == f's3://{mock_s3_bucket}/ls_str/data.parquet'
-    assert obj.uri == f's3://{mock_s3_bucket}/ls_str/data.parquet'
+    assert str(obj) == f's3://{seeded_bucket}/ls_str/data.parquet'
+    assert obj.uri == f's3://{seeded_bucket}/ls_str/data.parquet'
 
 
-def test_ls_recursive_returns_all_keys(mock_s3_bucket, sample_df):
+def test_ls_recursive_returns_all_keys(seeded_bucket):
     """ls with recursive=True returns all keys in bucket."""
     fs = S3FileSystem(
         access_key_id='testing',
@@ -78,16 +129,13 @@ def test_ls_recursive_returns_all_keys(mock_s3_bucket, sample_df):
         region='us-east-1',
     )
 
-    fs.write_df_to_parquet(sample_df, f's3://{mock_s3_bucket}/ls_all/a/data1.parquet')
-    fs.write_df_to_parquet(sample_df, f's3://{mock_s3_bucket}/ls_all/b/data2.parquet')
-
-    keys = [obj.key for obj in fs.ls(f's3://{mock_s3_bucket}')]
+    keys = [obj.key for obj in fs.ls(f's3://{seeded_bucket}')]
 
     assert 'ls_all/a/data1.parquet' in keys
     assert 'ls_all/b/data2.parquet' in keys
 
 
-def test_ls_with_prefix(mock_s3_bucket, sample_df):
+def test_ls_with_prefix(seeded_bucket):
     """ls filters by prefix."""
     fs = S3FileSystem(
         access_key_id='testing',
@@ -95,88 +143,82 @@ def test_ls_with_prefix(mock_s3_bucket, sample_df):
         region='us-east-1',
     )
 
-    fs.write_df_to_parquet(
-        sample_df, f's3://{mock_s3_bucket}/ls_prefix/prefix1/data.parquet'
-    )
-    fs.write_df_to_parquet(
-        sample_df, f's3://{mock_s3_bucket}/ls_prefix/prefix2/data.parquet'
-    )
-
-    objects = list(fs.ls(f's3://{mock_s3_bucket}/ls_prefix/prefix1'))
+    objects = fs.ls(f's3://{seeded_bucket}/ls_prefix/prefix1')
+    first = next(objects)
 
-    assert len(objects) == 1
-    assert objects[0].key == 'ls_prefix/prefix1/data.parquet'
+    assert first.key == 'ls_prefix/prefix1/data.parquet'
+    assert next(objects, None) is None
 
 
-def test_ls_empty_bucket(mock_s3_bucket):
-    """ls returns empty iterator for empty bucket."""
+def test_ls_empty_prefix(seeded_bucket):
+    """ls returns an empty iterator for a prefix with no keys."""
     fs = S3FileSystem(
         access_key_id='testing',
         secret_access_key='testing',
         region='us-east-1',
     )
 
-    objects = list(fs.ls(f's3://{mock_s3_bucket}'))
+    assert list(fs.ls(f's3://{seeded_bucket}/ls_empty_prefix')) == []
 
-    assert objects == []
 
+@pytest.fixture
+def two_key_pages(monkeypatch):
+    """Cap moto listings at two keys per page."""
+    monkeypatch.setenv('MOTO_S3_DEFAULT_MAX_KEYS', '2')
 
-def test_ls_non_recursive_returns_only_immediate_files(mock_s3_bucket, sample_df):
-    """ls with recursive=False returns only files at immediate level."""
+
+def test_ls_streams_across_pages(mock_s3_bucket, two_key_pages):
+    """ls yields the first page before requesting the next one."""
     fs = S3FileSystem(
-        access_key_id='testing',
+        access_key_id='ls-pages',
         secret_access_key='testing',
         region='us-east-1',
     )
-
-    # Create nested structure
-    fs.write_df_to_parquet(
-        sample_df, f's3://{mock_s3_bucket}/ls_nonrec/a/nested.parquet'
-    )
-    fs.write_df_to_parquet(
-        sample_df, f's3://{mock_s3_bucket}/ls_nonrec/b/deep/file.parquet'
+    keys = [f'ls_pages/part{i}.parquet' for i in range(5)]
+    for key in keys:
+        fs.put_object(f's3://{mock_s3_bucket}/{key}', b'data')
+
+    # Record ListObjectsV2 requests on this test's own client; its distinct
+    # access key keeps it out of any client shared with other instances
+    list_calls = []
+    fs._get_client().meta.events.register(
+        'before-call.s3.ListObjectsV2',
+        lambda **kwargs: list_calls.append(kwargs['params']),
     )
-    fs.write_df_to_parquet(sample_df, f's3://{mock_s3_bucket}/ls_nonrec/root.parquet')
 
-    # Non-recursive ls should only show files at the immediate level
-    objects = list(fs.ls(f's3://{mock_s3_bucket}/ls_nonrec', recursive=False))
-    keys = [obj.key for obj in objects]
+    objects = fs.ls(f's3://{mock_s3_bucket}/ls_pages')
+    first = next(objects)
+
+    assert first.key == keys[0]
+    assert len(list_calls) == 1
 
-    # Should contain only the root file
-    assert keys == ['ls_nonrec/root.parquet']
+    rest = [obj.key for obj in objects]
 
-    # Should NOT contain nested files or directories
-    assert 'ls_nonrec/a/' not in keys
-    assert 'ls_nonrec/b/' not in keys
-    assert 'ls_nonrec/a/nested.parquet' not in keys
-    assert 'ls_nonrec/b/deep/file.parquet' not in keys
+    assert [first.key, *rest] == keys
+    assert len(list_calls) == 3
 
 
-def test_ls_non_recursive_at_subdirectory(mock_s3_bucket, sample_df):
-    """ls with recursive=False at a subdirectory level."""
+@pytest.mark.parametrize(
+    ('root', 'expected'),
+    [
+        ('ls_nonrec', ['ls_nonrec/root.parquet']),
+        ('ls_subdir/level1', ['ls_subdir/level1/file1.parquet']),
+    ],
+)
+def test_ls_non_recursive_returns_only_immediate_files(seeded_bucket, root, expected):
+    """ls with recursive=False returns only files at the listed level."""
     fs = S3FileSystem(
         access_key_id='testing',
         secret_access_key='testing',
         region='us-east-1',
     )
 
-    fs.write_df_to_parquet(
-        sample_df, f's3://{mock_s3_bucket}/ls_subdir/level1/file1.parquet'
-    )
-    fs.write_df_to_parquet(
-        sample_df, f's3://{mock_s3_bucket}/ls_subdir/level1/level2/file2.parquet'
-    )
-
-    objects = list(fs.ls(f's3://{mock_s3_bucket}/ls_subdir/level1', recursive=False))
-    keys = [obj.key for obj in objects]
+    objects = fs.ls(f's3://{seeded_bucket}/{root}', recursive=False)
 
-    # Should contain only immediate files
-    assert keys == ['ls_subdir/level1/file1.parquet']
-    assert 'ls_subdir/level1/level2/' not in keys
-    assert 'ls_subdir/level1/level2/file2.parquet' not in keys
+    assert [obj.key for obj in objects] == expected
 
 
-def test_s3_object_metadata_items(mock_s3_bucket, sample_df):
+def test_s3_object_metadata_items(seeded_bucket):
     """S3ObjectMetadata.items() yields key-value pairs."""
     fs = S3FileSystem(
         access_key_id='testing',
@@ -184,9 +226,7 @@ def test_s3_object_metadata_items(mock_s3_bucket, sample_df):
         region='us-east-1',
     )
 
-    fs.write_df_to_parquet(sample_df, f's3://{mock_s3_bucket}/ls_items/data.parquet')
-
-    obj = next(fs.ls(f's3://{mock_s3_bucket}/ls_items'))
+    obj = next(fs.ls(f's3://{seeded_bucket}/ls_items'))
     result = dict(obj.metadata.items())
 
     assert isinstance(result, dict)
@@ -199,7 +239,7 @@ def test_s3_object_metadata_items(mock_s3_bucket, sample_df):
     assert result['size'] > 0
 
 
-def test_s3_object_metadata_dict_conversion(mock_s3_bucket, sample_df):
+def test_s3_object_metadata_dict_conversion(seeded_bucket):
     """dict(metadata) works via __iter__."""
     fs = S3FileSystem(
         access_key_id='testing',
@@ -207,18 +247,14 @@ def test_s3_object_metadata_dict_conversion(mock_s3_bucket, sample_df):
         region='us-east-1',
     )
 
-    fs.write_df_to_parquet(
-        sample_df, f's3://{mock_s3_bucket}/ls_dict_conv/data.parquet'
-    )
-
-    obj = next(fs.ls(f's3://{mock_s3_bucket}/ls_dict_conv'))
+    obj = next(fs.ls(f's3://{seeded_bucket}/ls_dict_conv'))
     result = dict(obj.metadata)
 
     assert isinstance(result, dict)
     assert result == dict(obj.metadata.items())
 
 
-def test_ls_include_prefixes_returns_directories(mock_s3_bucket, sample_df):
+def test_ls_include_prefixes_returns_directories(seeded_bucket):
     """ls with include_prefixes=True yields prefix entries."""
     fs = S3FileSystem(
         access_key_id='testing',
@@ -226,19 +262,10 @@ def test_ls_include_prefixes_returns_directories(mock_s3_bucket, sample_df):
         region='us-east-1',
     )
 
-    # Create nested structure
-    fs.write_df_to_parquet(
-        sample_df, f's3://{mock_s3_bucket}/ls_prefixes/subdir1/file1.parquet'
-    )
-    fs.write_df_to_parquet(
-        sample_df, f's3://{mock_s3_bucket}/ls_prefixes/subdir2/file2.parquet'
-    )
-    fs.write_df_to_parquet(sample_df, f's3://{mock_s3_bucket}/ls_prefixes/root.parquet')
-
     # With include_prefixes=True, should see both files and prefixes
     objects = list(
         fs.ls(
-            f's3://{mock_s3_bucket}/ls_prefixes', recursive=False, include_prefixes=True
+            f's3://{seeded_bucket}/ls_prefixes', recursive=False, include_prefixes=True
         )
     )
 
@@ -259,7 +286,7 @@ def test_ls_include_prefixes_returns_directories(mock_s3_bucket, sample_df):
         assert p.metadata.size is None  # Prefixes don't have size
 
 
-def test_ls_include_prefixes_default_false(mock_s3_bucket, sample_df):
+def test_ls_include_prefixes_default_false(seeded_bucket):
     """ls with include_prefixes=False (default) does not yield prefixes."""
     fs = S3FileSystem(
         access_key_id='testing',
@@ -267,15 +294,8 @@ def test_ls_include_prefixes_default_false(mock_s3_bucket, sample_df):
         region='us-east-1',
     )
 
-    fs.write_df_to_parquet(
-        sample_df, f's3://{mock_s3_bucket}/ls_no_prefixes/subdir/file.parquet'
-    )
-    fs.write_df_to_parquet(
-        sample_df, f's3://{mock_s3_bucket}/ls_no_prefixes/root.parquet'
-    )
-
     # Default behavior - no prefixes
-    objects = list(fs.ls(f's3://{mock_s3_bucket}/ls_no_prefixes', recursive=False))
+    objects = list(fs.ls(f's3://{seeded_bucket}/ls_no_prefixes', recursive=False))
     keys = [obj.key for obj in objects]
 
     assert keys == ['ls_no_prefixes/root.parquet']
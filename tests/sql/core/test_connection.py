@@ -1,12 +1,17 @@
 """Tests for DuckDB connection property, close method, and context manager."""
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
 import duckdb
+import pytest
 
 from eftoolkit.sql import DuckDB
 
 
-def test_close_without_context_manager_is_noop():
-    """close() is a no-op when not using context manager."""
+def test_close_without_open_connection_is_noop():
+    """close() is a no-op when no connection has been opened yet."""
     db = DuckDB(database=':memory:')
     db.close()
 
@@ -16,25 +21,73 @@ def test_close_without_context_manager_is_noop():
     assert result['num'][0] == 1
 
 
+def test_connection_reused_across_calls_without_context_manager():
+    """Operations share one lazily-opened connection until close()."""
+    db = DuckDB(database=':memory:')
+
+    assert db._conn is None
+
+    db.execute('CREATE TABLE t (x INT)')
+    conn = db._conn
+    db.execute('INSERT INTO t VALUES (1), (2)')
+    result = db.query('SELECT SUM(x) as total FROM t')
+
+    assert db._conn is conn
+    assert result['total'][0] == 3
+
+
+def test_close_then_reopen_starts_new_connection():
+    """After close(), the next operation opens a fresh connection."""
+    db = DuckDB(database=':memory:')
+    db.execute('CREATE TABLE t (x INT)')
+    db.close()
+
+    assert db._conn is None
+    assert db.query('SELECT 1 as num')['num'][0] == 1
+    assert db._conn is not None
+
+
+def test_s3_setup_runs_once_per_connection():
+    """S3 setup runs when the connection opens, not on every operation."""
+    db = DuckDB(database=':memory:')
+
+    with patch.object(DuckDB, '_setup_s3') as mock_setup:
+        db.query('SELECT 1')
+        db.query('SELECT 2')
+        db.execute('SELECT 3')
+
+    mock_setup.assert_called_once()
+
+
 def test_connection_property_returns_connection():
     """connection property returns a DuckDB connection."""
     db = DuckDB(database=':memory:')
+
     conn = db.connection
 
     assert isinstance(conn, duckdb.DuckDBPyConnection)
 
 
+def test_connection_property_returns_shared_connection():
+    """connection property returns the connection used by operations."""
+    db = DuckDB(database=':memory:')
+    db.execute('CREATE TABLE t (x INT)')
+
+    assert db.connection is db._conn
+    assert db.connection.execute('SELECT COUNT(*) FROM t').fetchone() == (0,)
+
+
 def test_context_manager_opens_and_closes_connection():
     """Context manager opens connection on entry and closes on exit."""
     db = DuckDB(database=':memory:')
 
-    assert db._active_conn is None
+    assert db._conn is None
 
     with db:
-        assert db._active_conn is not None
-        assert isinstance(db._active_conn, duckdb.DuckDBPyConnection)
+        assert db._conn is not None
+        assert isinstance(db._conn, duckdb.DuckDBPyConnection)
 
-    assert db._active_conn is None
+    assert db._conn is None
 
 
 def test_context_manager_reuses_connection(tmp_path):
@@ -42,13 +95,13 @@ def test_context_manager_reuses_connection(tmp_path):
     db_path = str(tmp_path / 'test.db')
 
     with DuckDB(database=db_path) as db:
-        conn_id = id(db._active_conn)
+        conn_id = id(db._conn)
         db.execute('CREATE TABLE t (x INT)')
-        assert id(db._active_conn) == conn_id
+        assert id(db._conn) == conn_id
         db.execute('INSERT INTO t VALUES (1), (2), (3)')
-        assert id(db._active_conn) == conn_id
+        assert id(db._conn) == conn_id
         result = db.query('SELECT SUM(x) as total FROM t')
-        assert id(db._active_conn) == conn_id
+        assert id(db._conn) == conn_id
 
     assert result['total'][0] == 6
 
@@ -69,6 +122,103 @@ def test_close_within_context_manager():
     db = DuckDB(database=':memory:')
 
     with db:
-        assert db._active_conn is not None
+        assert db._conn is not None
         db.close()
-        assert db._active_conn is None
+        assert db._conn is None
+
+
+def test_other_threads_use_their_own_cursor():
+    """Worker threads query through per-thread cursors on the shared database."""
+    db = DuckDB(database=':memory:')
+    db.execute('CREATE TABLE t AS SELECT range AS x FROM range(100)')
+
+    def worker(_):
+        return db._cursor(), int(db.query('SELECT SUM(x) AS s FROM t')['s'][0])
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(worker, range(8)))
+
+    cursors = {id(cursor) for cursor, _ in results}
+    assert all(total == 4950 for _, total in results)
+    assert id(db._conn) not in cursors
+    assert db._cursor() is db._conn
+
+
+def test_thread_cursor_is_reused_within_thread():
+    """A thread gets the same cursor on every call."""
+    db = DuckDB(database=':memory:')
+    db.query('SELECT 1')
+
+    def worker():
+        return db._cursor() is db._cursor()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(worker).result()
+
+
+def test_close_closes_thread_cursors():
+    """close() closes cursors handed out to other threads."""
+    db = DuckDB(database=':memory:')
+    db.query('SELECT 1')
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        cursor = executor.submit(db._cursor).result()
+
+    db.close()
+
+    assert db._cursors == {}
+    with pytest.raises(duckdb.ConnectionException):
+        cursor.execute('SELECT 1')
+
+
+def test_cursors_of_exited_threads_are_closed():
+    """Cursors of finished threads are closed when another thread connects."""
+    db = DuckDB(database=':memory:')
+    db.query('SELECT 1')
+
+    finished = []
+    for _ in range(5):
+        thread = threading.Thread(target=lambda: finished.append(db._cursor()))
+        thread.start()
+        thread.join()
+
+    assert len(db._cursors) == 1
+    for cursor in finished[:-1]:
+        with pytest.raises(duckdb.ConnectionException):
+            cursor.execute('SELECT 1')
+    assert finished[-1].execute('SELECT 1').fetchone() == (1,)
+
+
+def test_query_many_returns_results_in_order():
+    """query_many runs queries concurrently and keeps their order."""
+    db = DuckDB(database=':memory:')
+    db.execute('CREATE TABLE t AS SELECT range AS x FROM range(10)')
+
+    results = db.query_many(
+        [f'SELECT COUNT(*) AS n FROM t WHERE x < {i}' for i in range(5)]
+    )
+
+    assert [int(df['n'][0]) for df in results] == [0, 1, 2, 3, 4]
+    assert db._cursors == {}
+    assert db.query_many([]) == []
+
+
+def test_query_many_caps_default_workers_at_cpu_count():
+    """Without max_workers, query_many starts at most one thread per CPU."""
+    db = DuckDB(database=':memory:')
+    pool_sizes = []
+
+    def recording_pool(max_workers):
+        pool_sizes.append(max_workers)
+        return ThreadPoolExecutor(max_workers=max_workers)
+
+    with (
+        patch('eftoolkit.sql.duckdb.os.cpu_count', return_value=2),
+        patch('eftoolkit.sql.duckdb.ThreadPoolExecutor', recording_pool),
+    ):
+        results = db.query_many([f'SELECT {i} AS n' for i in range(10)])
+        db.query_many(['SELECT 1'])
+        db.query_many(['SELECT 1', 'SELECT 2'], max_workers=5)
+
+    assert [int(df['n'][0]) for df in results] == list(range(10))
+    assert pool_sizes == [2, 1, 5]
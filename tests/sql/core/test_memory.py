@@ -1,5 +1,9 @@
 """Tests for DuckDB with in-memory database."""
 
+import datetime
+
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 
 from eftoolkit.sql import DuckDB
@@ -15,13 +19,137 @@ def test_query():
     assert result['num'][0] == 1
 
 
+def test_query_insert_returning():
+    """query returns the rows written by INSERT ... RETURNING in one call."""
+    db = DuckDB(database=':memory:')
+
+    db.execute('CREATE TABLE users (id INTEGER, name VARCHAR)')
+
+    result = db.query("INSERT INTO users VALUES (4, 'Diana') RETURNING *")
+
+    assert result.to_dict('records') == [{'id': 4, 'name': 'Diana'}]
+    assert db.scalar('SELECT count(*) FROM users') == 1
+
+
+def test_scalar():
+    """scalar returns a native Python value from the first row."""
+    db = DuckDB(database=':memory:')
+
+    assert db.scalar('SELECT 42') == 42
+    assert db.scalar("SELECT TIMESTAMP '2024-01-02 03:04:05'") == datetime.datetime(
+        2024, 1, 2, 3, 4, 5
+    )
+    assert db.scalar('SELECT ? + 1', [1]) == 2
+    assert db.scalar('SELECT 1 WHERE false') is None
+
+
+def test_query_arrow():
+    """query_arrow returns a pyarrow Table."""
+    db = DuckDB(database=':memory:')
+
+    result = db.query_arrow('SELECT 1 as num')
+
+    assert isinstance(result, pa.Table)
+    assert result.column('num').to_pylist() == [1]
+
+
+def test_query_chunks():
+    """query_chunks yields record batches of at most batch_size rows."""
+    db = DuckDB(database=':memory:')
+
+    batches = list(db.query_chunks('SELECT * FROM range(10) t(n)', batch_size=4))
+
+    assert sum(batch.num_rows for batch in batches) == 10
+    assert all(batch.num_rows <= 4 for batch in batches)
+    assert [n for batch in batches for n in batch.column('n').to_pylist()] == list(
+        range(10)
+    )
+
+
+def test_copy_to_parquet(tmp_path):
+    """copy_to_parquet writes query results with COPY and returns the row count."""
+    db = DuckDB(database=':memory:')
+
+    path = str(tmp_path / 'out.parquet')
+
+    rows = db.copy_to_parquet('SELECT range AS n FROM range(5)', path)
+
+    metadata = pq.read_metadata(path)
+    assert rows == 5
+    assert metadata.num_rows == 5
+    assert metadata.row_group(0).column(0).compression == 'ZSTD'
+
+
+def test_copy_to_parquet_partition_by(tmp_path):
+    """partition_by writes one Hive-style directory per partition value."""
+    db = DuckDB(database=':memory:')
+
+    out = tmp_path / 'events'
+
+    rows = db.copy_to_parquet(
+        'SELECT range AS id, range % 2 AS year FROM range(6)',
+        str(out),
+        partition_by=['year'],
+    )
+
+    assert rows == 6
+    assert sorted(p.name for p in out.iterdir()) == ['year=0', 'year=1']
+    assert (
+        db.scalar(
+            f"SELECT count(*) FROM read_parquet('{out}/*/*.parquet', "
+            'hive_partitioning=true) WHERE year = 1'
+        )
+        == 3
+    )
+
+
+def test_copy_to_parquet_partition_by_overwrites_same_partitions(tmp_path):
+    """Rewriting a partition replaces its file; other partitions are kept."""
+    db = DuckDB(database=':memory:')
+
+    out = tmp_path / 'overwrite_events'
+    sql = 'SELECT {id} AS id, {year} AS year'
+
+    db.copy_to_parquet(sql.format(id=1, year=0), str(out), partition_by=['year'])
+    db.copy_to_parquet(sql.format(id=2, year=1), str(out), partition_by=['year'])
+    db.copy_to_parquet(sql.format(id=3, year=0), str(out), partition_by=['year'])
+
+    rows = db.connection.execute(
+        f"SELECT id, year FROM read_parquet('{out}/*/*.parquet', "
+        'hive_partitioning=true) ORDER BY id'
+    ).fetchall()
+
+    assert rows == [(2, 1), (3, 0)]
+
+
+@pytest.mark.parametrize('compression', ['zstd; DROP TABLE t', 'none', 'xz'])
+def test_copy_to_parquet_rejects_unknown_compression(tmp_path, compression):
+    """compression must be one of the codecs DuckDB supports."""
+    db = DuckDB(database=':memory:')
+
+    with pytest.raises(ValueError, match='Unsupported parquet compression'):
+        db.copy_to_parquet(
+            'SELECT 1', str(tmp_path / 'bad.parquet'), compression=compression
+        )
+
+
+def test_copy_to_parquet_s3_requires_credentials():
+    """copy_to_parquet refuses S3 targets without configured credentials."""
+    db = DuckDB(database=':memory:')
+
+    with pytest.raises(ValueError, match='S3 not configured'):
+        db.copy_to_parquet('SELECT 1', 's3://bucket/out.parquet')
+
+
 def test_context_manager():
     """Test context manager support."""
     db = DuckDB(database=':memory:')
 
     with db as db_ctx:
         result = db_ctx.query('SELECT 42 as answer')
+
         assert result['answer'][0] == 42
+        assert db_ctx.connection.execute('SELECT 42').fetchone() == (42,)
 
 
 def test_s3_not_configured(sample_df):
@@ -33,3 +161,6 @@ def test_s3_not_configured(sample_df):
 
     with pytest.raises(ValueError, match='S3 not configured'):
         db.write_df_to_s3_parquet(sample_df, 's3://bucket/key.parquet')
+
+    with pytest.raises(ValueError, match='S3 not configured'):
+        db.write_query_to_s3_parquet('SELECT 1', 's3://bucket/key.parquet')
@@ -1,54 +1,52 @@
 """Tests for DuckDB with persistent database file."""
 
-import os
-
 import pandas as pd
 
 from eftoolkit.sql import DuckDB
 
+# Read-only input for the inf/NaN cleaning check; create_table_from_df does
+# not modify the frame, so it is built once for the module
+_NULL_DF = pd.DataFrame({'a': [1, None, float('inf'), float('nan')]})
 
-def test_full_workflow(sample_df):
-    """Test a complete workflow with multiple operations."""
-    db_path = 'test_persistent_workflow.db'
 
-    try:
-        db = DuckDB(database=db_path)
-        db.create_table_from_df('test_table', sample_df)
+def test_full_workflow(tmp_path, sample_df):
+    """Test a complete workflow with multiple operations."""
+    db = DuckDB(database=str(tmp_path / 'workflow.db'))
+    db.create_table_from_df('workflow_table', sample_df)
 
-        result = db.query('SELECT * FROM test_table')
-        pd.testing.assert_frame_equal(result, sample_df)
+    result = db.query('SELECT * FROM workflow_table')
+    assert list(result.columns) == list(sample_df.columns)
+    assert result.equals(sample_df)
 
-        db.create_table('test_table2', 'SELECT * FROM test_table WHERE id > 1')
-        result2 = db.get_table('test_table2')
+    db.create_table('workflow_table2', 'SELECT * FROM workflow_table WHERE id > 1')
+    result2 = db.get_table('workflow_table2')
 
-        assert len(result2) == 2
+    assert len(result2) == 2
 
-        df_with_nulls = pd.DataFrame(
-            {
-                'a': [1, None, float('inf'), float('nan')],
-            }
-        )
-        db.create_table_from_df('null_table', df_with_nulls)
-        result3 = db.get_table('null_table')
+    db.create_table_from_df('null_table', _NULL_DF)
+    result3 = db.get_table('null_table')
 
-        assert result3['a'].isna().sum() == 3
-    finally:
-        if os.path.exists(db_path):
-            os.remove(db_path)
+    assert result3['a'].isna().sum() == 3
 
 
-def test_get_table_with_where(sample_df):
+def test_get_table_with_where(tmp_path, sample_df):
     """Test get_table with where clause."""
-    db_path = 'test_persistent_where.db'
+    db = DuckDB(database=str(tmp_path / 'where.db'))
+    db.create_table_from_df('where_table', sample_df)
+
+    result = db.get_table('where_table', where='id > 1')
+
+    assert len(result) == 2
+    assert list(result['id']) == [2, 3]
+
 
-    try:
-        db = DuckDB(database=db_path)
-        db.create_table_from_df('test_table', sample_df)
+def test_data_persists_after_reopen(tmp_path, sample_df):
+    """Tables written to the file are visible from a new connection."""
+    db_path = str(tmp_path / 'reopen.db')
+    db = DuckDB(database=db_path)
+    db.create_table_from_df('reopen_table', sample_df)
+    db.close()
 
-        result = db.get_table('test_table', where='id > 1')
+    result = DuckDB(database=db_path).get_table('reopen_table')
 
-        assert len(result) == 2
-        assert list(result['id']) == [2, 3]
-    finally:
-        if os.path.exists(db_path):
-            os.remove(db_path)
+    pd.testing.assert_frame_equal(result, sample_df)
@@ -1,7 +1,5 @@
 """Tests for DuckDB _clean_df method."""
 
-import os
-
 import pandas as pd
 
 from eftoolkit.sql import DuckDB
@@ -64,22 +62,60 @@ def test_clean_df_handles_multiple_special_values():
     assert result['val'].iloc[3] == 1.0
 
 
+def test_clean_df_leaves_other_columns_unchanged():
+    """_clean_df keeps finite float, integer and string columns as they are."""
+    db = DuckDB(database=':memory:')
+
+    df = pd.DataFrame(
+        {
+            'bad': [float('inf'), 1.0],
+            'good': [1.5, 2.5],
+            'ints': [1, 2],
+            'names': ['a', 'b'],
+        }
+    )
+
+    result = db._clean_df(df)
+
+    assert result['bad'].tolist() == [None, 1.0]
+    assert result['good'].dtype == 'float64'
+    assert result['ints'].dtype == 'int64'
+    assert result['names'].tolist() == ['a', 'b']
+
+
+def test_clean_df_replaces_special_values_in_object_columns():
+    """_clean_df also cleans mixed-type object columns."""
+    db = DuckDB(database=':memory:')
+
+    df = pd.DataFrame({'mixed': pd.Series([1, float('-inf'), 'x'], dtype=object)})
+
+    result = db._clean_df(df)
+
+    assert result['mixed'].tolist() == [1, None, 'x']
+
+
+def test_clean_df_does_not_modify_input():
+    """_clean_df returns a new DataFrame and leaves the input untouched."""
+    db = DuckDB(database=':memory:')
+
+    df = pd.DataFrame({'val': [1.0, float('nan')]})
+
+    db._clean_df(df)
+
+    assert df['val'].dtype == 'float64'
+    assert pd.isna(df['val'].iloc[1])
+
+
 def test_get_table_applies_clean_df():
     """get_table applies _clean_df to results."""
-    db_path = 'test_clean_df_get_table.db'
-
-    try:
-        db = DuckDB(database=db_path)
+    db = DuckDB(database=':memory:')
 
-        df = pd.DataFrame({'val': [1.0, float('inf'), float('nan')]})
-        db.create_table_from_df('special_vals', df)
+    df = pd.DataFrame({'val': [1.0, float('inf'), float('nan')]})
+    db.create_table_from_df('special_vals', df)
 
-        result = db.get_table('special_vals')
+    result = db.get_table('special_vals')
 
-        # All special values should be None
-        assert result['val'].iloc[0] == 1.0
-        assert pd.isna(result['val'].iloc[1])
-        assert pd.isna(result['val'].iloc[2])
-    finally:
-        if os.path.exists(db_path):
-            os.remove(db_path)
+    # All special values should be None
+    assert result['val'].iloc[0] == 1.0
+    assert pd.isna(result['val'].iloc[1])
+    assert pd.isna(result['val'].iloc[2])
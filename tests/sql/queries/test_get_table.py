@@ -1,7 +1,5 @@
 """Tests for DuckDB get_table method covering example_usage patterns."""
 
-import os
-
 import pandas as pd
 
 from eftoolkit.sql import DuckDB
@@ -9,58 +7,101 @@ from eftoolkit.sql import DuckDB
 
 def test_get_table_without_where_matches_table_to_df(sample_df):
     """get_table() without WHERE matches boxoffice_drafting table_to_df pattern."""
-    db_path = 'test_get_table_no_where.db'
-
-    try:
-        # Pattern from example_usage/boxoffice_drafting/query.py:table_to_df
-        db = DuckDB(database=db_path)
-        db.create_table_from_df('test_table', sample_df)
+    # Pattern from example_usage/boxoffice_drafting/query.py:table_to_df
+    db = DuckDB(database=':memory:')
+    db.create_table_from_df('test_table', sample_df)
 
-        result = db.get_table('test_table')
+    result = db.get_table('test_table')
 
-        pd.testing.assert_frame_equal(result, sample_df)
-    finally:
-        if os.path.exists(db_path):
-            os.remove(db_path)
+    pd.testing.assert_frame_equal(result, sample_df)
 
 
 def test_get_table_with_where_matches_filtered_query(sample_df):
     """get_table() with WHERE matches filtered query patterns."""
-    db_path = 'test_get_table_with_where.db'
+    # Pattern: SELECT * FROM table WHERE condition
+    db = DuckDB(database=':memory:')
+    db.create_table_from_df('test_table', sample_df)
 
-    try:
-        # Pattern: SELECT * FROM table WHERE condition
-        db = DuckDB(database=db_path)
-        db.create_table_from_df('test_table', sample_df)
+    result = db.get_table('test_table', where='id > 1')
 
-        result = db.get_table('test_table', where='id > 1')
-
-        assert len(result) == 2
-        assert list(result['id']) == [2, 3]
-    finally:
-        if os.path.exists(db_path):
-            os.remove(db_path)
+    assert len(result) == 2
+    assert list(result['id']) == [2, 3]
 
 
 def test_get_table_cleans_special_values():
     """get_table cleans inf/nan like example_usage patterns."""
-    db_path = 'test_get_table_special.db'
-
-    try:
-        # Pattern from example_usage/boxoffice_drafting/query.py:
-        # df = df.replace([float('inf'), float('-inf'), float('nan')], None)
-        db = DuckDB(database=db_path)
-        df = pd.DataFrame(
-            {
-                'id': [1, 2, 3],
-                'val': [float('inf'), float('-inf'), float('nan')],
-            }
-        )
-        db.create_table_from_df('special_table', df)
-
-        result = db.get_table('special_table')
-
-        assert result['val'].isna().all()
-    finally:
-        if os.path.exists(db_path):
-            os.remove(db_path)
+    # Pattern from example_usage/boxoffice_drafting/query.py:
+    # df = df.replace([float('inf'), float('-inf'), float('nan')], None)
+    db = DuckDB(database=':memory:')
+    df = pd.DataFrame(
+        {
+            'id': [1, 2, 3],
+            'val': [float('inf'), float('-inf'), float('nan')],
+        }
+    )
+    db.create_table_from_df('special_table', df)
+
+    result = db.get_table('special_table')
+
+    assert result['val'].isna().all()
+
+
+def test_get_table_with_column_list(sample_df):
+    """get_table(columns=[...]) selects only the listed columns, in order."""
+    db = DuckDB(database=':memory:')
+    db.create_table_from_df('test_table', sample_df)
+
+    result = db.get_table('test_table', columns=['name', 'id'])
+
+    assert list(result.columns) == ['name', 'id']
+    assert list(result['id']) == [1, 2, 3]
+
+
+def test_get_table_with_column_aliases(sample_df):
+    """get_table(columns={...}) renames stored columns in the SQL projection."""
+    # Pattern from example_usage/boxoffice_drafting/query.py:table_to_df,
+    # which renamed columns positionally after SELECT *
+    db = DuckDB(database=':memory:')
+    db.create_table_from_df('test_table', sample_df)
+
+    result = db.get_table(
+        'test_table', where='id > 1', columns={'id': 'ID', 'name': 'Player Name'}
+    )
+
+    assert list(result.columns) == ['ID', 'Player Name']
+    assert list(result['ID']) == [2, 3]
+
+
+def test_get_table_columns_are_quoted():
+    """Column names with spaces or quotes are quoted safely."""
+    db = DuckDB(database=':memory:')
+    db.execute('CREATE TABLE t ("odd ""name""" INT, other INT)')
+    db.execute('INSERT INTO t VALUES (1, 2)')
+
+    result = db.get_table('t', columns=['odd "name"'])
+
+    assert list(result.columns) == ['odd "name"']
+    assert result.iloc[0, 0] == 1
+
+
+def test_get_table_with_bound_params(sample_df):
+    """get_table binds params into the WHERE clause instead of interpolating."""
+    db = DuckDB(database=':memory:')
+    db.create_table_from_df('test_table', sample_df)
+
+    result = db.get_table('test_table', where='id > ?', params=[1])
+    named = db.get_table('test_table', where='name = $name', params={'name': "O'Neil"})
+
+    assert list(result['id']) == [2, 3]
+    assert named.empty
+
+
+def test_create_table_with_bound_params(sample_df):
+    """create_table binds params into the defining SELECT."""
+    db = DuckDB(database=':memory:')
+    db.create_table_from_df('test_table', sample_df)
+
+    db.create_table('filtered', 'SELECT * FROM test_table WHERE id >= ?', [2])
+
+    assert list(db.query('SELECT id FROM filtered ORDER BY id')['id']) == [2, 3]
+    assert db.query('SELECT ? AS x', [7])['x'][0] == 7
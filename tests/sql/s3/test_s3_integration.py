@@ -72,6 +72,28 @@ def test_s3_configured_via_s3_instance(mock_s3_bucket, sample_df):
     pd.testing.assert_frame_equal(result, sample_df)
 
 
+def test_write_query_to_s3_parquet_streams_batches(mock_s3_bucket):
+    """Query results are streamed to one parquet file in batches."""
+    fs = S3FileSystem(
+        access_key_id='testing',
+        secret_access_key='testing',
+        region='us-east-1',
+    )
+    db = DuckDB(s3=fs)
+    uri = f's3://{mock_s3_bucket}/duckdb_stream/range.parquet'
+
+    rows = db.write_query_to_s3_parquet(
+        'SELECT range AS id, range * 2 AS doubled FROM range(2500)',
+        uri,
+        batch_size=1000,
+    )
+
+    assert rows == 2500
+    result = fs.read_df_from_parquet(uri)
+    assert result['id'].tolist() == list(range(2500))
+    assert result['doubled'].tolist() == [i * 2 for i in range(2500)]
+
+
 def test_s3_property_returns_filesystem(mock_s3_bucket):
     """s3 property returns the S3FileSystem instance."""
     db = DuckDB(
@@ -1,7 +1,10 @@
 """Tests for DuckDB _setup_s3 method and credential configuration."""
 
+from unittest.mock import MagicMock
+
 import pandas as pd
 
+import eftoolkit.sql.duckdb as duckdb_module
 from eftoolkit.s3 import S3FileSystem
 from eftoolkit.sql import DuckDB
 
@@ -117,3 +120,87 @@ def test_setup_s3_with_endpoint_and_url_style(mock_s3_bucket):
     result = db.query('SELECT 1 as num')
 
     assert result['num'][0] == 1
+
+
+def _executed_sql(conn):
+    """Return the SQL strings passed to a mock connection's execute()."""
+    return [c[0][0].strip() for c in conn.execute.call_args_list]
+
+
+def test_setup_s3_loads_httpfs_cache_when_enabled(monkeypatch):
+    """_setup_s3 loads cache_httpfs after httpfs when enabled."""
+    monkeypatch.setattr(duckdb_module, '_installed_extensions', set())
+    db = DuckDB(
+        s3_access_key_id='testing',
+        s3_secret_access_key='testing',
+        s3_region='us-east-1',
+        enable_httpfs_cache=True,
+    )
+    conn = MagicMock()
+
+    db._setup_s3(conn)
+
+    executed = _executed_sql(conn)
+    assert executed[:5] == [
+        'INSTALL httpfs;',
+        'LOAD httpfs;',
+        'INSTALL cache_httpfs FROM community;',
+        'LOAD cache_httpfs;',
+        "SET cache_httpfs_type='in_mem';",
+    ]
+
+
+def test_setup_s3_skips_httpfs_cache_by_default():
+    """_setup_s3 does not touch cache_httpfs unless asked to."""
+    db = DuckDB(
+        s3_access_key_id='testing',
+        s3_secret_access_key='testing',
+        s3_region='us-east-1',
+    )
+    conn = MagicMock()
+
+    db._setup_s3(conn)
+
+    assert not any('cache_httpfs' in sql for sql in _executed_sql(conn))
+
+
+def test_setup_s3_installs_extensions_once_per_process(monkeypatch):
+    """INSTALL runs for the first connection only; LOAD runs for every one."""
+    monkeypatch.setattr(duckdb_module, '_installed_extensions', set())
+    db = DuckDB(
+        s3_access_key_id='testing',
+        s3_secret_access_key='testing',
+        s3_region='us-east-1',
+    )
+    first, second = MagicMock(), MagicMock()
+
+    db._setup_s3(first)
+    db._setup_s3(second)
+
+    assert 'INSTALL httpfs;' in _executed_sql(first)
+    assert 'INSTALL httpfs;' not in _executed_sql(second)
+    assert 'LOAD httpfs;' in _executed_sql(second)
+
+
+def test_s3_secret_sql_escapes_values():
+    """Credential values are embedded as escaped SQL literals."""
+    db = DuckDB(
+        s3_access_key_id="key'id",
+        s3_secret_access_key='secret',
+        s3_region='us-east-1',
+        s3_endpoint='minio.local:9000',
+    )
+
+    sql = db._s3_secret_sql()
+
+    assert sql == (
+        "CREATE SECRET IF NOT EXISTS (TYPE S3, KEY_ID 'key''id', "
+        "SECRET 'secret', REGION 'us-east-1', ENDPOINT 'minio.local:9000');"
+    )
+
+
+def test_s3_secret_sql_omits_unset_region():
+    """REGION is only set when a region was configured."""
+    db = DuckDB(s3_access_key_id='key', s3_secret_access_key='secret')
+
+    assert 'REGION' not in db._s3_secret_sql()